@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+"""
+オポチュニティの最終活動日バックフィルスクリプト
+activity_log から opportunity.last_activity_date / last_activity_id を再計算する
+
+カラム追加直後の既存データへの反映や、非正規化カラムの整合性回復に使用する
+
+使い方:
+    python -m scripts.backfill_last_activity
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# プロジェクトルートディレクトリ
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from src.db.session import dispose_engine, session_scope  # noqa: E402
+from src.services.activity_service import backfill_last_activity  # noqa: E402
+
+
+async def run() -> int:
+    """バックフィルを実行し、更新したオポチュニティ数を返す"""
+    try:
+        async with session_scope() as session:
+            return await backfill_last_activity(session)
+    finally:
+        await dispose_engine()
+
+
+def main():
+    """メイン実行関数"""
+    updated = asyncio.run(run())
+    print(f"最終活動日を更新したオポチュニティ: {updated:,}件")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+活動種別マッチャーのベンチマークスクリプト
+合成したSlackメッセージのコーパスに対して、キーワードごとにテキストを走査する
+単純な方式と、Aho-Corasick法のマッチャー（1回の走査）の処理時間を比較する
+
+使い方:
+    python -m scripts.bench_activity_matcher --messages 100000 --extra-types 0 50 200
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Mapping, Sequence, Tuple
+
+# プロジェクトルートディレクトリ
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from src.agents.activity_matcher import (  # noqa: E402
+    DEFAULT_SYNONYMS,
+    ActivityTypeMatcher,
+    fold,
+)
+
+ACTIVITY_TYPES = [(1, "訪問"), (2, "電話"), (3, "メール"), (4, "オンライン会議")]
+
+CUSTOMERS = ["A社", "株式会社B", "C工業", "Dホールディングス", "E商事"]
+TEMPLATES = [
+    "今日は{customer}に{keyword}しました。次回は見積もりを提出予定です。",
+    "{customer}の担当者と{keyword}。導入時期は来月で調整中",
+    "先ほど{customer}へ{keyword}、先方の反応は良好でした",
+    "{customer}の件、{keyword}の後に社内で共有済みです。",
+    "来週の予定を確認します。{customer}の稟議はまだ回っていません",
+]
+
+
+def build_corpus(count: int, keywords: Sequence[str], seed: int = 42) -> List[str]:
+    """活動キーワードを含むメッセージと含まないメッセージを混ぜたコーパスを作成する"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        template = rng.choice(TEMPLATES)
+        keyword = rng.choice(keywords) if rng.random() < 0.8 else "連絡"
+        corpus.append(template.format(customer=rng.choice(CUSTOMERS), keyword=keyword))
+    return corpus
+
+
+def naive_matcher(
+    activity_types: Sequence[Tuple[int, str]], synonyms: Mapping[str, Sequence[str]]
+) -> Callable[[str], List[Tuple[int, int, int]]]:
+    """キーワードごとにテキスト全体を走査する比較用のマッチャーを作成する"""
+    keywords = {}
+    for activity_type_id, name in activity_types:
+        for synonym in synonyms.get(name, ()):
+            keywords.setdefault(fold(synonym), activity_type_id)
+    for activity_type_id, name in activity_types:
+        keywords[fold(name)] = activity_type_id
+
+    def find_all(text: str) -> List[Tuple[int, int, int]]:
+        folded = fold(text)
+        found = []
+        for keyword, activity_type_id in keywords.items():
+            start = folded.find(keyword)
+            while start != -1:
+                found.append((start, start + len(keyword), activity_type_id))
+                start = folded.find(keyword, start + 1)
+        found.sort(key=lambda match: (match[0], -match[1]))
+        return found
+
+    return find_all
+
+
+def measure(find_all: Callable[[str], list], corpus: List[str], repeat: int) -> float:
+    """コーパス全体の照合にかかった時間の中央値（秒）を返す"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in corpus:
+            find_all(text)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main():
+    """メイン実行関数"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--extra-types", type=int, nargs="+", default=[0, 50, 200])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    keywords = [name for _, name in ACTIVITY_TYPES] + [
+        synonym for synonyms in DEFAULT_SYNONYMS.values() for synonym in synonyms
+    ]
+    corpus = build_corpus(args.messages, keywords)
+    chars = sum(len(text) for text in corpus)
+    print(f"コーパス: {len(corpus):,}件, {chars:,}文字")
+
+    for extra in args.extra_types:
+        # マスタの種別数が増えた場合を想定し、コーパスに出現しない種別を追加する
+        activity_types = ACTIVITY_TYPES + [
+            (100 + i, f"種別{i:03d}活動") for i in range(extra)
+        ]
+
+        started = time.perf_counter()
+        matcher = ActivityTypeMatcher(activity_types)
+        build_ms = (time.perf_counter() - started) * 1000
+        naive = naive_matcher(activity_types, DEFAULT_SYNONYMS)
+
+        # 両方式の結果が一致することを確認してから計測する
+        for text in corpus[:1000]:
+            expected = naive(text)
+            found = [
+                (m.start, m.end, m.activity_type_id) for m in matcher.find_all(text)
+            ]
+            assert found == expected, text
+
+        naive_s = measure(naive, corpus, args.repeat)
+        matcher_s = measure(matcher.find_all, corpus, args.repeat)
+        print(f"\n## キーワード数 {matcher.keyword_count}（構築 {build_ms:.2f} ms）")
+        print(f"  naive       : {naive_s * 1000:9.1f} ms")
+        print(f"  aho-corasick: {matcher_s * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+"""
+Slackメッセージ取り込みパイプラインのベンチマークスクリプト
+合成したSlackメッセージイベントをSQLite上のパイプラインで再生し、
+メッセージあたりのレイテンシ（段階ごと・全体）とワーカーあたりの処理件数/秒を計測する。
+LLMでの補完は行わない（ルールベースの抽出のみ）
+
+使い方:
+    python -m scripts.bench_activity_pipeline --events 2000 --workers 1
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+# プロジェクトルートディレクトリ
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+# 設定の読み込みに必要な環境変数（ベンチマークでは外部サービスを使用しない）
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-bench")
+os.environ.setdefault("SLACK_SIGNING_SECRET", "bench")
+os.environ.setdefault("OPENAI_API_KEY", "sk-bench")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+from sqlmodel.ext.asyncio.session import AsyncSession  # noqa: E402
+
+from src.agents.activity_matcher import ActivityTypeMatcher  # noqa: E402
+from src.agents.customer_matcher import CustomerNameIndex  # noqa: E402
+from src.agents.date_parser import RelativeDateParser  # noqa: E402
+from src.models.entity import Customer, Opportunity, OpportunityUser, User  # noqa: E402
+from src.models.master import ActivityType, Stage  # noqa: E402
+from src.services.activity_pipeline import ActivityIngestionPipeline  # noqa: E402
+from src.slack.handlers import SlackEventHandler  # noqa: E402
+
+ACTIVITY_TYPES = ["訪問", "電話", "メール", "オンライン会議"]
+WORDS = ["さくら", "ミライ", "東西", "アルファ", "グリーン", "日本", "テクノ", "北斗"]
+TITLES = ["基幹システム刷新", "Web会議ツール導入", "保守契約更新", "データ分析基盤構築"]
+DATE_PHRASES = ["昨日", "今日", "一昨日", "先週金曜", "3日前", ""]
+# 営業活動の報告でないメッセージ・曖昧なメッセージも混ぜる
+NOISE = ["来週の会議資料を作成中です", "お疲れさまです。本日は直帰します"]
+
+
+async def seed(engine, users: int, customers: int, per_user: int) -> Dict[str, Any]:
+    """ベンチマーク用データを投入し、イベントの合成に使う情報を返す"""
+    rng = random.Random(42)
+    customer_rows = [
+        (uuid.uuid4(), f"株式会社{rng.choice(WORDS)}{i}") for i in range(customers)
+    ]
+    user_rows = [(uuid.uuid4(), f"U{i:05d}") for i in range(users)]
+    assignments: Dict[str, List[tuple]] = {}
+
+    async with AsyncSession(engine) as session:
+        session.add(Stage(id=1, name="提案", order_no=1))
+        for i, name in enumerate(ACTIVITY_TYPES, start=1):
+            session.add(ActivityType(id=i, name=name))
+        for customer_id, name in customer_rows:
+            session.add(Customer(id=customer_id, name=name, industry="IT"))
+        for user_id, slack_id in user_rows:
+            session.add(
+                User(
+                    id=user_id, name=slack_id, email=f"{slack_id}@x", slack_id=slack_id
+                )
+            )
+        await session.flush()
+        for user_id, slack_id in user_rows:
+            assignments[slack_id] = []
+            for title, (customer_id, customer) in zip(
+                rng.sample(TITLES, per_user), rng.sample(customer_rows, per_user)
+            ):
+                opportunity_id = uuid.uuid4()
+                session.add(
+                    Opportunity(
+                        id=opportunity_id,
+                        customer_id=customer_id,
+                        title=title,
+                        amount=1000,
+                        stage_id=1,
+                        expected_close_date=date.today() + timedelta(days=30),
+                    )
+                )
+                session.add(
+                    OpportunityUser(
+                        opportunity_id=opportunity_id, user_id=user_id, role="owner"
+                    )
+                )
+                assignments[slack_id].append((customer, title))
+        await session.commit()
+    return {"customers": customer_rows, "assignments": assignments}
+
+
+def build_events(data: Dict[str, Any], count: int, noise_rate: float) -> List[dict]:
+    """送信者の担当案件に言及する合成Slackメッセージイベントを作成する"""
+    rng = random.Random(7)
+    ts = datetime.now(timezone.utc).timestamp()
+    slack_ids = list(data["assignments"])
+    events = []
+    for i in range(count):
+        slack_id = rng.choice(slack_ids)
+        if rng.random() < noise_rate:
+            text = rng.choice(NOISE)
+        else:
+            customer, title = rng.choice(data["assignments"][slack_id])
+            text = (
+                f"{rng.choice(DATE_PHRASES)}{customer}に{rng.choice(ACTIVITY_TYPES)}。"
+                f"{title}の件で先方の要件を確認しました"
+            )
+        events.append(
+            {
+                "type": "event_callback",
+                "event_id": f"Ev{i}",
+                "event": {
+                    "type": "message",
+                    "user": slack_id,
+                    "text": text,
+                    "channel": "C1",
+                    "ts": f"{ts + i / 1000:.6f}",
+                },
+            }
+        )
+    return events
+
+
+async def replay(
+    engine, pipeline: ActivityIngestionPipeline, events: List[dict], workers: int
+) -> float:
+    """イベントをワーカー数の並行度で再生し、経過秒数を返す"""
+    queue: asyncio.Queue = asyncio.Queue()
+    for event_data in events:
+        queue.put_nowait(event_data)
+
+    async def worker() -> None:
+        while not queue.empty():
+            event_data = queue.get_nowait()
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                await pipeline.run(event_data, session)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    return time.perf_counter() - started
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--customers", type=int, default=2000)
+    parser.add_argument("--opportunities-per-user", type=int, default=3)
+    parser.add_argument("--noise-rate", type=float, default=0.2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/bench.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        data = await seed(
+            engine, args.users, args.customers, args.opportunities_per_user
+        )
+
+        handler = SlackEventHandler(
+            activity_matcher=ActivityTypeMatcher(enumerate(ACTIVITY_TYPES, start=1)),
+            customer_index=CustomerNameIndex(data["customers"]),
+            date_parser=RelativeDateParser("Asia/Tokyo"),
+        )
+        pipeline = ActivityIngestionPipeline(
+            handler, stage_timeout=30, timezone="Asia/Tokyo"
+        )
+        events = build_events(data, args.events, args.noise_rate)
+        elapsed = await replay(engine, pipeline, events, args.workers)
+        await engine.dispose()
+
+    metrics = pipeline.metrics()
+    print(
+        f"events={args.events} workers={args.workers} users={args.users} "
+        f"customers={args.customers}"
+    )
+    print(f"statuses: {metrics['statuses']}")
+    print(f"{'stage':<18}{'count':>8}{'avg_ms':>10}{'p50_ms':>10}{'p95_ms':>10}")
+    for stage, stats in [*metrics["stages"].items(), ("total", metrics["total"])]:
+        print(
+            f"{stage:<18}{stats['count']:>8}{stats['avg_ms']:>10.3f}"
+            f"{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}"
+        )
+    throughput = args.events / elapsed
+    print(
+        f"throughput: {throughput:.1f} msgs/sec "
+        f"({throughput / args.workers:.1f} msgs/sec/worker)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""
+オポチュニティ作成のベンチマークスクリプト
+SQLite上で担当者（コラボレーター）数を変えてオポチュニティを作成し、
+1件あたりのレイテンシとSQL文・コミットの回数を計測する
+
+使い方:
+    python -m scripts.bench_create_opportunity --iterations 200 --collaborators 1 10 100
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import List
+
+# プロジェクトルートディレクトリ
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+# 設定の読み込みに必要な環境変数（ベンチマークでは外部サービスを使用しない）
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-bench")
+os.environ.setdefault("SLACK_SIGNING_SECRET", "bench")
+os.environ.setdefault("OPENAI_API_KEY", "sk-bench")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+from sqlmodel.ext.asyncio.session import AsyncSession  # noqa: E402
+
+from src.models.entity import Customer, User  # noqa: E402
+from src.models.master import Stage  # noqa: E402
+from src.services.opportunity_service import create_opportunity  # noqa: E402
+
+
+async def seed(engine, users: int) -> tuple:
+    """顧客・ステージ・ユーザーを投入し、顧客IDとユーザーIDを返す"""
+    customer_id = uuid.uuid4()
+    user_ids = [uuid.uuid4() for _ in range(users)]
+    async with AsyncSession(engine) as session:
+        session.add(Customer(id=customer_id, name="株式会社ABC", industry="IT"))
+        session.add(Stage(id=1, name="提案", order_no=1))
+        for i, user_id in enumerate(user_ids):
+            session.add(
+                User(id=user_id, name=f"user{i}", email=f"user{i}@x", slack_id=f"U{i}")
+            )
+        await session.commit()
+    return customer_id, user_ids
+
+
+async def bench(
+    engine, customer_id, user_ids: List[uuid.UUID], collaborators: int, iterations: int
+) -> None:
+    """コラボレーター数ごとにオポチュニティを作成して計測する"""
+    statements: List[str] = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0])
+
+    def count_commit(conn):
+        statements.append("COMMIT")
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    event.listen(engine.sync_engine, "commit", count_commit)
+    latencies = []
+    try:
+        for _ in range(iterations):
+            data = {
+                "customer_id": customer_id,
+                "title": "新システム導入",
+                "amount": 1000000,
+                "stage_id": 1,
+                "expected_close_date": "2024-07-01",
+                "owners": [user_ids[0]],
+                "collaborators": user_ids[1 : collaborators + 1],
+            }
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                started = time.perf_counter()
+                await create_opportunity(data, session)
+                latencies.append(time.perf_counter() - started)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+        event.remove(engine.sync_engine, "commit", count_commit)
+
+    commits = statements.count("COMMIT") / iterations
+    per_create = len(statements) / iterations - commits
+    selects = statements.count("SELECT") / iterations
+    inserts = statements.count("INSERT") / iterations
+    print(
+        f"{collaborators:>13}{per_create:>12.1f}{selects:>9.1f}{inserts:>9.1f}"
+        f"{commits:>9.1f}"
+        f"{statistics.mean(latencies) * 1000:>10.3f}"
+        f"{statistics.median(latencies) * 1000:>10.3f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--collaborators", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/bench.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        customer_id, user_ids = await seed(engine, max(args.collaborators) + 1)
+
+        print(f"iterations={args.iterations}")
+        print(
+            f"{'collaborators':>13}{'statements':>12}{'SELECT':>9}{'INSERT':>9}"
+            f"{'COMMIT':>9}"
+            f"{'avg_ms':>10}{'p50_ms':>10}"
+        )
+        for collaborators in args.collaborators:
+            await bench(engine, customer_id, user_ids, collaborators, args.iterations)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
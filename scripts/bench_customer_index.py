@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+顧客名索引のベンチマークスクリプト
+顧客マスタの件数を変えながら、200文字のメッセージから顧客名を解決する時間を
+顧客ごとに名称を検索する単純な方式と比較する
+
+使い方:
+    python -m scripts.bench_customer_index --customers 1000 10000 50000
+"""
+import argparse
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, List
+
+# プロジェクトルートディレクトリ
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from src.agents.customer_matcher import CustomerNameIndex, normalize_name  # noqa: E402
+
+PREFIXES = ["株式会社", "", "", "有限会社"]
+WORDS = ["さくら", "ミライ", "東西", "アルファ", "グリーン", "日本", "テクノ", "北斗"]
+SUFFIXES = ["工業", "商事", "システムズ", "物産", "電機", "ホールディングス"]
+
+
+def build_customers(count: int, rng: random.Random) -> List[tuple]:
+    """重複しない顧客名を作成する"""
+    return [
+        (
+            uuid.uuid4(),
+            f"{rng.choice(PREFIXES)}{rng.choice(WORDS)}{i}{rng.choice(SUFFIXES)}",
+        )
+        for i in range(count)
+    ]
+
+
+def build_message(customer_name: str) -> str:
+    """顧客名（法人格を省略した表記）を含む200文字のメッセージを作成する"""
+    name = customer_name.replace("株式会社", "").replace("有限会社", "")
+    body = f"本日は{name}に訪問しました。先方の部長と来期の導入計画について打ち合わせ。"
+    return (body * 10)[:200]
+
+
+def measure(find: Callable[[str], object], messages: List[str]) -> float:
+    """1メッセージあたりの処理時間（マイクロ秒）を返す"""
+    started = time.perf_counter()
+    for message in messages:
+        find(message)
+    return (time.perf_counter() - started) / len(messages) * 1_000_000
+
+
+def main():
+    """メイン実行関数"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--customers", type=int, nargs="+", default=[1_000, 10_000, 50_000]
+    )
+    parser.add_argument("--messages", type=int, default=2_000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    for count in args.customers:
+        customers = build_customers(count, rng)
+        messages = [
+            build_message(rng.choice(customers)[1]) for _ in range(args.messages)
+        ]
+
+        started = time.perf_counter()
+        index = CustomerNameIndex(customers)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        # 比較用: 顧客ごとに法人格を除いた名称がメッセージに含まれるかを検索する
+        names = [
+            (customer_id, normalize_name(name).replace("(株)", "").replace("(有)", ""))
+            for customer_id, name in customers
+        ]
+
+        def naive(message: str) -> list:
+            normalized = normalize_name(message)
+            return [customer_id for customer_id, name in names if name in normalized]
+
+        print(f"\n## 顧客 {count:,}件（索引の構築 {build_ms:.1f} ms）")
+        print(f"  naive: {measure(naive, messages[:200]):10.1f} µs/メッセージ")
+        print(f"  index: {measure(index.find_all, messages):10.1f} µs/メッセージ")
+
+
+if __name__ == "__main__":
+    main()
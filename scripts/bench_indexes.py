@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+"""
+インデックス効果のベンチマークスクリプト
+activity_log を大量投入したSQLite上で、通知スキャン（最終活動日による絞り込み）・
+案件詳細・担当者検索・案件検索の実行計画とレイテンシを、追加インデックスなし/ありで比較する
+
+使い方:
+    python -m scripts.bench_indexes --activities 1000000
+"""
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable, List, Tuple
+
+# プロジェクトルートディレクトリ
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+# 設定の読み込みに必要な環境変数（ベンチマークでは外部サービスを使用しない）
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-bench")
+os.environ.setdefault("SLACK_SIGNING_SECRET", "bench")
+os.environ.setdefault("OPENAI_API_KEY", "sk-bench")
+
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+from sqlmodel import SQLModel, select  # noqa: E402
+from sqlmodel.ext.asyncio.session import AsyncSession  # noqa: E402
+
+from src.models.entity import OpportunityUser  # noqa: E402
+from src.services.master_cache_service import master_cache  # noqa: E402
+from src.services.notification_service import check_progress_notifications  # noqa: E402
+from src.services.opportunity_service import (  # noqa: E402
+    get_opportunity_by_id,
+    search_opportunities,
+)
+
+# 比較対象のインデックス（テーブル名, インデックス名）
+BENCH_INDEXES = [
+    ("activity_log", "ix_activity_log_opportunity_id_action_date"),
+    ("opportunity_user", "ix_opportunity_user_opportunity_id_role"),
+    ("opportunity_user", "ix_opportunity_user_user_id"),
+    ("opportunity", "ix_opportunity_expected_close_date"),
+    ("opportunity", "ix_opportunity_stage_id"),
+    ("opportunity", "ix_opportunity_last_activity_date"),
+]
+
+ACTIVITY_INSERT = (
+    "INSERT INTO activity_log (created_at, id, opportunity_id, user_id, "
+    "activity_type_id, action_date, comment) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def seed(db_path: str, opportunities: int, activities: int, users: int) -> dict:
+    """ベンチマーク用データを投入し、計測に使うIDを返す"""
+    engine = create_engine(f"sqlite:///{db_path}")
+    SQLModel.metadata.create_all(engine)
+    engine.dispose()
+
+    rng = random.Random(42)
+    now = datetime.utcnow().isoformat(sep=" ")
+    today = date.today()
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO stage (created_at, id, name, order_no, is_active) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (now, 1, "提案", 1, 1),
+    )
+    conn.execute(
+        "INSERT INTO activity_type (created_at, id, name, is_active) "
+        "VALUES (?, ?, ?, ?)",
+        (now, 1, "訪問", 1),
+    )
+    customer_id = uuid.uuid4().hex
+    conn.execute(
+        "INSERT INTO customer (created_at, id, name, industry) VALUES (?, ?, ?, ?)",
+        (now, customer_id, "A社", "IT"),
+    )
+
+    user_ids = [uuid.uuid4().hex for _ in range(users)]
+    conn.executemany(
+        "INSERT INTO user (created_at, id, name, email, slack_id) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [
+            (now, uid, f"user{i}", f"user{i}@example.com", f"U{i:08d}")
+            for i, uid in enumerate(user_ids)
+        ],
+    )
+
+    opp_ids = [uuid.uuid4().hex for _ in range(opportunities)]
+    conn.executemany(
+        "INSERT INTO opportunity (id, customer_id, title, amount, stage_id, "
+        "expected_close_date, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                oid,
+                customer_id,
+                f"案件{i}",
+                1000.0,
+                1,
+                (today + timedelta(days=rng.randint(0, 365))).isoformat(),
+                now,
+                now,
+            )
+            for i, oid in enumerate(opp_ids)
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO opportunity_user (created_at, id, opportunity_id, user_id, role) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [
+            (now, uuid.uuid4().hex, oid, user_ids[rng.randrange(users)], role)
+            for oid in opp_ids
+            for role in ("owner", "collaborator")
+        ],
+    )
+
+    batch = []
+    # 案件ごとの最新アクティビティ（通知スキャンが参照する非正規化項目）
+    latest = {}
+    for _ in range(activities):
+        activity_id = uuid.uuid4().hex
+        opp_id = opp_ids[rng.randrange(opportunities)]
+        action_date = (today - timedelta(days=rng.randint(0, 60))).isoformat()
+        batch.append(
+            (
+                now,
+                activity_id,
+                opp_id,
+                user_ids[rng.randrange(users)],
+                1,
+                action_date,
+                "",
+            )
+        )
+        if opp_id not in latest or latest[opp_id][0] < action_date:
+            latest[opp_id] = (action_date, activity_id)
+        if len(batch) >= 100_000:
+            conn.executemany(ACTIVITY_INSERT, batch)
+            batch.clear()
+    if batch:
+        conn.executemany(ACTIVITY_INSERT, batch)
+    conn.executemany(
+        "UPDATE opportunity SET last_activity_date = ?, last_activity_id = ? "
+        "WHERE id = ?",
+        [
+            (action_date, activity_id, oid)
+            for oid, (action_date, activity_id) in latest.items()
+        ],
+    )
+    conn.commit()
+    conn.close()
+    return {
+        "opportunity_id": uuid.UUID(opp_ids[0]),
+        "user_id": uuid.UUID(user_ids[0]),
+    }
+
+
+def set_indexes(db_path: str, enabled: bool) -> None:
+    """比較対象のインデックスを作成または削除する"""
+    conn = sqlite3.connect(db_path)
+    for table_name, index_name in BENCH_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+    if enabled:
+        engine = create_engine(f"sqlite:///{db_path}")
+        for table_name, index_name in BENCH_INDEXES:
+            table = SQLModel.metadata.tables[table_name]
+            index = next(i for i in table.indexes if i.name == index_name)
+            index.create(engine)
+        engine.dispose()
+    conn.execute("ANALYZE")
+    conn.commit()
+    conn.close()
+
+
+async def measure(
+    db_path: str, run: Callable[[AsyncSession], Awaitable], repeat: int
+) -> Tuple[float, List[str]]:
+    """クエリを繰り返し実行して中央値(ms)と実行計画を返す"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    timings = []
+    for _ in range(repeat):
+        async with AsyncSession(engine) as session:
+            started = time.perf_counter()
+            await run(session)
+            timings.append((time.perf_counter() - started) * 1000)
+    await engine.dispose()
+
+    statement, parameters = statements[-1]
+    conn = sqlite3.connect(db_path)
+    plan = [
+        row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    ]
+    conn.close()
+    return statistics.median(timings), plan
+
+
+async def run_suite(db_path: str, ids: dict, repeat: int) -> dict:
+    """計測対象のクエリをすべて実行する"""
+    user_id = ids["user_id"]
+    # 本番と同様に起動時に読み込んだ状態で計測する（マスタの読み込みを計測に含めない）
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with AsyncSession(engine) as session:
+        await master_cache.reload(session)
+    await engine.dispose()
+
+    queries = {
+        "progress_notification_scan": lambda s: check_progress_notifications(
+            date.today(), s
+        ),
+        "opportunity_detail": lambda s: get_opportunity_by_id(ids["opportunity_id"], s),
+        "search_by_close_date": lambda s: search_opportunities(
+            from_date=date.today(), to_date=date.today() + timedelta(days=7), session=s
+        ),
+        "owner_lookup": lambda s: s.exec(
+            select(OpportunityUser.opportunity_id).where(
+                OpportunityUser.user_id == user_id
+            )
+        ),
+    }
+    results = {}
+    for name, run in queries.items():
+        results[name] = await measure(db_path, run, repeat)
+    return results
+
+
+def main():
+    """メイン実行関数"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--activities", type=int, default=1_000_000)
+    parser.add_argument("--opportunities", type=int, default=50_000)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = str(Path(tmp_dir) / "bench.db")
+        print(
+            f"データ投入中: activity_log {args.activities:,}行, "
+            f"opportunity {args.opportunities:,}行"
+        )
+        ids = seed(db_path, args.opportunities, args.activities, args.users)
+
+        reports = {}
+        for label, enabled in (("before", False), ("after", True)):
+            set_indexes(db_path, enabled)
+            reports[label] = asyncio.run(run_suite(db_path, ids, args.repeat))
+
+    for name in reports["before"]:
+        before_ms, before_plan = reports["before"][name]
+        after_ms, after_plan = reports["after"][name]
+        print(f"\n## {name}")
+        print(f"  before: {before_ms:9.2f} ms  plan: {' / '.join(before_plan)}")
+        print(f"  after : {after_ms:9.2f} ms  plan: {' / '.join(after_plan)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+活動種別マッチャー
+
+アクティビティ種別マスタの名称と同義語（「打ち合わせ」「TEL」「資料送付」など）から
+Aho-Corasick法のオートマトンを構築し、メッセージを1回走査するだけで
+含まれるすべての活動種別とその出現位置を取り出す
+"""
+
+from typing import (
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+V = TypeVar("V")
+
+# 活動種別名ごとの同義語（マスタに存在する種別の同義語のみ使用する）
+DEFAULT_SYNONYMS: Dict[str, Sequence[str]] = {
+    "訪問": ("往訪", "来社", "来訪", "打ち合わせ", "打合せ", "打合わせ", "商談", "面談"),
+    "電話": ("TEL", "架電", "電話連絡", "コール"),
+    "メール": ("メール送付", "メール送信", "メール連絡", "資料送付", "資料送信", "mail"),
+    "オンライン会議": ("Web会議", "ウェブ会議", "オンライン商談", "Zoom", "Teams"),
+}
+
+# 照合時に同一視する文字（英字の大文字小文字、全角英字）。文字数は変わらないため位置はそのまま使える
+_FOLD_TABLE = {
+    **{code: code + 32 for code in range(ord("A"), ord("Z") + 1)},
+    **{code: code - 0xFEE0 + 32 for code in range(ord("Ａ"), ord("Ｚ") + 1)},
+    **{code: code - 0xFEE0 for code in range(ord("ａ"), ord("ｚ") + 1)},
+}
+
+
+def fold(text: str) -> str:
+    """
+    照合用に英字の大文字小文字・全角半角を揃える
+
+    Args:
+        text: 対象の文字列
+
+    Returns:
+        同じ長さの照合用文字列
+    """
+    return text.translate(_FOLD_TABLE)
+
+
+class AhoCorasick(Generic[V]):
+    """
+    Aho-Corasick法による複数キーワードの同時検索
+
+    失敗遷移をあらかじめ展開した決定性オートマトンとして構築するため、
+    検索はキーワード数によらずテキスト長に比例する時間で終わる
+    """
+
+    def __init__(self, keywords: Mapping[str, V]):
+        """
+        オートマトンの構築
+
+        Args:
+            keywords: キーワードと、一致したときに返す値の対応
+        """
+        # 状態ごとの遷移先と、その状態で一致が確定するキーワード（長さ, キーワード, 値）
+        self._delta: List[Dict[str, int]] = [{}]
+        outputs: List[List[Tuple[int, str, V]]] = [[]]
+        self.keyword_count = 0
+
+        for keyword, value in keywords.items():
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = self._delta[state].get(char)
+                if next_state is None:
+                    next_state = len(self._delta)
+                    self._delta[state][char] = next_state
+                    self._delta.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append((len(keyword), keyword, value))
+            self.keyword_count += 1
+
+        # 幅優先で失敗遷移を求め、遷移表と一致キーワードに展開する
+        fail = [0] * len(self._delta)
+        queue = list(self._delta[0].values())
+        for state in queue:
+            goto = self._delta[state]
+            for char, next_state in list(goto.items()):
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in self._delta[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = self._delta[fallback].get(char, 0)
+                outputs[next_state].extend(outputs[fail[next_state]])
+            # 失敗先の遷移を引き継ぐ（失敗先は深さが浅いため展開済み）
+            for char, target in self._delta[fail[state]].items():
+                goto.setdefault(char, target)
+
+        self._outputs: List[Tuple[Tuple[int, str, V], ...]] = [
+            tuple(output) for output in outputs
+        ]
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str, V]]:
+        """
+        テキスト中のキーワードの出現をすべて返す（重なり合う出現も含む）
+
+        Args:
+            text: 検索対象のテキスト
+
+        Yields:
+            (開始位置, 終了位置, キーワード, 値)。終了位置の昇順
+        """
+        delta = self._delta
+        outputs = self._outputs
+        state = 0
+        for end, char in enumerate(text, 1):
+            state = delta[state].get(char, 0)
+            for length, keyword, value in outputs[state]:
+                yield end - length, end, keyword, value
+
+
+class ActivityMatch(NamedTuple):
+    """メッセージ中の活動種別の出現"""
+
+    activity_type_id: Optional[int]
+    activity_type: str
+    keyword: str
+    start: int
+    end: int
+
+
+class ActivityTypeMatcher:
+    """
+    アクティビティ種別マスタから構築した活動種別マッチャー
+    """
+
+    def __init__(
+        self,
+        activity_types: Iterable[Tuple[Optional[int], str]],
+        synonyms: Optional[Mapping[str, Sequence[str]]] = None,
+    ):
+        """
+        マッチャーの初期化
+
+        Args:
+            activity_types: アクティビティ種別の (id, 名称)
+            synonyms: 種別名ごとの同義語（省略時は DEFAULT_SYNONYMS）
+        """
+        if synonyms is None:
+            synonyms = DEFAULT_SYNONYMS
+
+        types = {name: activity_type_id for activity_type_id, name in activity_types}
+        keywords: Dict[str, Tuple[Optional[int], str]] = {}
+        for name, activity_type_id in types.items():
+            for synonym in synonyms.get(name, ()):
+                keywords.setdefault(fold(synonym), (activity_type_id, name))
+        # 種別名そのものは同義語より優先する
+        for name, activity_type_id in types.items():
+            keywords[fold(name)] = (activity_type_id, name)
+
+        self.activity_types = types
+        self._automaton: AhoCorasick[Tuple[Optional[int], str]] = AhoCorasick(keywords)
+
+    @property
+    def keyword_count(self) -> int:
+        """登録されているキーワード数"""
+        return self._automaton.keyword_count
+
+    def find_all(self, text: str) -> List[ActivityMatch]:
+        """
+        メッセージに含まれる活動種別をすべて取り出す
+
+        Args:
+            text: メッセージテキスト
+
+        Returns:
+            活動種別の出現のリスト（開始位置の昇順、同じ位置では長いキーワードが先）
+        """
+        matches = [
+            ActivityMatch(value[0], value[1], text[start:end], start, end)
+            for start, end, _, value in self._automaton.finditer(fold(text))
+        ]
+        matches.sort(key=lambda match: (match.start, -match.end))
+        return matches
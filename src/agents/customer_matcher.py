@@ -0,0 +1,227 @@
+"""
+顧客名マッチャー
+
+顧客マスタの名称を正規化した別名（法人格の表記ゆれ、全角半角、ひらがな・カタカナ）で
+索引し、メッセージ中の顧客名をDBに問い合わせずに解決する
+"""
+
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List, NamedTuple, Set, Tuple
+
+# 法人格の表記（NFKC・小文字化後）と、正規化後の表記
+LEGAL_FORMS: Dict[str, str] = {
+    "株式会社": "(株)",
+    "(株)": "(株)",
+    "有限会社": "(有)",
+    "(有)": "(有)",
+    "合同会社": "(同)",
+    "(同)": "(同)",
+    "co.,ltd.": "(株)",
+    "inc.": "(株)",
+}
+_LEGAL_FORM_PATTERN = re.compile(
+    "|".join(re.escape(form) for form in sorted(LEGAL_FORMS, key=len, reverse=True))
+)
+
+# 名称中で無視する文字（空白と中黒）
+_IGNORED_CHARS = re.compile(r"[\s・]+")
+
+# ひらがなをカタカナに、表記ゆれしやすいカナを代表的な表記に揃える
+_KANA_TABLE = {
+    **{code: code + 0x60 for code in range(ord("ぁ"), ord("ゖ") + 1)},
+    ord("ヵ"): "カ",
+    ord("ヶ"): "ケ",
+    ord("ヴ"): "ブ",
+}
+
+# 「A社」のように顧客名を指す接尾辞
+_COMPANY_SUFFIX = "社"
+
+# 単独では誤検出しやすいため、別名として登録しない長さ
+_MIN_CORE_LENGTH = 2
+
+
+def normalize_name(text: str) -> str:
+    """
+    顧客名・メッセージを照合用に正規化する
+
+    全角半角（NFKC）・英字の大文字小文字・ひらがなとカタカナを揃え、
+    空白と中黒を除き、法人格の表記（株式会社/(株)/㈱ など）を統一する
+
+    Args:
+        text: 顧客名またはメッセージ
+
+    Returns:
+        正規化した文字列
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = _IGNORED_CHARS.sub("", text).translate(_KANA_TABLE)
+    return _LEGAL_FORM_PATTERN.sub(lambda match: LEGAL_FORMS[match.group()], text)
+
+
+def customer_aliases(name: str) -> Set[str]:
+    """
+    顧客名から照合に使う別名を作成する
+
+    Args:
+        name: 顧客マスタの名称
+
+    Returns:
+        正規化した名称、法人格の前置・後置の両表記、「〜社」、法人格を除いた名称
+    """
+    normalized = normalize_name(name)
+    aliases = {normalized}
+
+    forms = set(LEGAL_FORMS.values())
+    core = normalized
+    for form in forms:
+        if core.startswith(form) or core.endswith(form):
+            core = core.replace(form, "")
+            aliases.update({form + core, core + form})
+    if not core:
+        return aliases
+
+    if not core.endswith(_COMPANY_SUFFIX):
+        aliases.add(core + _COMPANY_SUFFIX)
+    if len(core) >= _MIN_CORE_LENGTH:
+        aliases.add(core)
+    return aliases
+
+
+def _is_word_char(char: str) -> bool:
+    """英数字（照合の境界判定に使う文字）かどうか"""
+    return char.isascii() and char.isalnum()
+
+
+class CustomerMatch(NamedTuple):
+    """メッセージ中の顧客名の出現"""
+
+    customer_id: Any
+    name: str
+    alias: str
+
+
+class CustomerNameIndex:
+    """
+    顧客名の索引
+
+    別名をハッシュ表で保持し、先頭文字ごとの別名の長さを使ってメッセージを走査する。
+    顧客の追加・変更・削除は索引全体を作り直さずに反映できる
+    """
+
+    def __init__(self, customers: Iterable[Tuple[Any, str]] = ()):
+        """
+        索引の初期化
+
+        Args:
+            customers: 顧客の (id, 名称)
+        """
+        self._names: Dict[Any, Tuple[str, Set[str]]] = {}
+        self._aliases: Dict[str, Set[Any]] = {}
+        # 先頭文字ごとの別名の長さ（長い順）と、その長さの別名の件数
+        self._lengths: Dict[str, Tuple[int, ...]] = {}
+        self._length_counts: Dict[str, Dict[int, int]] = {}
+        for customer_id, name in customers:
+            self.upsert(customer_id, name)
+
+    def __len__(self) -> int:
+        """索引されている顧客数"""
+        return len(self._names)
+
+    def _add_length(self, alias: str, delta: int) -> None:
+        """別名の先頭文字・長さの件数を更新する"""
+        counts = self._length_counts.setdefault(alias[0], {})
+        counts[len(alias)] = counts.get(len(alias), 0) + delta
+        if counts[len(alias)] <= 0:
+            del counts[len(alias)]
+        if counts:
+            self._lengths[alias[0]] = tuple(sorted(counts, reverse=True))
+        else:
+            self._lengths.pop(alias[0], None)
+            del self._length_counts[alias[0]]
+
+    def upsert(self, customer_id: Any, name: str) -> None:
+        """
+        顧客を索引に追加する（登録済みの場合は名称を更新する）
+
+        Args:
+            customer_id: 顧客ID
+            name: 顧客名
+        """
+        self.remove(customer_id)
+        aliases = customer_aliases(name)
+        self._names[customer_id] = (name, aliases)
+        for alias in aliases:
+            customer_ids = self._aliases.setdefault(alias, set())
+            if not customer_ids:
+                self._add_length(alias, 1)
+            customer_ids.add(customer_id)
+
+    def remove(self, customer_id: Any) -> None:
+        """
+        顧客を索引から削除する
+
+        Args:
+            customer_id: 顧客ID
+        """
+        entry = self._names.pop(customer_id, None)
+        if entry is None:
+            return
+        for alias in entry[1]:
+            customer_ids = self._aliases[alias]
+            customer_ids.discard(customer_id)
+            if not customer_ids:
+                del self._aliases[alias]
+                self._add_length(alias, -1)
+
+    def find_all(self, text: str) -> List[CustomerMatch]:
+        """
+        メッセージに含まれる顧客名を取り出す
+
+        左から順に最長の別名を照合し、照合した範囲は重ねて照合しない。
+        同じ別名を持つ顧客が複数ある場合はすべて返す
+
+        Args:
+            text: メッセージテキスト
+
+        Returns:
+            顧客名の出現のリスト（出現順）
+        """
+        normalized = normalize_name(text)
+        lengths = self._lengths
+        aliases = self._aliases
+        matches: List[CustomerMatch] = []
+
+        position = 0
+        end_of_text = len(normalized)
+        while position < end_of_text:
+            matched = 0
+            for length in lengths.get(normalized[position], ()):
+                alias = normalized[position : position + length]
+                customer_ids = aliases.get(alias)
+                if customer_ids is None or not self._on_boundary(
+                    normalized, position, position + length
+                ):
+                    continue
+                for customer_id in customer_ids:
+                    matches.append(
+                        CustomerMatch(customer_id, self._names[customer_id][0], alias)
+                    )
+                matched = length
+                break
+            position += matched or 1
+        return matches
+
+    @staticmethod
+    def _on_boundary(text: str, start: int, end: int) -> bool:
+        """英数字の別名が英数字の途中で一致していないかを判定する"""
+        if start > 0 and _is_word_char(text[start]) and _is_word_char(text[start - 1]):
+            return False
+        if (
+            end < len(text)
+            and _is_word_char(text[end - 1])
+            and _is_word_char(text[end])
+        ):
+            return False
+        return True
@@ -0,0 +1,248 @@
+"""
+日付表現パーサー
+
+メッセージ中の「今日」「昨日」「一昨日」「先週金曜」「3日前」「5月10日」「5/10」などの
+日付表現を、メッセージの投稿日時（SCHEDULER_TIMEZONE の日付）を基準に活動日へ変換する。
+「先日」「先月」のように日付を特定できない表現や、複数の日付を含む場合は
+モデルでの判断が必要なものとして返す
+"""
+
+import re
+import unicodedata
+from datetime import date, datetime, timedelta, tzinfo
+from typing import List, NamedTuple, Optional
+from zoneinfo import ZoneInfo
+
+# 基準日からの日数で表す表現
+RELATIVE_DAYS = {
+    "今日": 0,
+    "本日": 0,
+    "きょう": 0,
+    "昨日": -1,
+    "きのう": -1,
+    "一昨日": -2,
+    "おととい": -2,
+    "おとつい": -2,
+    "明日": 1,
+    "あした": 1,
+    "明後日": 2,
+    "あさって": 2,
+}
+
+# 基準週（月曜始まり）からの週数
+RELATIVE_WEEKS = {"先々週": -2, "先週": -1, "今週": 0, "来週": 1}
+
+WEEKDAYS = "月火水木金土日"
+
+# 日付を特定できない表現（モデルでの判断が必要）
+VAGUE_PHRASES = (
+    "先日",
+    "この前",
+    "この間",
+    "最近",
+    "先月",
+    "今月",
+    "来月",
+    "先週",
+    "今週",
+    "来週",
+    "週末",
+    "月末",
+    "月初",
+    "上旬",
+    "中旬",
+    "下旬",
+    "去年",
+    "昨年",
+)
+
+_KANJI_DIGITS = {k: v for v, k in enumerate("〇一二三四五六七八九")}
+_NUMBER = r"[0-9]{1,3}|[〇一二三四五六七八九十]{1,3}"
+# 十を含む漢数字（十・十五・二十・九十九）
+_KANJI_TENS = re.compile("([一二三四五六七八九]?)十([一二三四五六七八九]?)")
+
+_DATE_PATTERN = re.compile(
+    "|".join(
+        [
+            # 2024年5月10日 / 2024/5/10 / 2024-05-10
+            r"(?P<ymd>(?P<y>\d{4})(?:年|/|-)"
+            r"(?P<y_m>\d{1,2})(?:月|/|-)(?P<y_d>\d{1,2})日?)",
+            # 先週金曜 / 先週の金曜日
+            rf"(?P<week_day>(?P<week>{'|'.join(RELATIVE_WEEKS)})の?"
+            rf"(?P<week_wd>[{WEEKDAYS}])曜日?)",
+            # 3日前 / 三日前 / 2週間前
+            rf"(?P<ago>(?P<ago_n>{_NUMBER})(?P<ago_unit>日|週間)前)",
+            # 5月10日
+            r"(?P<md>(?P<md_m>\d{1,2})月(?P<md_d>\d{1,2})日)",
+            # 5/10（分数・バージョン表記（v1/2, 1.1/2）などと区別するため、
+            # 前が英数字・ドット・スラッシュ、後ろが数字・ドット・スラッシュでない場合のみ）
+            r"(?P<slash>(?<![0-9A-Za-z./])(?P<sl_m>\d{1,2})/(?P<sl_d>\d{1,2})"
+            r"(?![0-9./]))",
+            # 今日 / 昨日 / 一昨日 …（長い表記を先に照合する）
+            "(?P<relative>"
+            + "|".join(sorted(RELATIVE_DAYS, key=len, reverse=True))
+            + ")",
+            # 金曜 / 金曜日
+            rf"(?P<weekday>(?P<wd>[{WEEKDAYS}])曜日?)",
+            # 日付を特定できない表現
+            "(?P<vague>" + "|".join(VAGUE_PHRASES) + ")",
+        ]
+    )
+)
+
+
+class DateExtraction(NamedTuple):
+    """メッセージから抽出した活動日"""
+
+    # 特定した活動日（日付表現がない・特定できない場合はNone）
+    date: Optional[date]
+    # 活動日の根拠になった表現
+    phrase: Optional[str]
+    # 日付を特定できない表現・複数の日付・存在しない日付を含み、モデルでの判断が必要か
+    needs_model: bool
+
+
+def _parse_number(text: str) -> int:
+    """
+    算用数字・漢数字（九十九まで）を整数に変換する
+
+    Raises:
+        ValueError: 「十十」「一二十」のように数として読めない漢数字の場合
+    """
+    if text.isdigit():
+        return int(text)
+    if "十" not in text:
+        return int("".join(str(_KANJI_DIGITS[char]) for char in text))
+    match = _KANJI_TENS.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Invalid kanji number: {text}")
+    tens, ones = match.groups()
+    return (_KANJI_DIGITS[tens] if tens else 1) * 10 + (
+        _KANJI_DIGITS[ones] if ones else 0
+    )
+
+
+def _latest_date(month: int, day: int, reference: date) -> date:
+    """
+    年を省略した月日を、基準日以前で直近のその月日の日付に変換する
+
+    活動の報告は過去の出来事のため、基準日より後の日付にはしない
+
+    Raises:
+        ValueError: 存在しない月日の場合
+    """
+    # 2月29日は閏年のみ存在するため、存在する年まで遡る（閏年は8年以内に必ずある）
+    for year in range(reference.year, reference.year - 9, -1):
+        try:
+            candidate = date(year, month, day)
+        except ValueError:
+            continue
+        if candidate <= reference:
+            return candidate
+    raise ValueError(f"Invalid month/day: {month}/{day}")
+
+
+class RelativeDateParser:
+    """
+    日付表現パーサー
+
+    正規表現はモジュールの読み込み時に1回だけコンパイルし、
+    メッセージごとには1回の走査で日付表現を取り出す
+    """
+
+    def __init__(self, timezone: str):
+        """
+        パーサーの初期化
+
+        Args:
+            timezone: 基準日を決めるタイムゾーン名（例: "Asia/Tokyo"）
+        """
+        self.timezone: tzinfo = ZoneInfo(timezone)
+
+    def reference_date(self, reference: Optional[datetime] = None) -> date:
+        """
+        基準日を取得する
+
+        Args:
+            reference: 基準日時（省略時は現在時刻。タイムゾーンなしの場合はUTCとみなす）
+
+        Returns:
+            基準日時をタイムゾーンの日付にしたもの
+        """
+        if reference is None:
+            return datetime.now(self.timezone).date()
+        if reference.tzinfo is None:
+            reference = reference.replace(tzinfo=ZoneInfo("UTC"))
+        return reference.astimezone(self.timezone).date()
+
+    def parse(self, text: str, reference: Optional[datetime] = None) -> DateExtraction:
+        """
+        メッセージから活動日を抽出する
+
+        Args:
+            text: メッセージテキスト
+            reference: 基準日時（メッセージの投稿日時。省略時は現在時刻）
+
+        Returns:
+            抽出した活動日。日付表現がない場合は date・phrase ともにNone
+        """
+        today = self.reference_date(reference)
+        normalized = unicodedata.normalize("NFKC", text)
+
+        dates: List[date] = []
+        phrase = None
+        needs_model = False
+        for match in _DATE_PATTERN.finditer(normalized):
+            try:
+                resolved = self._resolve(match, today)
+            except ValueError:
+                # 2月30日のように存在しない日付、「十十日前」のように読めない数
+                resolved = None
+            if resolved is None:
+                needs_model = True
+                continue
+            if resolved not in dates:
+                dates.append(resolved)
+            if phrase is None:
+                phrase = match.group()
+
+        if len(dates) > 1:
+            needs_model = True
+        return DateExtraction(dates[0] if dates else None, phrase, needs_model)
+
+    @staticmethod
+    def _resolve(match: re.Match, today: date) -> Optional[date]:
+        """
+        照合した日付表現を日付に変換する
+
+        Returns:
+            日付。日付を特定できない表現の場合はNone
+
+        Raises:
+            ValueError: 存在しない日付の場合
+        """
+        kind = match.lastgroup
+        if kind == "ymd":
+            return date(int(match["y"]), int(match["y_m"]), int(match["y_d"]))
+        if kind == "week_day":
+            monday = today - timedelta(days=today.weekday())
+            weeks = RELATIVE_WEEKS[match["week"]]
+            return monday + timedelta(
+                weeks=weeks, days=WEEKDAYS.index(match["week_wd"])
+            )
+        if kind == "ago":
+            days = _parse_number(match["ago_n"])
+            if match["ago_unit"] == "週間":
+                days *= 7
+            return today - timedelta(days=days)
+        if kind == "md":
+            return _latest_date(int(match["md_m"]), int(match["md_d"]), today)
+        if kind == "slash":
+            return _latest_date(int(match["sl_m"]), int(match["sl_d"]), today)
+        if kind == "relative":
+            return today + timedelta(days=RELATIVE_DAYS[match["relative"]])
+        if kind == "weekday":
+            # 曜日のみの場合は基準日以前で直近のその曜日とする
+            days = (today.weekday() - WEEKDAYS.index(match["wd"])) % 7
+            return today - timedelta(days=days)
+        return None
@@ -0,0 +1,279 @@
+"""
+営業活動情報の段階的抽出
+
+ルールベースの抽出結果（活動種別・顧客・活動日）の確信度を評価し、
+しきい値に満たない場合のみLLMで補完する。LLMの応答は正規化したメッセージと
+送信者・基準日をキーにLRUキャッシュし、同じ内容のメッセージではLLMを呼び出さない。
+バッチャーを指定した場合は、LLMへの問い合わせを他のメッセージとまとめて送信する
+"""
+
+import asyncio
+import re
+import unicodedata
+from datetime import date
+from typing import Any, Dict, Optional, Sequence
+
+from src.agents.llm_batcher import ExtractionBatcher
+from src.agents.llm_client import LLMClient, LLMError
+from src.core.cache import TTLCache
+from src.core.logger import get_app_logger
+
+logger = get_app_logger()
+
+# ルールベースの抽出結果の確信度の内訳
+TYPE_CONFIDENCE = 0.4
+CUSTOMER_CONFIDENCE = 0.3
+DATE_CONFIDENCE = 0.3
+# 日付表現がない場合（投稿日を活動日とみなす）
+IMPLICIT_DATE_CONFIDENCE = 0.25
+# 複数の活動種別を含む場合の減点
+MULTIPLE_TYPES_PENALTY = 0.1
+
+EXTRACTION_SYSTEM_PROMPT = """\
+あなたは営業担当者のSlackメッセージから営業活動の記録を抽出するアシスタントです。
+メッセージが顧客との営業活動の報告かどうかを判定し、次のJSONだけを返してください。
+{"is_activity": true/false, "activity_type": 活動種別名またはnull,
+ "customer": 顧客名またはnull, "date": "YYYY-MM-DD"またはnull}
+- activity_type は指定された活動種別の一覧から選ぶこと
+- customer は顧客の候補がある場合はその名称から選ぶこと
+- date は基準日をもとに活動日を求め、特定できない場合はnullとすること"""
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def rule_confidence(info: Dict[str, Any]) -> float:
+    """
+    ルールベースの抽出結果の確信度を求める
+
+    Args:
+        info: ルールベースの抽出結果
+
+    Returns:
+        0〜1の確信度
+    """
+    confidence = TYPE_CONFIDENCE if info.get("type") else 0.0
+    if info.get("customer_id"):
+        confidence += CUSTOMER_CONFIDENCE
+    if not info.get("date_needs_model"):
+        confidence += DATE_CONFIDENCE if info.get("date") else IMPLICIT_DATE_CONFIDENCE
+    activity_types = {match["activity_type"] for match in info.get("matches", ())}
+    if len(activity_types) > 1:
+        confidence -= MULTIPLE_TYPES_PENALTY
+    return round(max(confidence, 0.0), 4)
+
+
+def normalize_message(text: str) -> str:
+    """キャッシュのキーに使うため、全角半角の違いを揃えて空白を除く"""
+    return _WHITESPACE.sub("", unicodedata.normalize("NFKC", text))
+
+
+class TieredExtractor:
+    """
+    ルールベース優先・LLM補完の抽出器
+    """
+
+    def __init__(
+        self,
+        llm: LLMClient,
+        threshold: float,
+        cache_size: int,
+        cache_ttl: float,
+        batcher: Optional[ExtractionBatcher] = None,
+    ):
+        """
+        抽出器の初期化
+
+        Args:
+            llm: LLMクライアント
+            threshold: LLMで補完せずにルールベースの結果を使う確信度の下限
+            cache_size: LLMの応答をキャッシュする件数
+            cache_ttl: LLMの応答のキャッシュの有効期限（秒）
+            batcher: LLMへの問い合わせをまとめて送信するバッチャー（省略時は1件ずつ送信）
+        """
+        self.llm = llm
+        self.batcher = batcher
+        self.threshold = threshold
+        self.cache: TTLCache[str, Dict[str, Any]] = TTLCache(
+            maxsize=cache_size, ttl=cache_ttl
+        )
+        self.extractions = 0
+        self.escalations = 0
+        self._inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+    async def extract(
+        self,
+        text: str,
+        rule_info: Optional[Dict[str, Any]],
+        context: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        営業活動情報を抽出する
+
+        Args:
+            text: メッセージテキスト
+            rule_info: ルールベースの抽出結果（活動種別が見つからない場合はNone）
+            context: 送信者（user_id）・基準日（reference_date）・
+                活動種別名の一覧（activity_types）
+
+        Returns:
+            抽出結果（source に "rules" または "llm"、confidence にルールベースの確信度）。
+            営業活動の報告でない場合はNone
+        """
+        # 活動種別のキーワードを含まないメッセージは営業活動の報告とみなさない
+        if rule_info is None:
+            return None
+
+        self.extractions += 1
+        confidence = rule_confidence(rule_info)
+        if confidence >= self.threshold:
+            return {**rule_info, "source": "rules", "confidence": confidence}
+
+        self.escalations += 1
+        try:
+            response = await self._complete(text, rule_info, context)
+        except LLMError:
+            # LLMを利用できない場合はルールベースの結果をそのまま使う
+            return {**rule_info, "source": "rules", "confidence": confidence}
+
+        merged = self._merge(rule_info, response, context.get("activity_types", {}))
+        if merged is not None:
+            merged.update({"source": "llm", "confidence": confidence})
+        return merged
+
+    async def _complete(
+        self, text: str, rule_info: Dict[str, Any], context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        LLMの応答を取得する（キャッシュにある場合・同じ内容を問い合わせ中の場合は再利用する）
+
+        Raises:
+            LLMError: LLMの呼び出しに失敗した場合
+        """
+        key = "\x00".join(
+            [
+                str(context.get("user_id")),
+                str(context.get("reference_date")),
+                normalize_message(text),
+            ]
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            user_prompt = self._build_prompt(text, rule_info, context)
+            if self.batcher is not None:
+                response = await self.batcher.complete(user_prompt)
+            else:
+                response = await self.llm.complete_json(
+                    [
+                        {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+                        {"role": "user", "content": user_prompt},
+                    ]
+                )
+            if not isinstance(response, dict):
+                raise LLMError("LLM response is not a JSON object")
+            self.cache.set(key, response)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            # 待機している呼び出しにはキャンセルを伝播させず、LLMの失敗として扱わせる
+            future.set_exception(e if isinstance(e, LLMError) else LLMError(repr(e)))
+            # 待機している呼び出しがない場合に未取得の例外として警告されないようにする
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    @staticmethod
+    def _build_prompt(
+        text: str, rule_info: Dict[str, Any], context: Dict[str, Any]
+    ) -> str:
+        """LLMに送信するユーザープロンプトを作成する"""
+        candidates = [c["name"] for c in rule_info.get("customer_candidates", ())]
+        return "\n".join(
+            [
+                f"基準日: {context.get('reference_date')}",
+                f"活動種別: {', '.join(context.get('activity_types', ()))}",
+                f"顧客の候補: {', '.join(candidates) or 'なし'}",
+                f"メッセージ: {text}",
+            ]
+        )
+
+    @staticmethod
+    def _merge(
+        rule_info: Dict[str, Any],
+        response: Dict[str, Any],
+        activity_types: Any,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        LLMの応答でルールベースの抽出結果を補完する
+
+        Args:
+            rule_info: ルールベースの抽出結果
+            response: LLMの応答
+            activity_types: 活動種別名とIDの対応
+
+        Returns:
+            補完した抽出結果。LLMが営業活動の報告でないと判定した場合はNone
+        """
+        if response.get("is_activity") is False:
+            return None
+
+        merged = dict(rule_info)
+        activity_type = response.get("activity_type")
+        if activity_type in activity_types:
+            merged["type"] = activity_type
+            merged["activity_type_id"] = activity_types[activity_type]
+
+        customer = response.get("customer")
+        candidates: Sequence[Dict[str, Any]] = rule_info.get("customer_candidates", ())
+        for candidate in candidates:
+            if candidate["name"] == customer:
+                merged["customer"] = candidate["name"]
+                merged["customer_id"] = candidate["id"]
+                break
+        else:
+            if customer and not merged.get("customer"):
+                # 顧客マスタと照合できない顧客名は名称のみ保持する
+                merged["customer"] = customer
+
+        try:
+            action_date = date.fromisoformat(str(response.get("date")))
+        except ValueError:
+            action_date = None
+        if action_date is not None:
+            merged["date"] = action_date.isoformat()
+            merged["date_needs_model"] = False
+        return merged
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        抽出のメトリクスを取得する
+
+        Returns:
+            抽出数・LLMで補完した割合・LLMの応答キャッシュのヒット率・
+            LLM呼び出しとバッチ送信の状況
+        """
+        return {
+            "extractions": self.extractions,
+            "escalations": self.escalations,
+            "escalation_rate": (
+                self.escalations / self.extractions if self.extractions else 0.0
+            ),
+            "cache": self.cache.metrics(),
+            "llm": self.llm.metrics(),
+            "batcher": self.batcher.metrics() if self.batcher is not None else None,
+        }
+
+    async def close(self) -> None:
+        """問い合わせ中のバッチの完了を待ち、LLMクライアントの接続プールを閉じる"""
+        if self.batcher is not None:
+            await self.batcher.close()
+        await self.llm.close()
@@ -0,0 +1,218 @@
+"""
+LLM呼び出しのマイクロバッチ
+
+同時刻に投稿が集中した場合にメッセージごとにLLMを呼び出さないよう、
+問い合わせを最大 max_wait_ms ミリ秒または max_batch_size 件まで集めてからまとめて送信し、
+応答をそれぞれの呼び出し元に返す。送信方法は次の2つから選択する
+
+- "prompt": 共通のシステムプロンプトを1回だけ含む1つのリクエストで全件を問い合わせる
+- "concurrent": LLMクライアントの接続プールを共有して1件ずつ並行に問い合わせる
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.agents.llm_client import LLMClient, LLMError
+from src.core.logger import get_app_logger
+
+logger = get_app_logger()
+
+BATCH_MODES = ("prompt", "concurrent")
+
+# まとめて問い合わせる場合にシステムプロンプトに追加する指示
+BATCH_INSTRUCTION = """\
+複数の問い合わせが「### id: 番号」で区切って与えられます。
+それぞれに上記の形式で回答し、次のJSONだけを返してください。
+{"results": [{"id": 番号, ...回答の各項目}, ...]}"""
+
+
+class ExtractionBatcher:
+    """
+    LLMへの問い合わせをまとめて送信するバッチャー
+    """
+
+    def __init__(
+        self,
+        llm: LLMClient,
+        system_prompt: str,
+        max_batch_size: int,
+        max_wait_ms: float,
+        mode: str = "prompt",
+    ):
+        """
+        バッチャーの初期化
+
+        Args:
+            llm: LLMクライアント
+            system_prompt: すべての問い合わせに共通するシステムプロンプト
+            max_batch_size: まとめて送信する問い合わせ数の上限
+            max_wait_ms: 最初の問い合わせから送信までに待つ時間（ミリ秒）
+            mode: 送信方法（"prompt" または "concurrent"）
+
+        Raises:
+            ValueError: 送信方法が不正な場合
+        """
+        if mode not in BATCH_MODES:
+            raise ValueError(f"Invalid batch mode: {mode}")
+        self.llm = llm
+        self.system_prompt = system_prompt
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait = max_wait_ms / 1000
+        self.mode = mode
+        self._pending: List[Tuple[str, "asyncio.Future[Any]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self.batches = 0
+        self.items = 0
+        self.size_flushes = 0
+        self.timeout_flushes = 0
+
+    async def complete(self, user_prompt: str) -> Any:
+        """
+        問い合わせをバッチに追加し、応答を待つ
+
+        Args:
+            user_prompt: 問い合わせ内容（ユーザープロンプト）
+
+        Returns:
+            応答を解析したJSON
+
+        Raises:
+            LLMError: 呼び出しに失敗した、または応答に問い合わせの回答が含まれない場合
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((user_prompt, future))
+        if len(self._pending) >= self.max_batch_size:
+            self.size_flushes += 1
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush_on_timeout)
+        # 呼び出し元がキャンセルされてもバッチの送信は継続する
+        return await future
+
+    def _flush_on_timeout(self) -> None:
+        """待ち時間を過ぎたバッチを送信する"""
+        self._timer = None
+        if self._pending:
+            self.timeout_flushes += 1
+            self._flush()
+
+    def _flush(self) -> None:
+        """集めた問い合わせを送信するタスクを開始する"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        self.batches += 1
+        self.items += len(batch)
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        # タスクが途中で破棄されないよう、完了まで参照を保持する
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[Tuple[str, "asyncio.Future[Any]"]]) -> None:
+        """バッチを送信し、応答をそれぞれの呼び出し元に返す"""
+        prompts = [prompt for prompt, _ in batch]
+        try:
+            if self.mode == "prompt" and len(batch) > 1:
+                results = await self._complete_batch(prompts)
+            else:
+                results = await asyncio.gather(
+                    *(self._complete_one(prompt) for prompt in prompts),
+                    return_exceptions=True,
+                )
+        except Exception as e:
+            error = e if isinstance(e, LLMError) else LLMError(repr(e))
+            results = [error] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            # キャンセルされた呼び出し元には返さない
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(
+                    result if isinstance(result, LLMError) else LLMError(repr(result))
+                )
+            else:
+                future.set_result(result)
+
+    async def _complete_one(self, user_prompt: str) -> Any:
+        """1件の問い合わせを送信する"""
+        return await self.llm.complete_json(
+            [
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": user_prompt},
+            ]
+        )
+
+    async def _complete_batch(self, prompts: List[str]) -> List[Any]:
+        """
+        複数の問い合わせを1つのリクエストで送信する
+
+        Returns:
+            問い合わせ順の回答。回答が含まれない問い合わせは LLMError
+
+        Raises:
+            LLMError: 呼び出しに失敗した、または応答の形式が不正な場合
+        """
+        user_prompt = "\n\n".join(
+            f"### id: {index}\n{prompt}" for index, prompt in enumerate(prompts)
+        )
+        response = await self.llm.complete_json(
+            [
+                {
+                    "role": "system",
+                    "content": f"{self.system_prompt}\n\n{BATCH_INSTRUCTION}",
+                },
+                {"role": "user", "content": user_prompt},
+            ]
+        )
+        if not isinstance(response, dict) or not isinstance(
+            response.get("results"), list
+        ):
+            raise LLMError("LLM batch response has no results")
+
+        results: List[Any] = [
+            LLMError(f"LLM batch response has no result for id {index}")
+            for index in range(len(prompts))
+        ]
+        for result in response["results"]:
+            if not isinstance(result, dict):
+                continue
+            index = result.pop("id", None)
+            if isinstance(index, int) and 0 <= index < len(prompts):
+                results[index] = result
+
+        missing = sum(isinstance(result, LLMError) for result in results)
+        if missing:
+            logger.warning(
+                "LLM batch response is missing results",
+                extra={"batch_size": len(prompts), "missing": missing},
+            )
+        return results
+
+    async def close(self) -> None:
+        """待機中の問い合わせを送信し、送信中のバッチの完了を待つ"""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        バッチ送信のメトリクスを取得する
+
+        Returns:
+            送信したバッチ数・問い合わせ数・平均バッチサイズ・送信の契機の内訳
+        """
+        return {
+            "mode": self.mode,
+            "batches": self.batches,
+            "items": self.items,
+            "average_batch_size": self.items / self.batches if self.batches else 0.0,
+            "size_flushes": self.size_flushes,
+            "timeout_flushes": self.timeout_flushes,
+        }
@@ -0,0 +1,130 @@
+"""
+LLMクライアント
+
+OpenAI Chat Completions APIを呼び出し、JSON形式の応答を取得する。
+api_base を変更することで、テスト用のフェイクLLMサーバーにも接続できる
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+import openai
+
+from src.core.logger import get_app_logger
+
+logger = get_app_logger()
+
+
+class LLMError(Exception):
+    """LLMの呼び出しに失敗した、または応答を解析できない場合の例外"""
+
+
+class LLMClient:
+    """
+    OpenAI Chat Completions APIのクライアント
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        api_base: str,
+        timeout: float,
+        max_connections: int = 10,
+    ):
+        """
+        クライアントの初期化
+
+        Args:
+            api_key: OpenAI APIキー
+            model: 使用するモデル名
+            api_base: APIのベースURL
+            timeout: 1回の呼び出しのタイムアウト（秒）
+            max_connections: 共有する接続プールの最大接続数
+        """
+        self.api_key = api_key
+        self.model = model
+        self.api_base = api_base
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.requests = 0
+        self.errors = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    async def complete_json(self, messages: List[Dict[str, str]]) -> Any:
+        """
+        メッセージを送信し、応答をJSONとして解析する
+
+        Args:
+            messages: Chat Completions APIに送信するメッセージ
+
+        Returns:
+            応答を解析したJSON
+
+        Raises:
+            LLMError: 呼び出しに失敗した、または応答がJSONでない場合
+        """
+        self.requests += 1
+        # 呼び出しごとに接続を作らず、クライアントの接続プールを共有する
+        token = openai.aiosession.set(self._get_session())
+        try:
+            response = await openai.ChatCompletion.acreate(
+                model=self.model,
+                messages=messages,
+                temperature=0,
+                api_key=self.api_key,
+                api_base=self.api_base,
+                request_timeout=self.timeout,
+            )
+            usage = response.get("usage") or {}
+            self.prompt_tokens += usage.get("prompt_tokens", 0)
+            self.completion_tokens += usage.get("completion_tokens", 0)
+            return json.loads(response["choices"][0]["message"]["content"])
+        except (
+            openai.error.OpenAIError,
+            asyncio.TimeoutError,
+            json.JSONDecodeError,
+            KeyError,
+            IndexError,
+            TypeError,
+        ) as e:
+            self.errors += 1
+            logger.warning(
+                "LLM request failed",
+                extra={"model": self.model, "error": f"{type(e).__name__}: {e}"},
+            )
+            raise LLMError(str(e)) from e
+        finally:
+            openai.aiosession.reset(token)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """接続プールを持つHTTPセッションを取得する（初回の呼び出し時に作成する）"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """接続プールを閉じる"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        LLM呼び出しのメトリクスを取得する
+
+        Returns:
+            呼び出し数・失敗数・消費トークン数
+        """
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+        }
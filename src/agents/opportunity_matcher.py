@@ -0,0 +1,137 @@
+"""
+案件マッチャー
+
+送信者が担当する案件の候補を、メッセージと案件名のトークンの重なりと
+最新アクティビティの新しさでスコア付けし、メッセージが指す案件を推定する
+"""
+
+import heapq
+import re
+import unicodedata
+from datetime import date
+from typing import Any, FrozenSet, Iterable, List, NamedTuple, Optional
+
+# スコアの重み（案件名の一致度, 最新アクティビティの新しさ）
+TITLE_WEIGHT = 0.7
+RECENCY_WEIGHT = 0.3
+
+# 最新アクティビティの新しさが半分になる日数
+RECENCY_HALF_LIFE_DAYS = 30
+
+# 英数字の単語と、それ以外（漢字・かななど）の連続
+_WORD_PATTERN = re.compile(r"[0-9a-z]+|[^\s0-9a-z\W]+")
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    """
+    照合用のトークンに分割する
+
+    英数字は単語単位、日本語は分かち書きせずに文字の2-gramとする
+
+    Args:
+        text: 案件名またはメッセージ
+
+    Returns:
+        トークンの集合
+    """
+    normalized = unicodedata.normalize("NFKC", text).casefold()
+    tokens = set()
+    for word in _WORD_PATTERN.findall(normalized):
+        if word.isascii() or len(word) == 1:
+            tokens.add(word)
+        else:
+            tokens.update(word[i : i + 2] for i in range(len(word) - 1))
+    return frozenset(tokens)
+
+
+class OpportunityCandidate(NamedTuple):
+    """案件の候補"""
+
+    opportunity_id: Any
+    customer_id: Any
+    title: str
+    last_activity_date: Optional[date]
+    title_tokens: FrozenSet[str]
+
+    @classmethod
+    def create(
+        cls,
+        opportunity_id: Any,
+        customer_id: Any,
+        title: str,
+        last_activity_date: Optional[date],
+    ) -> "OpportunityCandidate":
+        """案件名をトークンに分割して候補を作成する"""
+        return cls(
+            opportunity_id, customer_id, title, last_activity_date, tokenize(title)
+        )
+
+
+class ScoredOpportunity(NamedTuple):
+    """スコア付けした案件の候補"""
+
+    opportunity_id: Any
+    customer_id: Any
+    title: str
+    score: float
+    title_overlap: float
+    recency: float
+
+
+def _recency(last_activity_date: Optional[date], today: date) -> float:
+    """最新アクティビティの新しさ（当日を1とし、経過日数に応じて0に近づく）"""
+    if last_activity_date is None:
+        return 0.0
+    days = max((today - last_activity_date).days, 0)
+    return RECENCY_HALF_LIFE_DAYS / (RECENCY_HALF_LIFE_DAYS + days)
+
+
+def rank_opportunities(
+    candidates: Iterable[OpportunityCandidate],
+    text: str,
+    today: date,
+    customer_ids: Iterable[Any] = (),
+    top_k: int = 3,
+) -> List[ScoredOpportunity]:
+    """
+    メッセージが指す案件を推定する
+
+    Args:
+        candidates: 送信者が担当する案件の候補
+        text: メッセージテキスト
+        today: 最新アクティビティの新しさの基準日
+        customer_ids: メッセージから抽出した顧客ID（候補の顧客が一致するものに絞り込む）
+        top_k: 返す候補数
+
+    Returns:
+        スコアの高い順の候補（最大 top_k 件）
+    """
+    candidates = list(candidates)
+    customer_ids = set(customer_ids)
+    if customer_ids:
+        # 顧客が一致する候補がない場合は、担当案件全体から推定する
+        narrowed = [c for c in candidates if c.customer_id in customer_ids]
+        candidates = narrowed or candidates
+
+    message_tokens = tokenize(text)
+    scored = []
+    for candidate in candidates:
+        title_tokens = candidate.title_tokens
+        overlap = (
+            len(title_tokens & message_tokens) / len(title_tokens)
+            if title_tokens
+            else 0.0
+        )
+        recency = _recency(candidate.last_activity_date, today)
+        scored.append(
+            ScoredOpportunity(
+                opportunity_id=candidate.opportunity_id,
+                customer_id=candidate.customer_id,
+                title=candidate.title,
+                score=TITLE_WEIGHT * overlap + RECENCY_WEIGHT * recency,
+                title_overlap=overlap,
+                recency=recency,
+            )
+        )
+
+    return heapq.nlargest(top_k, scored, key=lambda opportunity: opportunity.score)
@@ -5,15 +5,129 @@
 営業担当者による顧客訪問、電話、メール等の活動履歴を記録します。
 """
 
-from fastapi import APIRouter, HTTPException, status
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.api.schemas import ActivityLogCreate, ActivityLogResponse
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import ValidationError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.api.schemas import (
+    ActivityLogBulkResponse,
+    ActivityLogCreate,
+    ActivityLogResponse,
+)
+from src.core.config import settings
 from src.core.logger import get_activity_logger
-from src.services.activity_service import create_activity_log
+from src.services.activity_service import create_activity_log, create_activity_logs_bulk
+from src.services.db_service import get_async_db_session
 
 router = APIRouter()
 logger = get_activity_logger()
 
+# 1行1件のJSON（NDJSON）として扱うContent-Type
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+class _InvalidLine:
+    """JSONとして解析できなかったNDJSONの行"""
+
+    def __init__(self, error: str):
+        self.error = error
+
+
+def _parse_ndjson_line(line: bytes) -> Any:
+    """NDJSONの1行を解析する（解析できない場合は _InvalidLine を返す）"""
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError as e:
+        return _InvalidLine(f"Invalid JSON: {e}")
+
+
+async def _read_bulk_rows(request: Request) -> List[Any]:
+    """
+    リクエストボディから一括登録する行を読み込む
+
+    JSON配列、またはContent-TypeがNDJSONの場合は1行1件のJSONとして読み込む。
+    NDJSONは受信したチャンクごとに行を解析し、ボディ全体を保持しない
+
+    Args:
+        request: FastAPIリクエストオブジェクト
+
+    Returns:
+        解析した行（NDJSONの空行は除く）
+
+    Raises:
+        HTTPException: ボディ・行数が上限を超える場合に413、
+            JSON配列として解析できない場合に400を返す
+    """
+    max_bytes = settings.ACTIVITY_LOG_BULK_MAX_BYTES
+    max_rows = settings.ACTIVITY_LOG_BULK_MAX_ROWS
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Bulk request exceeds {max_rows} rows or {max_bytes} bytes",
+    )
+
+    content_length = request.headers.get("Content-Length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise too_large
+
+    media_type = request.headers.get("Content-Type", "").split(";")[0].strip().lower()
+    ndjson = media_type in NDJSON_MEDIA_TYPES
+
+    rows: List[Any] = []
+    buffer = bytearray()
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise too_large
+        buffer.extend(chunk)
+        if ndjson:
+            *lines, rest = buffer.split(b"\n")
+            buffer = bytearray(rest)
+            rows.extend(_parse_ndjson_line(line) for line in lines if line.strip())
+            if len(rows) > max_rows:
+                raise too_large
+
+    if ndjson:
+        if buffer.strip():
+            rows.append(_parse_ndjson_line(bytes(buffer)))
+    else:
+        try:
+            rows = orjson.loads(bytes(buffer))
+        except orjson.JSONDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON"
+            )
+        if not isinstance(rows, list):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Request body must be a JSON array or NDJSON",
+            )
+
+    if len(rows) > max_rows:
+        raise too_large
+    return rows
+
+
+def _validate_row(row: Any) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    1行分のアクティビティログデータを検証する
+
+    Returns:
+        (検証済みのデータ, エラー内容) のどちらか一方
+    """
+    if isinstance(row, _InvalidLine):
+        return None, row.error
+    try:
+        return ActivityLogCreate.parse_obj(row).dict(), None
+    except ValidationError as e:
+        return None, "; ".join(
+            f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+            for error in e.errors()
+        )
+
 
 @router.post(
     "",
@@ -35,7 +149,10 @@ logger = get_activity_logger()
         404: {"description": "関連リソース（オポチュニティ、ユーザー、活動種別など）が見つかりません"},
     },
 )
-async def create_activity_log_endpoint(activity_data: ActivityLogCreate):
+async def create_activity_log_endpoint(
+    activity_data: ActivityLogCreate,
+    session: AsyncSession = Depends(get_async_db_session),
+):
     """
     アクティビティログを記録
 
@@ -48,7 +165,7 @@ async def create_activity_log_endpoint(activity_data: ActivityLogCreate):
     try:
         # Convert Pydantic model to dictionary
         activity_dict = activity_data.dict()
-        new_activity_id = await create_activity_log(activity_dict)
+        new_activity_id = await create_activity_log(activity_dict, session=session)
 
         logger.info(
             f"Created activity log: {new_activity_id}",
@@ -69,3 +186,57 @@ async def create_activity_log_endpoint(activity_data: ActivityLogCreate):
 
         logger.warning(f"Error creating activity log: {detail}")
         raise HTTPException(status_code=status_code, detail=detail)
+
+
+@router.post(
+    "/bulk",
+    response_model=ActivityLogBulkResponse,
+    summary="アクティビティログ一括作成",
+    description=(
+        "複数の営業活動の記録をまとめて作成します。"
+        "JSON配列、またはContent-Typeに application/x-ndjson を指定した"
+        "1行1件のJSON（NDJSON）で送信します。結果は行ごとに返します。"
+    ),
+    response_description="作成件数・失敗件数と行ごとの結果",
+    responses={
+        200: {"description": "すべての行を処理しました（行ごとの成否は results を参照）"},
+        400: {"description": "リクエストボディを解析できません"},
+        413: {"description": "行数またはボディのサイズが上限を超えています"},
+    },
+)
+async def create_activity_logs_bulk_endpoint(
+    request: Request,
+    session: AsyncSession = Depends(get_async_db_session),
+):
+    """
+    アクティビティログを一括で記録
+
+    Args:
+        request: FastAPIリクエストオブジェクト（JSON配列またはNDJSONのボディ）
+
+    Returns:
+        作成件数・失敗件数と行ごとの結果（index, status, id, error）
+    """
+    rows = await _read_bulk_rows(request)
+
+    results: List[Dict[str, Any]] = []
+    valid_rows: List[Tuple[int, Dict[str, Any]]] = []
+    for index, row in enumerate(rows):
+        data, error = _validate_row(row)
+        if data is None:
+            results.append(
+                {"index": index, "status": "invalid", "id": None, "error": error}
+            )
+        else:
+            valid_rows.append((index, data))
+
+    if valid_rows:
+        results.extend(await create_activity_logs_bulk(valid_rows, session=session))
+    results.sort(key=lambda result: result["index"])
+
+    created = sum(result["status"] == "created" for result in results)
+    logger.info(
+        "Processed bulk activity log request",
+        extra={"row_count": len(rows), "created_count": created},
+    )
+    return {"created": created, "failed": len(results) - created, "results": results}
@@ -8,11 +8,13 @@
 import uuid
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.api.schemas import NotificationRequest, NotificationResponse
 from src.core.logger import get_notification_logger
+from src.services.db_service import get_async_db_session
 from src.services.notification_service import (
     check_progress_notifications,
     send_kpi_notification,
@@ -40,6 +42,10 @@ logger = get_notification_logger()
                         "target_date": "2025-05-13",
                         "notifications_count": 3,
                         "notifications_sent": 2,
+                        "notifications_rate_limited": 0,
+                        "notifications_failed": 1,
+                        "notifications_skipped": 0,
+                        "notifications_timed_out": 0,
                         "notifications": [
                             {
                                 "user_id": "123e4567-e89b-12d3-a456-426614174000",
@@ -56,7 +62,10 @@ logger = get_notification_logger()
         500: {"description": "通知処理中にエラーが発生しました"},
     },
 )
-async def send_progress_notification(notification_data: NotificationRequest):
+async def send_progress_notification(
+    notification_data: NotificationRequest,
+    session: AsyncSession = Depends(get_async_db_session),
+):
     """
     進捗確認の通知を送信する内部API
 
@@ -69,18 +78,18 @@ async def send_progress_notification(notification_data: NotificationRequest):
     try:
         # サービスレイヤーに処理を委譲
         notifications_to_send = await check_progress_notifications(
-            notification_data.target_date
+            notification_data.target_date, session=session
         )
 
         # 実際の通知処理をサービスに委譲
-        success_count = await send_progress_notifications(notifications_to_send)
+        delivery = await send_progress_notifications(notifications_to_send)
 
         logger.info(
             "Progress notification process completed",
             extra={
                 "target_date": notification_data.target_date.isoformat(),
                 "notifications_count": len(notifications_to_send),
-                "success_count": success_count,
+                **delivery,
             },
         )
 
@@ -88,7 +97,11 @@ async def send_progress_notification(notification_data: NotificationRequest):
             "status": "completed",
             "target_date": notification_data.target_date,
             "notifications_count": len(notifications_to_send),
-            "notifications_sent": success_count,
+            "notifications_sent": delivery["sent"],
+            "notifications_rate_limited": delivery["rate_limited"],
+            "notifications_failed": delivery["failed"],
+            "notifications_skipped": delivery["skipped"],
+            "notifications_timed_out": delivery["timed_out"],
             "notifications": notifications_to_send,
         }
     except Exception as e:
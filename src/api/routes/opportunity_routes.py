@@ -5,29 +5,187 @@
 """
 
 from datetime import date
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Response, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, status
+from pydantic import ValidationError, parse_obj_as
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.api.schemas import (
+    OpportunityBulkResponse,
+    OpportunityBulkUpdate,
     OpportunityCreate,
     OpportunityResponse,
-    OpportunitySearchResponse,
+    OpportunitySearchPage,
     OpportunityUpdate,
 )
+from src.core.config import settings
 from src.core.logger import get_opportunity_logger
+from src.services.db_service import get_async_db_session
 from src.services.opportunity_service import (
+    DEFAULT_SEARCH_LIMIT,
+    create_opportunities_bulk,
     create_opportunity,
+    delete_opportunities_bulk,
     delete_opportunity,
     get_opportunity_by_id,
     search_opportunities,
+    update_opportunities_bulk,
     update_opportunity,
 )
 
 router = APIRouter()
 logger = get_opportunity_logger()
 
+# 検索で1ページに返す最大件数
+MAX_SEARCH_LIMIT = 500
+
+# 一括操作で失敗として数える結果
+BULK_FAILED_STATUSES = ("invalid", "not_found", "conflict", "error")
+
+BULK_RESPONSES = {
+    200: {"description": "すべての要素を処理しました（要素ごとの成否は results を参照）"},
+    413: {"description": "要素数が上限を超えています"},
+    422: {"description": "リクエストボディがJSON配列ではありません"},
+}
+
+
+def _validate_bulk_items(
+    items: List[Any], parse: Callable[[Any], Any]
+) -> Tuple[List[Tuple[int, Any]], List[Dict[str, Any]]]:
+    """
+    一括操作の要素を検証する
+
+    Args:
+        items: リクエストボディの要素
+        parse: 1要素を検証して変換する関数
+
+    Returns:
+        (検証済みの (位置, データ) のリスト, 検証エラーとなった要素の結果)
+
+    Raises:
+        HTTPException: 要素数が上限を超える場合に413を返す
+    """
+    max_items = settings.OPPORTUNITY_BULK_MAX_ITEMS
+    if len(items) > max_items:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Bulk request exceeds {max_items} items",
+        )
+
+    rows: List[Tuple[int, Any]] = []
+    invalid: List[Dict[str, Any]] = []
+    for index, item in enumerate(items):
+        try:
+            rows.append((index, parse(item)))
+        except ValidationError as e:
+            error = "; ".join(
+                f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            )
+            invalid.append(
+                {"index": index, "status": "invalid", "id": None, "error": error}
+            )
+    return rows, invalid
+
+
+def _bulk_response(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """要素ごとの結果を位置順に並べ、成功・失敗件数を集計する"""
+    results.sort(key=lambda result: result["index"])
+    failed = sum(result["status"] in BULK_FAILED_STATUSES for result in results)
+    return {"succeeded": len(results) - failed, "failed": failed, "results": results}
+
+
+# 一括操作は /{opportunity_id} に一致しないよう、IDを指定するエンドポイントより前に定義する
+@router.post(
+    "/bulk",
+    response_model=OpportunityBulkResponse,
+    summary="オポチュニティ一括作成",
+    description="複数のオポチュニティをまとめて作成します。オポチュニティ新規作成と同じ形式の要素のJSON配列を送信し、結果は要素ごとに返します。",
+    response_description="成功件数・失敗件数と要素ごとの結果",
+    responses=BULK_RESPONSES,
+)
+async def create_opportunities_bulk_endpoint(
+    items: List[Any] = Body(...),
+    session: AsyncSession = Depends(get_async_db_session),
+):
+    """
+    オポチュニティを一括で作成
+
+    Args:
+        items: オポチュニティ作成データの配列
+
+    Returns:
+        成功件数・失敗件数と要素ごとの結果（index, status, id, error）
+    """
+    rows, results = _validate_bulk_items(
+        items, lambda item: OpportunityCreate.parse_obj(item).dict()
+    )
+    if rows:
+        results.extend(await create_opportunities_bulk(rows, session=session))
+    return _bulk_response(results)
+
+
+@router.put(
+    "/bulk",
+    response_model=OpportunityBulkResponse,
+    summary="オポチュニティ一括更新",
+    description="複数のオポチュニティをまとめて更新します。要素には id と更新したいフィールドのみを指定できます。結果は要素ごとに返します。",
+    response_description="成功件数・失敗件数と要素ごとの結果",
+    responses=BULK_RESPONSES,
+)
+async def update_opportunities_bulk_endpoint(
+    items: List[Any] = Body(...),
+    session: AsyncSession = Depends(get_async_db_session),
+):
+    """
+    オポチュニティを一括で更新
+
+    Args:
+        items: id と更新するフィールドの配列
+
+    Returns:
+        成功件数・失敗件数と要素ごとの結果（index, status, id, error）
+    """
+    rows, results = _validate_bulk_items(
+        items, lambda item: OpportunityBulkUpdate.parse_obj(item).dict()
+    )
+    if rows:
+        results.extend(await update_opportunities_bulk(rows, session=session))
+    return _bulk_response(results)
+
+
+@router.delete(
+    "/bulk",
+    response_model=OpportunityBulkResponse,
+    summary="オポチュニティ一括削除",
+    description=(
+        "IDのJSON配列で指定した複数のオポチュニティをまとめて削除します。"
+        "アクティビティログが記録されているオポチュニティは削除しません。"
+        "結果は要素ごとに返します。"
+    ),
+    response_description="成功件数・失敗件数と要素ごとの結果",
+    responses=BULK_RESPONSES,
+)
+async def delete_opportunities_bulk_endpoint(
+    ids: List[Any] = Body(...),
+    session: AsyncSession = Depends(get_async_db_session),
+):
+    """
+    オポチュニティを一括で削除
+
+    Args:
+        ids: 削除するオポチュニティIDの配列
+
+    Returns:
+        成功件数・失敗件数と要素ごとの結果（index, status, id, error）
+    """
+    rows, results = _validate_bulk_items(ids, lambda item: parse_obj_as(UUID, item))
+    if rows:
+        results.extend(await delete_opportunities_bulk(rows, session=session))
+    return _bulk_response(results)
+
 
 @router.get(
     "/{opportunity_id}",
@@ -38,7 +196,9 @@ logger = get_opportunity_logger()
     response_description="オポチュニティの詳細情報",
     responses={404: {"description": "指定されたIDのオポチュニティが見つかりません"}},
 )
-async def get_opportunity(opportunity_id: UUID):
+async def get_opportunity(
+    opportunity_id: UUID, session: AsyncSession = Depends(get_async_db_session)
+):
     """
     指定されたIDのオポチュニティ詳細を取得
 
@@ -49,7 +209,7 @@ async def get_opportunity(opportunity_id: UUID):
         オポチュニティ詳細情報
     """
     try:
-        response = await get_opportunity_by_id(opportunity_id)
+        response = await get_opportunity_by_id(opportunity_id, session=session)
         logger.info(f"Retrieved opportunity: {opportunity_id}")
         return response
     except ValueError as e:
@@ -78,7 +238,10 @@ async def get_opportunity(opportunity_id: UUID):
         404: {"description": "関連リソース（顧客、ユーザー、ステージなど）が見つかりません"},
     },
 )
-async def create_opportunity_endpoint(opportunity_data: OpportunityCreate):
+async def create_opportunity_endpoint(
+    opportunity_data: OpportunityCreate,
+    session: AsyncSession = Depends(get_async_db_session),
+):
     """
     新規オポチュニティを作成
 
@@ -91,7 +254,7 @@ async def create_opportunity_endpoint(opportunity_data: OpportunityCreate):
     try:
         # Convert Pydantic model to dictionary
         opportunity_dict = opportunity_data.dict()
-        new_opportunity_id = await create_opportunity(opportunity_dict)
+        new_opportunity_id = await create_opportunity(opportunity_dict, session=session)
         logger.info(f"Created opportunity: {new_opportunity_id}")
         return {"id": str(new_opportunity_id)}
     except ValueError as e:
@@ -122,6 +285,7 @@ async def create_opportunity_endpoint(opportunity_data: OpportunityCreate):
 async def update_opportunity_endpoint(
     opportunity_id: UUID,
     update_data: OpportunityUpdate,
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     オポチュニティ情報を更新
@@ -136,7 +300,7 @@ async def update_opportunity_endpoint(
     try:
         # Convert Pydantic model to dictionary, excluding None values
         update_dict = {k: v for k, v in update_data.dict().items() if v is not None}
-        await update_opportunity(opportunity_id, update_dict)
+        await update_opportunity(opportunity_id, update_dict, session=session)
         logger.info(f"Updated opportunity: {opportunity_id}")
         return {"status": "updated"}
     except ValueError as e:
@@ -160,7 +324,9 @@ async def update_opportunity_endpoint(
         404: {"description": "指定されたIDのオポチュニティが見つかりません"},
     },
 )
-async def delete_opportunity_endpoint(opportunity_id: UUID):
+async def delete_opportunity_endpoint(
+    opportunity_id: UUID, session: AsyncSession = Depends(get_async_db_session)
+):
     """
     オポチュニティを削除
 
@@ -171,7 +337,7 @@ async def delete_opportunity_endpoint(opportunity_id: UUID):
         削除成功レスポンス
     """
     try:
-        await delete_opportunity(opportunity_id)
+        await delete_opportunity(opportunity_id, session=session)
         logger.info(f"Deleted opportunity: {opportunity_id}")
         return Response(status_code=status.HTTP_204_NO_CONTENT)
     except ValueError as e:
@@ -183,36 +349,43 @@ async def delete_opportunity_endpoint(opportunity_id: UUID):
 
 @router.get(
     "/search/",
-    response_model=List[OpportunitySearchResponse],
+    response_model=OpportunitySearchPage,
     status_code=status.HTTP_200_OK,
     summary="オポチュニティ検索",
     description="""
     指定された条件に基づきオポチュニティを検索します。
     複数の検索条件を組み合わせることで、柔軟な検索が可能です。
     すべての検索条件はオプショナルです。
+
+    結果は予想クロージング日・IDの昇順で最大 `limit` 件ずつ返します。
+    続きがある場合は `next_cursor` を `cursor` に指定して次ページを取得します。
     """,
-    response_description="検索条件に合致するオポチュニティのリスト",
+    response_description="検索条件に合致するオポチュニティのページ",
     responses={
         200: {
             "description": "検索結果",
             "content": {
                 "application/json": {
-                    "example": [
-                        {
-                            "id": "123e4567-e89b-12d3-a456-426614174000",
-                            "customer": {
-                                "id": "123e4567-e89b-12d3-a456-426614174001",
-                                "name": "サンプル顧客株式会社",
-                            },
-                            "title": "システム提案案件",
-                            "amount": 1000000,
-                            "stage": {"id": 2, "name": "提案中"},
-                            "expected_close_date": "2025-06-30",
-                        }
-                    ]
+                    "example": {
+                        "items": [
+                            {
+                                "id": "123e4567-e89b-12d3-a456-426614174000",
+                                "customer": {
+                                    "id": "123e4567-e89b-12d3-a456-426614174001",
+                                    "name": "サンプル顧客株式会社",
+                                },
+                                "title": "システム提案案件",
+                                "amount": 1000000,
+                                "stage": {"id": 2, "name": "提案中"},
+                                "expected_close_date": "2025-06-30",
+                            }
+                        ],
+                        "next_cursor": "MjAyNS0wNi0zMHwxMjNlNDU2Nw",
+                    }
                 }
             },
         },
+        400: {"description": "無効なカーソル"},
         500: {"description": "検索処理に失敗しました"},
     },
 )
@@ -224,6 +397,9 @@ async def search_opportunities_endpoint(
     to_date: Optional[date] = None,
     min_amount: Optional[int] = None,  # 金額下限（任意）
     max_amount: Optional[int] = None,  # 金額上限（任意）
+    limit: int = Query(default=DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_async_db_session),
 ):
     """
     オポチュニティを検索
@@ -236,16 +412,30 @@ async def search_opportunities_endpoint(
         to_date: 予想クロージング日終了
         min_amount: 金額下限（任意）
         max_amount: 金額上限（任意）
+        limit: 1ページあたりの最大件数
+        cursor: 前ページのnext_cursor
 
     Returns:
-        検索条件に合致するオポチュニティのリスト
+        検索条件に合致するオポチュニティのページ
     """
     try:
         result = await search_opportunities(
-            customer_id, title, stage_id, from_date, to_date, min_amount, max_amount
+            customer_id,
+            title,
+            stage_id,
+            from_date,
+            to_date,
+            min_amount,
+            max_amount,
+            limit=limit,
+            cursor=cursor,
+            session=session,
         )
-        logger.info(f"Search opportunities: found {len(result)} results")
+        logger.info(f"Search opportunities: found {len(result['items'])} results")
         return result
+    except ValueError as e:
+        logger.warning(f"Invalid search request: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"Error searching opportunities: {str(e)}")
         raise HTTPException(
@@ -5,15 +5,20 @@ Slack Event APIとの連携や、Slackへの通知送信のためのエンドポ
 Slackからのイベント受信、署名検証、および各種イベント処理を実装しています。
 """
 
+from typing import Any, Dict
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from slack_sdk.signature import SignatureVerifier
 
 from src.core.config import settings
 from src.core.logger import get_slack_logger
 from src.services.slack_service import (
+    enqueue_slack_event,
+    get_slack_metrics,
     handle_slack_verification_challenge,
-    process_slack_event,
 )
+from src.services.work_queue import QueueFullError
 
 router = APIRouter()
 logger = get_slack_logger()
@@ -22,22 +27,53 @@ logger = get_slack_logger()
 signature_verifier = SignatureVerifier(settings.SLACK_SIGNING_SECRET)
 
 
+async def _read_body(request: Request) -> bytes:
+    """
+    上限サイズまでリクエストボディを読み込む
+
+    Args:
+        request: FastAPIリクエストオブジェクト
+
+    Returns:
+        リクエストボディ
+
+    Raises:
+        HTTPException: ボディが上限サイズを超える場合に413を返す
+    """
+    max_bytes = settings.SLACK_MAX_BODY_BYTES
+
+    # Content-Lengthで判定できる場合は読み込む前に拒否する
+    content_length = request.headers.get("Content-Length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise HTTPException(status_code=413, detail="Slack request body too large")
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > max_bytes:
+            raise HTTPException(status_code=413, detail="Slack request body too large")
+    return bytes(body)
+
+
 # 署名検証用の依存関数
-async def verify_slack_signature(request: Request):
+async def verify_slack_signature(request: Request) -> Dict[str, Any]:
     """
-    Slackからのリクエストの署名を検証する
+    Slackからのリクエストの署名を検証し、ボディをJSONとして解析する
+
+    ボディの読み込みと解析はこの関数で1回だけ行い、署名検証に失敗した場合は解析しない
 
     Args:
         request: FastAPIリクエストオブジェクト
 
     Returns:
-        検証成功時には何も返さない
+        解析済みのイベントデータ
 
     Raises:
-        HTTPException: 署名検証失敗時に403を返す
+        HTTPException: ボディが大きすぎる場合に413、署名検証失敗時に403、
+            JSONとして解析できない場合に400を返す
     """
     # リクエストボディを読み込む
-    body = await request.body()
+    body = await _read_body(request)
 
     # X-Slack-Signatureヘッダーを取得
     signature = request.headers.get("X-Slack-Signature")
@@ -55,10 +91,19 @@ async def verify_slack_signature(request: Request):
         )
         raise HTTPException(status_code=403, detail="Invalid Slack signature")
 
+    # 署名検証済みのボディのみをJSONとして解析する
+    try:
+        event_data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid Slack request body")
+
+    if not isinstance(event_data, dict):
+        raise HTTPException(status_code=400, detail="Invalid Slack request body")
+    return event_data
+
 
 @router.post(
     "/events",
-    dependencies=[Depends(verify_slack_signature)],
     summary="Slack イベント受信エンドポイント",
     description="""
     Slack Event APIからのイベントを受信して処理するエンドポイント。
@@ -71,9 +116,12 @@ async def verify_slack_signature(request: Request):
     """,
     response_description="イベント処理結果",
     responses={
-        202: {"description": "イベントが正常に処理されました（非同期処理）"},
+        202: {"description": "イベントを受け付けました（バックグラウンドで処理）"},
         204: {"description": "イベントは受信しましたが、処理は行いませんでした"},
+        400: {"description": "リクエストボディをJSONとして解析できません"},
         403: {"description": "Slackの署名検証に失敗しました"},
+        413: {"description": "リクエストボディが大きすぎます"},
+        503: {"description": "処理待ちのイベントが上限に達しています（Slackが再送します）"},
         200: {
             "description": "URL検証チャレンジのレスポンス",
             "content": {
@@ -86,16 +134,16 @@ async def verify_slack_signature(request: Request):
         },
     },
 )
-async def slack_events(request: Request):
+async def slack_events(event_data: Dict[str, Any] = Depends(verify_slack_signature)):
     """
     Slack Event APIエンドポイント
 
     - URL検証チャレンジに応答
     - Slackイベントを受信して処理
-    """
-    # リクエストボディをJSONとして解析
-    event_data = await request.json()
 
+    Args:
+        event_data: 署名検証・解析済みのイベントデータ
+    """
     # Slackイベントタイプの確認
     event_type = event_data.get("type")
 
@@ -106,16 +154,36 @@ async def slack_events(request: Request):
 
     # イベントコールバックの処理
     if event_type == "event_callback":
-        # サービスレイヤーにイベント処理を委譲
-        processed = await process_slack_event(event_data)
-
-        # 処理されなかった場合は204
-        if not processed:
+        # 3秒以内に応答するため、イベントはキューに投入してワーカーで処理する
+        try:
+            accepted = await enqueue_slack_event(event_data)
+        except QueueFullError:
+            # 2xx以外を返すとSlackが時間をおいて再送する
+            return Response(status_code=503)
+
+        # 処理対象外の場合は204
+        if not accepted:
             return Response(status_code=204)
 
-        # 処理が完了した場合は202（非同期処理）
+        # 受け付けた場合は202（非同期処理）
         return Response(status_code=202)
 
     # その他のイベントタイプ
     logger.info(f"Unsupported Slack event type: {event_type}")
     return Response(status_code=204)
+
+
+@router.get(
+    "/metrics",
+    summary="Slack連携のメトリクス",
+    description="Slackイベントキューの深さ・処理段階ごとのレイテンシ、重複排除の件数、Slack APIレート制限の状態を返します。",
+    response_description="Slack連携のメトリクス",
+)
+async def slack_metrics():
+    """
+    Slack連携のメトリクスを取得する
+
+    Returns:
+        イベントキュー・重複排除・APIレート制限のメトリクス
+    """
+    return get_slack_metrics()
@@ -52,6 +52,30 @@ class OpportunityUpdate(BaseModel):
     expected_close_date: Optional[date] = None
 
 
+class OpportunityBulkUpdate(OpportunityUpdate):
+    """オポチュニティ一括更新の1件"""
+
+    id: UUID
+
+
+class OpportunityBulkResult(BaseModel):
+    """オポチュニティ一括操作の1件ごとの結果"""
+
+    index: int  # リクエスト内の位置（0始まり）
+    # created / updated / unchanged / deleted / invalid / not_found / conflict / error
+    status: str
+    id: Optional[UUID] = None
+    error: Optional[str] = None
+
+
+class OpportunityBulkResponse(BaseModel):
+    """オポチュニティ一括操作レスポンス"""
+
+    succeeded: int
+    failed: int
+    results: List[OpportunityBulkResult]
+
+
 class OpportunityResponse(BaseModel):
     """オポチュニティ詳細レスポンス"""
 
@@ -78,6 +102,13 @@ class OpportunitySearchResponse(BaseModel):
     expected_close_date: date
 
 
+class OpportunitySearchPage(BaseModel):
+    """オポチュニティ検索結果ページ"""
+
+    items: List[OpportunitySearchResponse]
+    next_cursor: Optional[str] = None
+
+
 class ActivityLogCreate(BaseModel):
     """アクティビティログ作成リクエスト"""
 
@@ -94,6 +125,23 @@ class ActivityLogResponse(BaseModel):
     id: UUID
 
 
+class ActivityLogBulkResult(BaseModel):
+    """アクティビティログ一括作成の行ごとの結果"""
+
+    index: int  # リクエスト内の行番号（0始まり）
+    status: str  # "created" / "invalid" / "not_found"
+    id: Optional[UUID] = None
+    error: Optional[str] = None
+
+
+class ActivityLogBulkResponse(BaseModel):
+    """アクティビティログ一括作成レスポンス"""
+
+    created: int
+    failed: int
+    results: List[ActivityLogBulkResult]
+
+
 class NotificationRequest(BaseModel):
     """通知リクエスト"""
 
@@ -117,4 +165,8 @@ class NotificationResponse(BaseModel):
     target_date: date
     notifications_count: int
     notifications_sent: int
+    notifications_rate_limited: int = 0
+    notifications_failed: int = 0
+    notifications_skipped: int = 0
+    notifications_timed_out: int = 0
     notifications: List[NotificationRecipient]
@@ -0,0 +1,147 @@
+"""
+インメモリキャッシュモジュール - 件数上限（LRU）と有効期限（TTL）付きのキャッシュを提供する
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# 値が存在しないことを表す番兵
+_MISSING = object()
+
+
+class TTLCache(Generic[K, V]):
+    """
+    件数上限と有効期限付きのLRUキャッシュ
+
+    上限を超えた場合は最も長く参照されていないエントリを破棄し、
+    有効期限を過ぎたエントリは参照時に破棄する。
+    イベントループ上での使用を前提とし、スレッドセーフではない
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: Optional[float],
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """
+        キャッシュの初期化
+
+        Args:
+            maxsize: 保持する最大件数
+            ttl: 有効期限（秒）。Noneの場合は期限なし
+            timer: 現在時刻を返す関数（テスト用）
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: K, default: Any = None) -> Any:
+        """
+        キャッシュから値を取得する
+
+        Args:
+            key: キー
+            default: 値が存在しない場合に返す値
+
+        Returns:
+            キャッシュされた値。存在しないか期限切れの場合はdefault
+        """
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at < self.timer():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        キャッシュに値を設定する
+
+        Args:
+            key: キー
+            value: 値
+        """
+        expires_at = self.timer() + self.ttl if self.ttl is not None else float("inf")
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def add(self, key: K, value: V) -> bool:
+        """
+        キーが存在しない場合のみ値を設定する
+
+        Args:
+            key: キー
+            value: 値
+
+        Returns:
+            値を設定した場合はTrue、既に有効な値が存在した場合はFalse
+        """
+        if key in self:
+            self._data.move_to_end(key)
+            return False
+        self.set(key, value)
+        return True
+
+    def delete(self, key: K) -> None:
+        """
+        キャッシュから値を削除する
+
+        Args:
+            key: キー
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """キャッシュをすべて削除する"""
+        self._data.clear()
+
+    def __contains__(self, key: object) -> bool:
+        """有効期限内の値が存在するかどうか（ヒット数には数えない）"""
+        entry = self._data.get(key, _MISSING)  # type: ignore[arg-type]
+        if entry is _MISSING:
+            return False
+        if entry[0] < self.timer():
+            del self._data[key]  # type: ignore[arg-type]
+            return False
+        return True
+
+    def __len__(self) -> int:
+        """保持している件数（期限切れで未破棄のエントリを含む）"""
+        return len(self._data)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        キャッシュのメトリクスを取得する
+
+        Returns:
+            件数・ヒット数・ミス数・ヒット率・破棄数
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
@@ -1,4 +1,4 @@
-from pydantic import BaseSettings, PostgresDsn
+from pydantic import BaseSettings
 
 
 class Settings(BaseSettings):
@@ -11,14 +11,53 @@ class Settings(BaseSettings):
     API_TIMEOUT: float = 30.0  # API呼び出しのタイムアウト（秒）
 
     # データベース
-    DATABASE_URL: PostgresDsn
+    DATABASE_URL: str  # PostgreSQL（ローカル検証ではsqlite:///も可）
+    DB_POOL_SIZE: int = 5  # プールに常時保持する接続数
+    DB_MAX_OVERFLOW: int = 10  # プールサイズを超えて一時的に確保できる接続数
+    DB_POOL_RECYCLE: int = 1800  # 接続を再作成するまでの秒数
+    DB_POOL_TIMEOUT: float = 30.0  # プールから接続を取得する際の待機上限（秒）
+    MASTER_CACHE_RELOAD_INTERVAL: int = 300  # ステージ・活動種別マスタを再読み込みする秒数
 
     # Slack
     SLACK_BOT_TOKEN: str
     SLACK_SIGNING_SECRET: str
+    SLACK_MAX_BODY_BYTES: int = 1048576  # 受け付けるSlackリクエストボディの上限（バイト）
+    SLACK_USER_CACHE_TTL: int = 3600  # Slackユーザー情報・ユーザー解決結果のキャッシュ秒数
+    SLACK_USER_CACHE_MAX_SIZE: int = 10000  # Slackユーザー情報をキャッシュする最大件数
+    SLACK_EVENT_WORKERS: int = 4  # Slackイベントを処理するワーカー数
+    SLACK_EVENT_QUEUE_MAX_DEPTH: int = 1000  # 処理待ちイベントの上限
+    SLACK_EVENT_ENQUEUE_TIMEOUT: float = 1.0  # キュー満杯時に投入を待機する秒数
+    SLACK_EVENT_DRAIN_TIMEOUT: float = 10.0  # 終了時に残りのイベント処理を待つ秒数
+    SLACK_EVENT_DEDUP_TTL: int = 3600  # 受信済みイベントを記録しておく秒数
+    SLACK_EVENT_DEDUP_MAX_SIZE: int = 10000  # メモリに保持する受信記録の最大件数
+    SLACK_EVENT_DEDUP_USE_DB: bool = False  # 複数ワーカー構成ではDBでも重複排除する
+
+    # メッセージ解析
+    CUSTOMER_INDEX_RELOAD_INTERVAL: int = 600  # 顧客名の索引を顧客マスタから再読み込みする秒数
+    OPPORTUNITY_MATCH_TOP_K: int = 3  # メッセージが指す案件として返す候補数
+    OPPORTUNITY_CANDIDATE_CACHE_TTL: int = 300  # 担当者ごとの案件候補のキャッシュ秒数
+    OPPORTUNITY_CANDIDATE_CACHE_MAX_SIZE: int = 10000  # 案件候補をキャッシュする担当者数
+    ACTIVITY_PIPELINE_STAGE_TIMEOUT: float = 30.0  # 取り込みパイプラインの1段階のタイムアウト（秒）
+
+    # アクティビティログ一括登録
+    ACTIVITY_LOG_BULK_MAX_ROWS: int = 5000  # 1リクエストで登録できる行数の上限
+    ACTIVITY_LOG_BULK_MAX_BYTES: int = 10485760  # 1リクエストのボディの上限（バイト）
+
+    # オポチュニティ一括操作
+    OPPORTUNITY_BULK_MAX_ITEMS: int = 5000  # 1リクエストで作成・更新・削除できる件数の上限
 
     # OpenAI
     OPENAI_API_KEY: str
+    OPENAI_API_BASE: str = "https://api.openai.com/v1"  # テストではフェイクLLMサーバーを指定
+    OPENAI_MODEL: str = "gpt-3.5-turbo"
+    OPENAI_TIMEOUT: float = 20.0  # 1回のLLM呼び出しのタイムアウト（秒）
+    OPENAI_MAX_CONNECTIONS: int = 10  # LLM呼び出しで共有する接続プールの最大接続数
+    EXTRACTION_CONFIDENCE_THRESHOLD: float = 0.75  # この確信度未満の抽出結果をLLMで補完
+    EXTRACTION_LLM_CACHE_MAX_SIZE: int = 10000  # LLMの応答をキャッシュする件数
+    EXTRACTION_LLM_CACHE_TTL: int = 86400  # LLMの応答のキャッシュ秒数
+    EXTRACTION_BATCH_MAX_SIZE: int = 8  # LLMにまとめて問い合わせる件数の上限
+    EXTRACTION_BATCH_MAX_WAIT_MS: int = 50  # LLMへの問い合わせをまとめる待ち時間（ミリ秒）
+    EXTRACTION_BATCH_MODE: str = "prompt"  # "prompt"（1リクエスト）/ "concurrent"（並行）
 
     # スケジューラー
     SCHEDULER_TIMEZONE: str = "Asia/Tokyo"
@@ -28,6 +67,9 @@ class Settings(BaseSettings):
     # 通知条件
     NOTIFICATION_INACTIVITY_DAYS: int = 3  # この日数以上アクティビティがない場合に通知
     NOTIFICATION_RETRY_DAYS: int = 2  # 通知後、この日数経過で再通知
+    NOTIFICATION_DIGEST_ENABLED: bool = True  # 担当者ごとに案件をまとめて1通で通知する
+    NOTIFICATION_SEND_CONCURRENCY: int = 10  # 進捗確認通知の同時送信数
+    NOTIFICATION_SEND_DEADLINE: float = 25.0  # 進捗確認通知の送信期限（秒、API_TIMEOUT未満）
 
     # Slack通知
     SLACK_NOTIFICATION_CHANNEL: str = ""  # 特定のチャンネルに通知する場合（空欄ならDM）
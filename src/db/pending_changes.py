@@ -0,0 +1,80 @@
+"""
+コミット後に反映する変更の管理
+
+ORMのイベントで記録した変更をセッションごと（session.info）に保持し、
+コミット後にまとめて反映する。ロールバックされた変更は破棄する
+"""
+
+from typing import Any, Callable, Iterable, List
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+# 変更が記録されていないことを表す番兵
+_MISSING = object()
+
+
+class PendingChanges:
+    """
+    コミット後に反映する変更
+
+    記録した変更はセッションごとに集合（または辞書）へ蓄積し、
+    コミット後に反映関数へまとめて渡す
+    """
+
+    def __init__(
+        self,
+        key: str,
+        apply: Callable[[Any], None],
+        factory: Callable[[], Any] = set,
+    ):
+        """
+        コミット後に反映する変更の登録
+
+        Args:
+            key: 変更を保持するsession.infoのキー
+            apply: コミットされた変更を反映する関数
+            factory: 変更を蓄積するコンテナ（update() を持つ集合・辞書）を作る関数
+        """
+        self.key = key
+        self.apply = apply
+        self.factory = factory
+        _registry.append(self)
+
+    def record(self, target: Any, changes: Iterable[Any] = ()) -> None:
+        """
+        変更をコミット後に反映するよう記録する
+
+        セッションに属さないオブジェクトの変更は即座に反映する
+
+        Args:
+            target: 変更されたORMオブジェクト
+            changes: 記録する変更（コンテナの update() に渡す）
+        """
+        session = object_session(target)
+        if session is None:
+            pending = self.factory()
+            pending.update(changes)
+            self.apply(pending)
+        else:
+            session.info.setdefault(self.key, self.factory()).update(changes)
+
+
+# 登録されたコミット後に反映する変更
+_registry: List[PendingChanges] = []
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_changes(session: Session) -> None:
+    """コミットされた変更を反映する"""
+    for pending in _registry:
+        changes = session.info.pop(pending.key, _MISSING)
+        if changes is not _MISSING:
+            pending.apply(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_changes(session: Session) -> None:
+    """ロールバックされた変更を破棄する"""
+    for pending in _registry:
+        session.info.pop(pending.key, None)
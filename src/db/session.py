@@ -1,43 +1,106 @@
-from typing import Generator
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
 
-from sqlmodel import Session, SQLModel, create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.core.config import settings
 from src.core.logger import get_app_logger
 
 logger = get_app_logger()
 
-# データベースエンジンの作成
-engine = create_engine(
-    str(settings.DATABASE_URL),
+# 同期ドライバのURLスキームと対応する非同期ドライバ
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """
+    データベースURLを非同期ドライバ用のURLに変換する
+
+    Args:
+        url: 設定されたデータベースURL
+
+    Returns:
+        asyncpg / aiosqlite を使用するURL
+    """
+    scheme, sep, rest = url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+def get_pool_options(url: str) -> Dict[str, Any]:
+    """
+    コネクションプールの設定を取得する
+
+    SQLiteはプールサイズの指定に対応しないため、PostgreSQLの場合のみ設定する
+
+    Args:
+        url: 非同期ドライバ用のデータベースURL
+
+    Returns:
+        create_async_engineに渡すプール設定
+    """
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+
+
+# 非同期データベースエンジンの作成
+ASYNC_DATABASE_URL = to_async_url(str(settings.DATABASE_URL))
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
     echo=settings.DEBUG,  # DEBUGモードの場合はSQL文を表示
     pool_pre_ping=True,  # 接続状態を事前確認
+    **get_pool_options(ASYNC_DATABASE_URL),
+)
+
+# 非同期セッションファクトリ（コミット後も属性を参照できるよう期限切れにしない）
+async_session_factory = sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
 )
 
 
-def create_db_and_tables() -> None:
+async def create_db_and_tables() -> None:
     """データベースとテーブルを作成"""
     logger.info("Creating database tables")
-    SQLModel.metadata.create_all(engine)
+    async with async_engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+
+async def dispose_engine() -> None:
+    """コネクションプールを破棄し、保持している接続をすべて返却する"""
+    logger.info("Disposing database engine")
+    await async_engine.dispose()
 
 
-def get_session() -> Generator[Session, None, None]:
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[AsyncSession]:
     """
-    データベースセッションを取得するジェネレータ関数
+    非同期データベースセッションのスコープを提供するコンテキストマネージャ
 
-    FastAPIの依存性注入で使用される
+    接続はプールから最初のクエリ時に取得し、コミットまたはスコープ終了時に返却する。
+    例外発生時と未コミットの変更はロールバックされる。
 
     Yields:
-        Session: SQLModelのセッション
+        AsyncSession: SQLModelの非同期セッション
     """
-    with Session(engine) as session:
-        try:
-            yield session
-        except Exception as e:
-            logger.error(
-                f"Database session error: {str(e)}", extra={"exception": str(e)}
-            )
-            session.rollback()
-            raise
-        finally:
-            session.close()
+    session = async_session_factory()
+    try:
+        yield session
+    except Exception as e:
+        logger.error(f"Database session error: {str(e)}", extra={"exception": str(e)})
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
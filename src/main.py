@@ -4,7 +4,10 @@ from fastapi import FastAPI
 from src.api.api import api_router
 from src.core.config import settings
 from src.core.logger import get_app_logger
-from src.db.session import create_db_and_tables
+from src.db.session import create_db_and_tables, dispose_engine
+from src.services.master_cache_service import warm_master_cache
+from src.services.slack_service import start_slack_event_queue, stop_slack_event_queue
+from src.services.user_service import warm_slack_user_cache
 
 logger = get_app_logger()
 
@@ -62,16 +65,22 @@ app = FastAPI(
 
 
 @app.on_event("startup")
-def startup_event() -> None:
+async def startup_event() -> None:
     """アプリケーション起動時の初期化処理"""
     logger.info("Application startup")
-    create_db_and_tables()
+    await create_db_and_tables()
+    await warm_master_cache()
+    await warm_slack_user_cache()
+    await start_slack_event_queue()
 
 
 @app.on_event("shutdown")
-def shutdown_event() -> None:
+async def shutdown_event() -> None:
     """アプリケーション終了時の処理"""
     logger.info("Application shutdown")
+    # 受付済みのSlackイベントを処理し終えてからDB接続を破棄する
+    await stop_slack_event_queue()
+    await dispose_engine()
 
 
 @app.get("/")
@@ -1,6 +1,7 @@
 from src.models.base import TimestampMixin, UUIDMixin
 from src.models.entity import ActivityLog, Customer, Opportunity, OpportunityUser, User
 from src.models.master import ActivityType, Stage
+from src.models.slack import SlackEventReceipt
 
 __all__ = [
     "TimestampMixin",
@@ -12,4 +13,5 @@ __all__ = [
     "OpportunityUser",
     "ActivityType",
     "ActivityLog",
+    "SlackEventReceipt",
 ]
@@ -1,6 +1,8 @@
 from datetime import date, datetime
+from typing import Optional
 from uuid import UUID
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 from src.models.base import TimestampMixin, UUIDMixin
@@ -41,8 +43,11 @@ class Opportunity(UUIDMixin, SQLModel, table=True):
     customer_id: UUID = Field(foreign_key="customer.id")
     title: str
     amount: float
-    stage_id: int = Field(foreign_key="stage.id")
-    expected_close_date: date
+    stage_id: int = Field(foreign_key="stage.id", index=True)
+    expected_close_date: date = Field(index=True)
+    # 最新アクティビティ（activity_logへの書き込み時に更新する非正規化項目）
+    last_activity_date: Optional[date] = Field(default=None, index=True)
+    last_activity_id: Optional[UUID] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -57,9 +62,13 @@ class OpportunityUser(UUIDMixin, TimestampMixin, SQLModel, table=True):
     """オポチュニティ担当者（中間テーブル）"""
 
     __tablename__ = "opportunity_user"
+    __table_args__ = (
+        # 案件ごとのオーナー/コラボレーター取得用
+        Index("ix_opportunity_user_opportunity_id_role", "opportunity_id", "role"),
+    )
 
     opportunity_id: UUID = Field(foreign_key="opportunity.id")
-    user_id: UUID = Field(foreign_key="user.id")
+    user_id: UUID = Field(foreign_key="user.id", index=True)
     role: str  # "owner" or "collaborator"
 
     # リレーションシップ
@@ -71,6 +80,14 @@ class ActivityLog(UUIDMixin, TimestampMixin, SQLModel, table=True):
     """アクティビティログ"""
 
     __tablename__ = "activity_log"
+    __table_args__ = (
+        # 案件ごとの最終活動日の集計・活動履歴取得用
+        Index(
+            "ix_activity_log_opportunity_id_action_date",
+            "opportunity_id",
+            "action_date",
+        ),
+    )
 
     opportunity_id: UUID = Field(foreign_key="opportunity.id")
     user_id: UUID = Field(foreign_key="user.id")
@@ -0,0 +1,12 @@
+from sqlmodel import Field, SQLModel
+
+from src.models.base import TimestampMixin
+
+
+class SlackEventReceipt(TimestampMixin, SQLModel, table=True):
+    """受信済みSlackイベント（複数ワーカー間での重複排除用）"""
+
+    __tablename__ = "slack_event_receipt"
+
+    # "event:<event_id>" または "message:<channel>:<ts>"
+    event_key: str = Field(primary_key=True)
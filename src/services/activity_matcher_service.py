@@ -0,0 +1,126 @@
+"""
+活動種別マッチャーサービス
+
+マスタキャッシュのアクティビティ種別から活動種別マッチャーを構築し、Slackハンドラに設定する。
+マッチャーはアクティビティ種別が変更されたときだけ再構築する
+"""
+
+from typing import Any, Dict, Optional
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.agents.activity_matcher import ActivityTypeMatcher
+from src.core.logger import get_app_logger
+from src.db.session import session_scope
+from src.services.master_cache_service import MasterCache, MasterRecord, master_cache
+from src.slack.handlers import slack_event_handler
+
+logger = get_app_logger()
+
+
+class ActivityTypeMatcherProvider:
+    """
+    マスタキャッシュのアクティビティ種別から構築した活動種別マッチャーを保持する
+
+    マスタキャッシュが読み込み直され、アクティビティ種別が変わっていれば
+    次回の取得時に再構築する。それ以外は構築済みのマッチャーを返す
+    """
+
+    def __init__(self, cache: MasterCache):
+        """
+        プロバイダの初期化
+
+        Args:
+            cache: アクティビティ種別を取得するマスタキャッシュ
+        """
+        self.cache = cache
+        self.matcher: Optional[ActivityTypeMatcher] = None
+        self.rebuilds = 0
+        # 構築に使ったマスタキャッシュのバージョンとアクティビティ種別
+        self.version: Optional[int] = None
+        self._activity_types: Dict[int, MasterRecord] = {}
+
+    @property
+    def stale(self) -> bool:
+        """未構築、またはマスタキャッシュの読み込みが必要・読み込み直された状態か"""
+        return (
+            self.matcher is None
+            or self.cache.expired
+            or self.version != self.cache.version
+        )
+
+    async def get_matcher(self, session: AsyncSession) -> ActivityTypeMatcher:
+        """
+        活動種別マッチャーを取得する（アクティビティ種別が変更されていれば再構築する）
+
+        Args:
+            session: データベースセッション（マスタキャッシュの読み込みが必要な場合のみ使用）
+
+        Returns:
+            活動種別マッチャー
+        """
+        await self.cache.refresh(session)
+        if not self.stale:
+            return self.matcher
+
+        # 定期的な読み込み直しでアクティビティ種別が変わっていなければ再構築しない
+        activity_types = self.cache.activity_types
+        if self.matcher is None or activity_types != self._activity_types:
+            self.matcher = ActivityTypeMatcher(
+                [
+                    (record.id, record.name)
+                    for record in activity_types.values()
+                    if record.is_active
+                ]
+            )
+            self.rebuilds += 1
+            logger.info(
+                "Activity type matcher built",
+                extra={
+                    "activity_type_count": len(self.matcher.activity_types),
+                    "keyword_count": self.matcher.keyword_count,
+                },
+            )
+        self.version = self.cache.version
+        self._activity_types = activity_types
+        return self.matcher
+
+    def invalidate(self) -> None:
+        """次回の取得時にマッチャーを再構築させる"""
+        self.version = None
+        self._activity_types = {}
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        マッチャーのメトリクスを取得する
+
+        Returns:
+            再構築回数と登録されている活動種別・キーワードの数
+        """
+        return {
+            "rebuilds": self.rebuilds,
+            "activity_types": len(self.matcher.activity_types) if self.matcher else 0,
+            "keywords": self.matcher.keyword_count if self.matcher else 0,
+        }
+
+
+# シングルトンインスタンス
+activity_type_matcher_provider = ActivityTypeMatcherProvider(master_cache)
+
+
+async def refresh_activity_type_matcher() -> None:
+    """
+    マスタが変更されていれば活動種別マッチャーを再構築し、Slackハンドラに設定する
+
+    未変更の場合はDBに問い合わせない。再構築に失敗した場合は構築済みのマッチャーを使い続ける
+    """
+    provider = activity_type_matcher_provider
+    if not provider.stale:
+        return
+
+    try:
+        async with session_scope() as session:
+            slack_event_handler.activity_matcher = await provider.get_matcher(session)
+    except Exception as e:
+        provider.invalidate()
+        logger.warning("Failed to build activity type matcher", extra={"error": str(e)})
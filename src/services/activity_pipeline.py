@@ -0,0 +1,270 @@
+"""
+Slackメッセージの取り込みパイプライン
+
+Slackメッセージから営業活動を抽出し、アクティビティログとして記録する。
+送信者の解決 → 活動情報の抽出 → 案件の推定 → 入力検証 → 記録 の各段階を順に実行し、
+段階ごとの処理時間を記録する。記録以外の各段階はタイムアウト付きで実行し、
+ワーカーの停止などでキャンセルされた場合は以降の段階を実行しない
+"""
+
+import asyncio
+import time
+from collections import Counter
+from datetime import date, datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.core.logger import get_activity_logger
+from src.services.activity_service import create_activity_log
+from src.services.opportunity_matcher_service import match_opportunities
+from src.services.user_service import slack_user_resolver
+from src.services.work_queue import LatencyStats
+
+logger = get_activity_logger()
+
+# 処理段階（実行順）
+STAGES = ("resolve_user", "extract", "match_opportunity", "validate", "persist")
+
+# タイムアウトを適用しない段階
+# 記録はコミットの途中で打ち切ると、記録できたかどうかが分からなくなるため最後まで実行する
+UNTIMED_STAGES = ("persist",)
+
+# 処理結果
+STATUS_CREATED = "created"
+STATUS_UNKNOWN_USER = "unknown_user"
+STATUS_NO_ACTIVITY = "no_activity"
+STATUS_NO_OPPORTUNITY = "no_opportunity"
+STATUS_INVALID = "invalid"
+STATUS_TIMEOUT = "timeout"
+
+
+class IngestionResult(NamedTuple):
+    """メッセージの取り込み結果"""
+
+    status: str
+    # 作成したアクティビティログのID（記録しなかった場合はNone）
+    activity_log_id: Optional[UUID]
+    # 最後に実行した段階
+    stage: str
+    # 記録しなかった理由
+    reason: Optional[str]
+    # 段階ごとの処理時間（秒）
+    timings: Dict[str, float]
+
+
+class _StopIngestion(Exception):
+    """段階の結果によりメッセージの取り込みを打ち切る場合の例外"""
+
+    def __init__(self, status: str, reason: str):
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+
+
+class ActivityIngestionPipeline:
+    """
+    Slackメッセージをアクティビティログとして記録するパイプライン
+    """
+
+    def __init__(self, handler: Any, stage_timeout: float, timezone: str):
+        """
+        パイプラインの初期化
+
+        Args:
+            handler: 活動情報を抽出するSlackハンドラ
+                （process_message_event で抽出結果を返すもの）
+            stage_timeout: 1段階あたりのタイムアウト（秒）（記録の段階には適用しない）
+            timezone: 投稿日時から活動日の基準日を決めるタイムゾーン名
+        """
+        self.handler = handler
+        self.stage_timeout = stage_timeout
+        self.timezone = ZoneInfo(timezone)
+        self.stage_latency = {stage: LatencyStats() for stage in STAGES}
+        self.total_latency = LatencyStats()
+        self.statuses: Counter = Counter()
+
+    def _stages(
+        self,
+    ) -> List[Tuple[str, Callable[[Dict[str, Any], AsyncSession], Awaitable[None]]]]:
+        """処理段階と実行する関数"""
+        return [
+            ("resolve_user", self._resolve_user),
+            ("extract", self._extract),
+            ("match_opportunity", self._match_opportunity),
+            ("validate", self._validate),
+            ("persist", self._persist),
+        ]
+
+    async def run(
+        self, event_data: Dict[str, Any], session: AsyncSession
+    ) -> IngestionResult:
+        """
+        メッセージイベントを取り込む
+
+        Args:
+            event_data: Slackから受信したイベントデータ
+                （event に user, text, channel, ts を含むメッセージイベント）
+            session: データベースセッション
+
+        Returns:
+            取り込み結果
+        """
+        event = event_data["event"]
+        state: Dict[str, Any] = {"event": event, "event_data": event_data}
+        timings: Dict[str, float] = {}
+        status, reason, stage = STATUS_CREATED, None, STAGES[0]
+        started = time.perf_counter()
+        try:
+            for stage, run_stage in self._stages():
+                stage_started = time.perf_counter()
+                try:
+                    if stage in UNTIMED_STAGES:
+                        await run_stage(state, session)
+                    else:
+                        await asyncio.wait_for(
+                            run_stage(state, session), timeout=self.stage_timeout
+                        )
+                finally:
+                    # キャンセル・タイムアウトした段階も処理時間を記録する
+                    elapsed = time.perf_counter() - stage_started
+                    timings[stage] = elapsed
+                    self.stage_latency[stage].record(elapsed)
+        except _StopIngestion as stop:
+            status, reason = stop.status, stop.reason
+        except asyncio.TimeoutError:
+            status, reason = STATUS_TIMEOUT, f"{stage} timed out"
+        finally:
+            self.total_latency.record(time.perf_counter() - started)
+
+        self.statuses[status] += 1
+        logger.info(
+            "Ingested Slack message",
+            extra={
+                "status": status,
+                "stage": stage,
+                "reason": reason,
+                "ts": event.get("ts"),
+                "timings_ms": {k: round(v * 1000, 3) for k, v in timings.items()},
+            },
+        )
+        return IngestionResult(
+            status, state.get("activity_log_id"), stage, reason, timings
+        )
+
+    async def _resolve_user(self, state: Dict[str, Any], session: AsyncSession) -> None:
+        """送信者のSlack ユーザーIDをユーザーに解決する"""
+        slack_id = state["event"]["user"]
+        user = await slack_user_resolver.resolve_user(slack_id, session)
+        if user is None:
+            raise _StopIngestion(STATUS_UNKNOWN_USER, f"Unknown Slack user: {slack_id}")
+        state["user"] = user
+
+    async def _extract(self, state: Dict[str, Any], session: AsyncSession) -> None:
+        """メッセージから活動情報を抽出する"""
+        event = state["event"]
+        activity_info = await self.handler.process_message_event(
+            user_id=event["user"],
+            text=event["text"],
+            channel=event.get("channel"),
+            ts=event.get("ts"),
+            event_data=state["event_data"],
+        )
+        if not activity_info:
+            raise _StopIngestion(STATUS_NO_ACTIVITY, "No activity in message")
+        state["activity_info"] = activity_info
+
+    async def _match_opportunity(
+        self, state: Dict[str, Any], session: AsyncSession
+    ) -> None:
+        """メッセージが指す案件を推定する"""
+        activity_info = state["activity_info"]
+        if activity_info.get("customer_id"):
+            customer_ids = {activity_info["customer_id"]}
+        else:
+            customer_ids = {
+                candidate["id"]
+                for candidate in activity_info.get("customer_candidates", ())
+            }
+
+        matches = await match_opportunities(
+            state["user"]["id"],
+            state["event"]["text"],
+            session,
+            customer_ids=customer_ids,
+            today=self._reference_date(state["event"]),
+        )
+        if not matches:
+            raise _StopIngestion(STATUS_NO_OPPORTUNITY, "User has no opportunities")
+
+        top = matches[0]
+        # 案件名も顧客も一致しない場合は、最新アクティビティの新しさだけで推定しない
+        if top.title_overlap == 0 and str(top.customer_id) not in customer_ids:
+            raise _StopIngestion(STATUS_NO_OPPORTUNITY, "No opportunity matched")
+        if len(matches) > 1 and matches[1].score == top.score:
+            raise _StopIngestion(STATUS_NO_OPPORTUNITY, "Opportunity is ambiguous")
+        state["opportunity"] = top
+
+    async def _validate(self, state: Dict[str, Any], session: AsyncSession) -> None:
+        """アクティビティログの入力を作成して検証する"""
+        activity_info = state["activity_info"]
+        if activity_info.get("activity_type_id") is None:
+            raise _StopIngestion(STATUS_INVALID, "Activity type is not specified")
+
+        reference_date = self._reference_date(state["event"])
+        # 日付表現がない場合は投稿日を活動日とする
+        action_date = (
+            date.fromisoformat(activity_info["date"])
+            if activity_info.get("date")
+            else reference_date
+        )
+        if action_date > reference_date:
+            # 投稿日より後の日付は予定であり、実施した活動ではない
+            raise _StopIngestion(
+                STATUS_INVALID, f"Action date is in the future: {action_date}"
+            )
+
+        state["activity_data"] = {
+            "opportunity_id": state["opportunity"].opportunity_id,
+            "user_id": state["user"]["id"],
+            "activity_type_id": activity_info["activity_type_id"],
+            "action_date": action_date,
+            "comment": state["event"]["text"],
+        }
+
+    async def _persist(self, state: Dict[str, Any], session: AsyncSession) -> None:
+        """アクティビティログを記録する"""
+        try:
+            state["activity_log_id"] = await create_activity_log(
+                state["activity_data"], session
+            )
+        except ValueError as e:
+            # 推定後に案件・ユーザー・活動種別が削除された場合
+            raise _StopIngestion(STATUS_INVALID, str(e)) from e
+
+    def _reference_date(self, event: Dict[str, Any]) -> date:
+        """メッセージの投稿日（タイムゾーンの日付）を取得する"""
+        ts = event.get("ts")
+        posted_at = (
+            datetime.fromtimestamp(float(ts), tz=timezone.utc)
+            if ts
+            else datetime.now(timezone.utc)
+        )
+        return posted_at.astimezone(self.timezone).date()
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        パイプラインのメトリクスを取得する
+
+        Returns:
+            処理結果ごとの件数と、段階ごと・全体のレイテンシ統計
+        """
+        return {
+            "statuses": dict(self.statuses),
+            "stages": {
+                stage: stats.snapshot() for stage, stats in self.stage_latency.items()
+            },
+            "total": self.total_latency.snapshot(),
+        }
@@ -2,26 +2,29 @@
 アクティビティログ関連サービス
 """
 
-from datetime import date
-from uuid import UUID
+from datetime import date, datetime
+from typing import Any, Dict, List, Sequence, Tuple
+from uuid import UUID, uuid4
 
-from sqlmodel import Session
+from sqlalchemy import bindparam, func, insert, or_, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.core.logger import get_activity_logger
-from src.db.session import get_session
 from src.models.entity import ActivityLog, Opportunity, User
-from src.models.master import ActivityType
+from src.services.db_service import BULK_CHUNK_SIZE, fetch_existing_ids
+from src.services.master_cache_service import master_cache
 
 logger = get_activity_logger()
 
 
-async def create_activity_log(activity_data: dict, session: Session = None) -> UUID:
+async def create_activity_log(activity_data: dict, session: AsyncSession) -> UUID:
     """
     アクティビティログを記録
 
     Args:
         activity_data: アクティビティログデータ
-        session: データベースセッション (省略可能)
+        session: データベースセッション
 
     Returns:
         作成されたアクティビティログのID
@@ -29,9 +32,6 @@ async def create_activity_log(activity_data: dict, session: Session = None) -> U
     Raises:
         ValueError: 必須フィールドがない、または参照先が存在しない場合
     """
-    # セッションがない場合は新しく取得
-    if session is None:
-        session = get_session()
     # 必須フィールドを確認
     required_fields = [
         "opportunity_id",
@@ -46,38 +46,59 @@ async def create_activity_log(activity_data: dict, session: Session = None) -> U
 
     # オポチュニティが存在するか確認
     opportunity_id = activity_data["opportunity_id"]
-    opportunity = session.get(Opportunity, opportunity_id)
+    opportunity = await session.get(Opportunity, opportunity_id)
     if not opportunity:
         logger.warning(f"Opportunity not found: {activity_data['opportunity_id']}")
         raise ValueError(f"Opportunity not found: {activity_data['opportunity_id']}")
 
     # ユーザーが存在するか確認
     user_id = activity_data["user_id"]
-    user = session.get(User, user_id)
+    user = await session.get(User, user_id)
     if not user:
         logger.warning(f"User not found: {activity_data['user_id']}")
         raise ValueError(f"User not found: {activity_data['user_id']}")
 
-    # アクティビティタイプが存在するか確認
-    activity_type = session.get(ActivityType, activity_data["activity_type_id"])
+    # アクティビティタイプが存在するか確認（マスタキャッシュを参照）
+    activity_type = await master_cache.get_activity_type(
+        activity_data["activity_type_id"], session
+    )
     if not activity_type:
         logger.warning(f"Activity type not found: {activity_data['activity_type_id']}")
         raise ValueError(
             f"Activity type not found: {activity_data['activity_type_id']}"
         )
 
+    action_date = activity_data["action_date"]
+    if isinstance(action_date, str):
+        action_date = date.fromisoformat(action_date)
+
     # アクティビティログを作成
     new_activity = ActivityLog(
         opportunity_id=opportunity_id,  # 既に変換済みの値を使用
         user_id=user_id,  # 既に変換済みの値を使用
         activity_type_id=activity_data["activity_type_id"],
-        action_date=date.fromisoformat(activity_data["action_date"]),
+        action_date=action_date,
         comment=activity_data.get("comment", ""),  # コメントはオプション
     )
 
     session.add(new_activity)
-    session.commit()
-    session.refresh(new_activity)
+
+    # 同一トランザクションでオポチュニティの最新アクティビティを更新
+    # （より新しい活動が既に記録されている場合は更新しない）
+    await session.execute(
+        update(Opportunity)
+        .where(
+            Opportunity.id == opportunity_id,
+            or_(
+                Opportunity.last_activity_date.is_(None),
+                Opportunity.last_activity_date <= action_date,
+            ),
+        )
+        .values(last_activity_date=action_date, last_activity_id=new_activity.id)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    await session.refresh(new_activity)
 
     logger.info(
         f"Created activity log: {new_activity.id}",
@@ -89,3 +110,157 @@ async def create_activity_log(activity_data: dict, session: Session = None) -> U
     )
 
     return new_activity.id
+
+
+async def create_activity_logs_bulk(
+    rows: Sequence[Tuple[int, Dict[str, Any]]], session: AsyncSession
+) -> List[Dict[str, Any]]:
+    """
+    アクティビティログを一括で記録
+
+    参照先の存在確認はオポチュニティ・ユーザーごとに1回のIN句のクエリで行い
+    （アクティビティタイプはマスタキャッシュで確認する）、
+    存在が確認できた行を複数行のINSERTでまとめて登録して1回だけコミットする
+
+    Args:
+        rows: (行番号, アクティビティログデータ) のリスト。データは検証済みで、
+            opportunity_id・user_id はUUID、action_date は日付であること
+        session: データベースセッション
+
+    Returns:
+        行ごとの結果（index, status, id, error）。status は登録した行が "created"、
+        参照先が存在しない行が "not_found"
+    """
+    opportunity_ids = await fetch_existing_ids(
+        session, Opportunity.id, {data["opportunity_id"] for _, data in rows}
+    )
+    user_ids = await fetch_existing_ids(
+        session, User.id, {data["user_id"] for _, data in rows}
+    )
+    # アクティビティタイプはマスタキャッシュで確認する（クエリを発行しない）
+    activity_type_ids = set()
+    for activity_type_id in {data["activity_type_id"] for _, data in rows}:
+        if await master_cache.get_activity_type(activity_type_id, session) is not None:
+            activity_type_ids.add(activity_type_id)
+
+    results: List[Dict[str, Any]] = []
+    values: List[Dict[str, Any]] = []
+    # オポチュニティごとに最新の活動（同日の場合は後の行）を保持する
+    latest: Dict[UUID, Dict[str, Any]] = {}
+    created_at = datetime.utcnow()
+    for index, data in rows:
+        # 単件登録と同じ順序で参照先を確認する
+        if data["opportunity_id"] not in opportunity_ids:
+            error = f"Opportunity not found: {data['opportunity_id']}"
+        elif data["user_id"] not in user_ids:
+            error = f"User not found: {data['user_id']}"
+        elif data["activity_type_id"] not in activity_type_ids:
+            error = f"Activity type not found: {data['activity_type_id']}"
+        else:
+            error = None
+
+        if error is not None:
+            results.append(
+                {"index": index, "status": "not_found", "id": None, "error": error}
+            )
+            continue
+
+        row = {
+            "id": uuid4(),
+            "created_at": created_at,
+            "opportunity_id": data["opportunity_id"],
+            "user_id": data["user_id"],
+            "activity_type_id": data["activity_type_id"],
+            "action_date": data["action_date"],
+            "comment": data.get("comment") or "",
+        }
+        values.append(row)
+        current = latest.get(row["opportunity_id"])
+        if current is None or current["action_date"] <= row["action_date"]:
+            latest[row["opportunity_id"]] = row
+        results.append(
+            {"index": index, "status": "created", "id": row["id"], "error": None}
+        )
+
+    if values:
+        activity_table = ActivityLog.__table__
+        for start in range(0, len(values), BULK_CHUNK_SIZE):
+            await session.execute(
+                insert(activity_table).values(values[start : start + BULK_CHUNK_SIZE])
+            )
+
+        # オポチュニティの最新アクティビティを1つのUPDATE文（executemany）で更新する
+        # （より新しい活動が既に記録されている場合は更新しない）
+        opportunity_table = Opportunity.__table__
+        await session.execute(
+            update(opportunity_table)
+            .where(
+                opportunity_table.c.id == bindparam("b_opportunity_id"),
+                or_(
+                    opportunity_table.c.last_activity_date.is_(None),
+                    opportunity_table.c.last_activity_date
+                    <= bindparam("b_action_date"),
+                ),
+            )
+            .values(
+                last_activity_date=bindparam("b_action_date"),
+                last_activity_id=bindparam("b_activity_id"),
+            ),
+            [
+                {
+                    "b_opportunity_id": row["opportunity_id"],
+                    "b_action_date": row["action_date"],
+                    "b_activity_id": row["id"],
+                }
+                for row in latest.values()
+            ],
+        )
+        await session.commit()
+
+    logger.info(
+        "Created activity logs in bulk",
+        extra={
+            "row_count": len(rows),
+            "created_count": len(values),
+            "not_found_count": len(rows) - len(values),
+        },
+    )
+    return results
+
+
+async def backfill_last_activity(session: AsyncSession) -> int:
+    """
+    全オポチュニティの最新アクティビティ（last_activity_date, last_activity_id）を
+    activity_logから再計算する
+
+    Args:
+        session: データベースセッション
+
+    Returns:
+        更新されたオポチュニティの件数
+    """
+    latest_date = (
+        select(func.max(ActivityLog.action_date))
+        .where(ActivityLog.opportunity_id == Opportunity.id)
+        .scalar_subquery()
+    )
+    latest_id = (
+        select(ActivityLog.id)
+        .where(ActivityLog.opportunity_id == Opportunity.id)
+        .order_by(ActivityLog.action_date.desc(), ActivityLog.created_at.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+
+    result = await session.execute(
+        update(Opportunity)
+        .values(last_activity_date=latest_date, last_activity_id=latest_id)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+
+    logger.info(
+        "Backfilled last activity of opportunities",
+        extra={"updated_count": result.rowcount},
+    )
+    return result.rowcount
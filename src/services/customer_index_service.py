@@ -0,0 +1,175 @@
+"""
+顧客名索引サービス
+
+顧客マスタから顧客名の索引を構築し、Slackハンドラに設定する。
+同じプロセス内での顧客の追加・変更・削除はコミット後に索引へ個別に反映し、
+他のプロセスでの変更は一定間隔の再読み込みで反映する
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import event
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.agents.customer_matcher import CustomerNameIndex
+from src.core.config import settings
+from src.core.logger import get_app_logger
+from src.db.pending_changes import PendingChanges
+from src.db.session import session_scope
+from src.models.entity import Customer
+from src.slack.handlers import slack_event_handler
+
+logger = get_app_logger()
+
+
+class CustomerIndexProvider:
+    """
+    顧客名の索引を保持する
+
+    初回の取得時と再読み込み間隔の経過後に顧客マスタを1回のクエリで読み込み、
+    それ以外はDBに問い合わせずに索引を返す
+    """
+
+    def __init__(
+        self, reload_interval: float, timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        プロバイダの初期化
+
+        Args:
+            reload_interval: 顧客マスタを再読み込みする間隔（秒）
+            timer: 経過時間の計測に使う関数
+        """
+        self.reload_interval = reload_interval
+        self.timer = timer
+        self.index: Optional[CustomerNameIndex] = None
+        self.loaded_at = 0.0
+        self.reloads = 0
+        self.updates = 0
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def expired(self) -> bool:
+        """索引が未構築、または再読み込みが必要かどうか"""
+        return (
+            self.index is None or self.timer() - self.loaded_at >= self.reload_interval
+        )
+
+    async def get_index(self, session: AsyncSession) -> CustomerNameIndex:
+        """
+        顧客名の索引を取得する（未構築・再読み込み間隔の経過後は顧客マスタを読み込む）
+
+        Args:
+            session: データベースセッション（読み込む場合のみ使用）
+
+        Returns:
+            顧客名の索引
+        """
+        if not self.expired:
+            return self.index
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        # 複数のワーカーが同時に読み込まないよう、読み込みは1つずつ行う
+        async with self._lock:
+            if not self.expired:
+                return self.index
+
+            result = await session.exec(select(Customer.id, Customer.name))
+            self.index = CustomerNameIndex(result.all())
+            self.loaded_at = self.timer()
+            self.reloads += 1
+
+        logger.info(
+            "Customer name index built", extra={"customer_count": len(self.index)}
+        )
+        return self.index
+
+    def apply_changes(self, changes: Dict[Any, Optional[str]]) -> None:
+        """
+        コミットされた顧客の変更を索引に反映する
+
+        Args:
+            changes: 顧客IDと変更後の名称（削除された顧客はNone）
+        """
+        if self.index is None:
+            return
+        for customer_id, name in changes.items():
+            if name is None:
+                self.index.remove(customer_id)
+            else:
+                self.index.upsert(customer_id, name)
+            self.updates += 1
+
+    def invalidate(self) -> None:
+        """次回の取得時に顧客マスタを再読み込みさせる"""
+        self.loaded_at = float("-inf")
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        索引のメトリクスを取得する
+
+        Returns:
+            再読み込み回数・個別に反映した変更数・索引されている顧客数
+        """
+        return {
+            "reloads": self.reloads,
+            "updates": self.updates,
+            "customers": len(self.index) if self.index is not None else 0,
+        }
+
+
+# シングルトンインスタンス
+customer_index_provider = CustomerIndexProvider(
+    reload_interval=settings.CUSTOMER_INDEX_RELOAD_INTERVAL
+)
+
+
+# コミットされた顧客の変更（顧客ID → 名称、削除はNone）を索引に反映する
+_pending_changes = PendingChanges(
+    "changed_customers", customer_index_provider.apply_changes, dict
+)
+
+
+def _record_customer_change(target: Customer, name: Optional[str]) -> None:
+    """顧客の変更をコミット後に索引へ反映する変更として記録する"""
+    _pending_changes.record(target, {target.id: name})
+
+
+@event.listens_for(Customer, "after_insert")
+@event.listens_for(Customer, "after_update")
+def _record_customer_upsert(mapper, connection, target: Customer) -> None:
+    """
+    顧客の登録・更新を記録する
+
+    ORMを経由しない一括UPDATE/DELETEでは呼ばれないため、その場合は
+    customer_index_provider.invalidate() を明示的に呼び出すこと
+    """
+    _record_customer_change(target, target.name)
+
+
+@event.listens_for(Customer, "after_delete")
+def _record_customer_delete(mapper, connection, target: Customer) -> None:
+    """顧客の削除を記録する"""
+    _record_customer_change(target, None)
+
+
+async def refresh_customer_index() -> None:
+    """
+    顧客名の索引が未構築・再読み込み間隔の経過後であれば読み込み、Slackハンドラに設定する
+
+    それ以外の場合はDBに問い合わせない。読み込みに失敗した場合は構築済みの索引を使い続ける
+    """
+    provider = customer_index_provider
+    if not provider.expired:
+        return
+
+    try:
+        async with session_scope() as session:
+            slack_event_handler.customer_index = await provider.get_index(session)
+    except Exception as e:
+        logger.warning("Failed to build customer name index", extra={"error": str(e)})
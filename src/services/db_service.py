@@ -2,19 +2,50 @@
 データベースセッション提供サービス
 """
 
-from sqlmodel import Session
+from typing import Any, AsyncGenerator, Iterable, Set
 
-from db.session import get_session
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.db.session import session_scope
 
-def get_db_session() -> Session:
+# 1回のINSERT文・IN句で扱う行数（DBのバインド変数の上限を超えないようにする）
+BULK_CHUNK_SIZE = 1000
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
-    データベースセッションを取得する
+    リクエスト単位の非同期データベースセッションを取得する
 
-    このサービスは、APIエンドポイントでセッションを依存性として使用するための共通関数を提供します。
+    APIエンドポイントで`Depends`に指定して使用します。
     これにより、APIレイヤーからDBレイヤーへの直接の依存を避けられます。
 
+    Yields:
+        AsyncSession: SQLModelの非同期セッション
+    """
+    async with session_scope() as session:
+        yield session
+
+
+async def fetch_existing_ids(
+    session: AsyncSession, column: Any, ids: Iterable[Any]
+) -> Set[Any]:
+    """
+    IN句で存在するIDを取得する（BULK_CHUNK_SIZE 件ずつ）
+
+    Args:
+        session: データベースセッション
+        column: IDのカラム（例: User.id）
+        ids: 確認するID
+
     Returns:
-        Session: SQLModelセッション
+        存在するID
     """
-    return get_session()
+    ids = list(ids)
+    existing = set()
+    for start in range(0, len(ids), BULK_CHUNK_SIZE):
+        result = await session.execute(
+            select(column).where(column.in_(ids[start : start + BULK_CHUNK_SIZE]))
+        )
+        existing.update(result.scalars().all())
+    return existing
@@ -0,0 +1,260 @@
+"""
+マスタキャッシュサービス
+
+ステージ・アクティビティ種別マスタを起動時にメモリへ読み込み、
+存在確認と名称の参照をDBに問い合わせずに行う。
+同じプロセス内でのマスタの変更はコミット後に、他のプロセスでの変更は
+一定間隔の再読み込みで反映する。キャッシュにないIDを参照した場合も再読み込みする
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional
+
+from sqlalchemy import event
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.core.config import settings
+from src.core.logger import get_app_logger
+from src.db.pending_changes import PendingChanges
+from src.db.session import session_scope
+from src.models.master import ActivityType, Stage
+
+logger = get_app_logger()
+
+# キャッシュにないIDの参照で再読み込みする最小間隔（秒）
+# 存在しないIDを含むリクエストが続いても、参照のたびにクエリを発行しないようにする
+MISS_RELOAD_INTERVAL = 1.0
+
+
+class MasterRecord(NamedTuple):
+    """マスタの1件"""
+
+    id: int
+    name: str
+    is_active: bool
+    # 表示順（ステージのみ）
+    order_no: Optional[int] = None
+
+
+class MasterCache:
+    """
+    ステージ・アクティビティ種別マスタのキャッシュ
+
+    読み込むたびにバージョンを上げ、参照側はバージョンで読み込み直しの有無を判断できる
+    """
+
+    def __init__(
+        self, reload_interval: float, timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        キャッシュの初期化
+
+        Args:
+            reload_interval: マスタを再読み込みする間隔（秒）
+            timer: 経過時間の計測に使う関数
+        """
+        self.reload_interval = reload_interval
+        self.timer = timer
+        self.stages: Dict[int, MasterRecord] = {}
+        self.activity_types: Dict[int, MasterRecord] = {}
+        self.version = 0
+        self.loaded_at = float("-inf")
+        self.hits = 0
+        self.misses = 0
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def expired(self) -> bool:
+        """未読み込み、またはマスタの変更・再読み込み間隔の経過により再読み込みが必要か"""
+        return (
+            self.version == 0 or self.timer() - self.loaded_at >= self.reload_interval
+        )
+
+    def load_records(
+        self, stages: Iterable[Iterable[Any]], activity_types: Iterable[Iterable[Any]]
+    ) -> None:
+        """
+        読み込んだマスタでキャッシュを置き換え、バージョンを上げる
+
+        Args:
+            stages: ステージの (id, name, is_active, order_no)
+            activity_types: アクティビティ種別の (id, name, is_active)
+        """
+        self.stages = {row[0]: MasterRecord(*row) for row in stages}
+        self.activity_types = {row[0]: MasterRecord(*row) for row in activity_types}
+        self.loaded_at = self.timer()
+        self.version += 1
+
+    async def reload(
+        self, session: AsyncSession, version: Optional[int] = None
+    ) -> None:
+        """
+        マスタを読み込む（テーブルごとに1回のクエリ）
+
+        Args:
+            session: データベースセッション
+            version: このバージョンから読み込む（待機中に他の処理が読み込んだ場合は読み込まない）
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        # 複数のワーカーが同時に読み込まないよう、読み込みは1つずつ行う
+        async with self._lock:
+            if version is not None and self.version != version:
+                return
+
+            stages = await session.exec(
+                select(Stage.id, Stage.name, Stage.is_active, Stage.order_no)
+            )
+            activity_types = await session.exec(
+                select(ActivityType.id, ActivityType.name, ActivityType.is_active)
+            )
+            self.load_records(stages.all(), activity_types.all())
+
+        logger.info(
+            "Master cache loaded",
+            extra={
+                "version": self.version,
+                "stage_count": len(self.stages),
+                "activity_type_count": len(self.activity_types),
+            },
+        )
+
+    async def refresh(self, session: AsyncSession) -> None:
+        """
+        未読み込み・期限切れの場合のみマスタを読み込む
+
+        Args:
+            session: データベースセッション（読み込みが必要な場合のみ使用）
+        """
+        if self.expired:
+            await self.reload(session, self.version)
+
+    async def _lookup(
+        self, records: str, record_id: Any, session: AsyncSession
+    ) -> Optional[MasterRecord]:
+        """
+        キャッシュからマスタを取得する
+
+        未読み込み・期限切れの場合と、キャッシュにないIDの場合
+        （MISS_RELOAD_INTERVAL 以内に読み込んでいなければ）は読み込んでから取得する
+        """
+        queried = False
+        if self.expired:
+            await self.reload(session, self.version)
+            queried = True
+
+        record = getattr(self, records).get(record_id)
+        if (
+            record is None
+            and not queried
+            and self.timer() - self.loaded_at >= MISS_RELOAD_INTERVAL
+        ):
+            # 他のプロセスで追加されたマスタの場合に備えて読み込み直す
+            await self.reload(session, self.version)
+            queried = True
+            record = getattr(self, records).get(record_id)
+
+        if queried:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return record
+
+    async def get_stage(
+        self, stage_id: Any, session: AsyncSession
+    ) -> Optional[MasterRecord]:
+        """
+        ステージを取得する
+
+        Args:
+            stage_id: ステージID
+            session: データベースセッション（読み込みが必要な場合のみ使用）
+
+        Returns:
+            ステージ。存在しない場合はNone
+        """
+        return await self._lookup("stages", stage_id, session)
+
+    async def get_activity_type(
+        self, activity_type_id: Any, session: AsyncSession
+    ) -> Optional[MasterRecord]:
+        """
+        アクティビティ種別を取得する
+
+        Args:
+            activity_type_id: アクティビティ種別ID
+            session: データベースセッション（読み込みが必要な場合のみ使用）
+
+        Returns:
+            アクティビティ種別。存在しない場合はNone
+        """
+        return await self._lookup("activity_types", activity_type_id, session)
+
+    def invalidate(self) -> None:
+        """次回の参照時にマスタを再読み込みさせる"""
+        self.loaded_at = float("-inf")
+
+    def clear(self) -> None:
+        """キャッシュを破棄し、ヒット数などの計測値もリセットする"""
+        self.stages = {}
+        self.activity_types = {}
+        self.version = 0
+        self.loaded_at = float("-inf")
+        self.hits = 0
+        self.misses = 0
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        キャッシュのメトリクスを取得する
+
+        Returns:
+            バージョン・キャッシュしている件数・ヒット数・ミス数・ヒット率
+        """
+        lookups = self.hits + self.misses
+        return {
+            "version": self.version,
+            "stages": len(self.stages),
+            "activity_types": len(self.activity_types),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# シングルトンインスタンス
+master_cache = MasterCache(reload_interval=settings.MASTER_CACHE_RELOAD_INTERVAL)
+
+# マスタの変更がコミットされたらキャッシュを再読み込みさせる
+_pending_reload = PendingChanges("master_changed", lambda _: master_cache.invalidate())
+
+
+@event.listens_for(Stage, "after_insert")
+@event.listens_for(Stage, "after_update")
+@event.listens_for(Stage, "after_delete")
+@event.listens_for(ActivityType, "after_insert")
+@event.listens_for(ActivityType, "after_update")
+@event.listens_for(ActivityType, "after_delete")
+def _mark_master_changed(mapper, connection, target: Any) -> None:
+    """
+    マスタの登録・更新・削除をコミット後の再読み込み対象として記録する
+
+    ORMを経由しない一括UPDATE/DELETEでは呼ばれないため、その場合は
+    master_cache.invalidate() を明示的に呼び出すこと
+    """
+    _pending_reload.record(target)
+
+
+async def warm_master_cache() -> None:
+    """
+    起動時にマスタキャッシュを読み込む
+
+    キャッシュは最適化のため、読み込みに失敗しても起動は継続する（初回の参照時に読み込む）
+    """
+    try:
+        async with session_scope() as session:
+            await master_cache.reload(session)
+    except Exception as e:
+        logger.warning("Failed to load master cache", extra={"error": str(e)})
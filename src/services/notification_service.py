@@ -1,79 +1,81 @@
 """
 通知関連サービス
 """
+import asyncio
 import uuid
 from datetime import date, timedelta
 from typing import Dict, List, Optional
 
-from sqlmodel import Session, select
+from sqlalchemy import or_
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.core.config import settings
 from src.core.logger import get_notification_logger
-from src.db.session import get_session
-from src.models.entity import ActivityLog, Opportunity, OpportunityUser, User
+from src.models.entity import Opportunity, OpportunityUser, User
 from src.slack.bot import slack_bot
 
 logger = get_notification_logger()
 
+# 通知対象行を取得する際のフェッチ単位
+NOTIFICATION_FETCH_SIZE = 1000
+
 
 async def check_progress_notifications(
-    target_date: date, session: Session = None
+    target_date: date, session: AsyncSession
 ) -> List[Dict]:
     """
     進捗確認が必要なオポチュニティを特定し通知対象リストを作成
 
     Args:
         target_date: 基準日
-        session: データベースセッション (省略可能)
+        session: データベースセッション
 
     Returns:
         通知対象リスト
     """
-    # セッションがない場合は新しく取得
-    if session is None:
-        session = get_session()
     # 進捗確認が必要なオポチュニティを特定
     # 設定から非アクティブ日数を取得
-    from src.core.config import settings
-
     inactivity_days = settings.NOTIFICATION_INACTIVITY_DAYS
     cutoff_date = target_date - timedelta(days=inactivity_days)
 
-    # 全オポチュニティを取得
-    opportunities = session.exec(select(Opportunity)).all()
-    notifications_to_send = []
+    # 最終活動日が基準日より古い（または活動がない）案件のオーナーを1クエリで取得
+    query = (
+        select(
+            Opportunity.id,
+            Opportunity.title,
+            User.id,
+            User.slack_id,
+            Opportunity.last_activity_date,
+        )
+        .join(OpportunityUser, OpportunityUser.opportunity_id == Opportunity.id)
+        .join(User, User.id == OpportunityUser.user_id)
+        .where(
+            OpportunityUser.role == "owner",
+            or_(
+                Opportunity.last_activity_date.is_(None),
+                Opportunity.last_activity_date < cutoff_date,
+            ),
+        )
+        .order_by(Opportunity.id, User.id)
+        .execution_options(yield_per=NOTIFICATION_FETCH_SIZE)
+    )
 
-    for opp in opportunities:
-        # 最新のアクティビティログを取得
-        latest_activity = session.exec(
-            select(ActivityLog)
-            .where(ActivityLog.opportunity_id == opp.id)
-            .order_by(ActivityLog.action_date.desc())
-        ).first()
-
-        # アクティビティがない、または最新のアクティビティが古い場合
-        if not latest_activity or latest_activity.action_date < cutoff_date:
-            # オーナーを取得
-            owners = session.exec(
-                select(OpportunityUser).where(
-                    OpportunityUser.opportunity_id == opp.id,
-                    OpportunityUser.role == "owner",
-                )
-            ).all()
-
-            for owner_relation in owners:
-                owner = session.get(User, owner_relation.user_id)
-
-                notifications_to_send.append(
-                    {
-                        "user_id": owner.id,
-                        "slack_id": owner.slack_id,
-                        "opportunity_id": opp.id,
-                        "opportunity_title": opp.title,
-                        "last_activity_date": latest_activity.action_date.isoformat()
-                        if latest_activity
-                        else "なし",
-                    }
-                )
+    # 結果はサーバーサイドカーソルで逐次取得する
+    notifications_to_send = []
+    result = await session.stream(query)
+    async for opp_id, opp_title, user_id, slack_id, last_activity_date in result:
+        notifications_to_send.append(
+            {
+                "user_id": user_id,
+                "slack_id": slack_id,
+                "opportunity_id": opp_id,
+                "opportunity_title": opp_title,
+                "last_activity_date": last_activity_date.isoformat()
+                if last_activity_date
+                else "なし",
+            }
+        )
 
     logger.info(
         "Progress notification check completed",
@@ -86,62 +88,175 @@ async def check_progress_notifications(
     return notifications_to_send
 
 
-async def send_progress_notifications(notifications: List[Dict]) -> int:
+# 進捗確認通知の送信結果の分類
+DELIVERY_SENT = "sent"
+DELIVERY_RATE_LIMITED = "rate_limited"
+DELIVERY_FAILED = "failed"
+DELIVERY_SKIPPED = "skipped"
+DELIVERY_TIMED_OUT = "timed_out"
+DELIVERY_STATUSES = (
+    DELIVERY_SENT,
+    DELIVERY_RATE_LIMITED,
+    DELIVERY_FAILED,
+    DELIVERY_SKIPPED,
+    DELIVERY_TIMED_OUT,
+)
+
+
+def _group_progress_notifications(
+    notifications: List[Dict], digest: bool
+) -> List[List[Dict]]:
+    """
+    通知対象を1通のメッセージで送信する単位にまとめる
+
+    Args:
+        notifications: Slack IDを持つ通知対象リスト
+        digest: 担当者（user_id）ごとに1通にまとめるかどうか
+
+    Returns:
+        メッセージ単位の通知対象リスト
+    """
+    if not digest:
+        return [[notification] for notification in notifications]
+
+    groups: Dict[uuid.UUID, List[Dict]] = {}
+    for notification in notifications:
+        groups.setdefault(notification["user_id"], []).append(notification)
+    return list(groups.values())
+
+
+async def _deliver_progress_notification(
+    notifications: List[Dict], semaphore: asyncio.Semaphore
+) -> str:
+    """
+    担当者1人分の進捗確認通知を1通のメッセージとして送信し、送信結果の分類を返す
+
+    Args:
+        notifications: 同じ担当者宛ての通知対象（check_progress_notifications関数の戻り値の要素）
+        semaphore: 同時送信数を制限するセマフォ
+
+    Returns:
+        送信結果の分類（DELIVERY_*）
+    """
+    user_slack_id = notifications[0]["slack_id"]
+    inactivity_days = settings.NOTIFICATION_INACTIVITY_DAYS
+    log_extra = {
+        "user_slack_id": user_slack_id,
+        "opportunity_ids": [str(n.get("opportunity_id")) for n in notifications],
+    }
+
+    elapsed = f"最終活動日から{inactivity_days}日以上経過しています。"
+    if len(notifications) == 1:
+        opportunity_title = notifications[0].get("opportunity_title", "不明な案件")
+        message = f"案件「{opportunity_title}」の進捗状況を更新してください。{elapsed}"
+    else:
+        message = f"進捗状況の更新が必要な案件が{len(notifications)}件あります。{elapsed}"
+
+    async with semaphore:
+        try:
+            # Slack通知を送信（案件が1件のみの場合は従来の通知形式）
+            if len(notifications) == 1:
+                response = await slack_bot.send_notification(
+                    user_slack_id=user_slack_id,
+                    message=message,
+                    opportunity_data=notifications[0],
+                )
+            else:
+                response = await slack_bot.send_digest_notification(
+                    user_slack_id=user_slack_id,
+                    message=message,
+                    opportunities=notifications,
+                )
+        except Exception as e:
+            logger.error(
+                "Failed to send progress notification",
+                extra={**log_extra, "error": str(e)},
+            )
+            return DELIVERY_FAILED
+
+    # リトライ上限に達したSlack APIエラーは ok=False のレスポンスとして返される
+    if not response.get("ok", True):
+        error = response.get("error")
+        logger.error(
+            "Failed to send progress notification",
+            extra={**log_extra, "error": error},
+        )
+        if error == "ratelimited":
+            return DELIVERY_RATE_LIMITED
+        return DELIVERY_FAILED
+
+    logger.info("Progress notification sent successfully", extra=log_extra)
+    return DELIVERY_SENT
+
+
+async def send_progress_notifications(
+    notifications: List[Dict],
+    concurrency: Optional[int] = None,
+    deadline: Optional[float] = None,
+    digest: Optional[bool] = None,
+) -> Dict[str, int]:
     """
     進捗確認通知をSlackに送信する
 
+    ダイジェストモードでは担当者ごとに案件リストを集計し、1人につき1通のメッセージにまとめる。
+    同時送信数をセマフォで制限して並行に送信し、全体の期限を過ぎた送信は打ち切る
+
     Args:
         notifications: 通知対象リスト（check_progress_notifications関数の戻り値）
+        concurrency: 同時送信数の上限（省略時は設定値）
+        deadline: 全体の送信期限（秒、省略時は設定値）
+        digest: 担当者ごとにまとめて送信するかどうか（省略時は設定値）
 
     Returns:
-        送信成功した通知の数
+        送信結果の分類（sent, rate_limited, failed, skipped, timed_out）ごとの件数。
+        ダイジェストモードでも件数は通知対象（案件）単位で数える
     """
-    success_count = 0
+    concurrency = concurrency or settings.NOTIFICATION_SEND_CONCURRENCY
+    if deadline is None:
+        deadline = settings.NOTIFICATION_SEND_DEADLINE
+    if digest is None:
+        digest = settings.NOTIFICATION_DIGEST_ENABLED
+    summary = dict.fromkeys(DELIVERY_STATUSES, 0)
 
+    deliverable = []
     for notification in notifications:
-        user_slack_id = notification.get("slack_id")
-        if not user_slack_id:
+        if not notification.get("slack_id"):
             logger.warning(
                 "Notification skipped: No Slack ID",
                 extra={"user_id": str(notification.get("user_id"))},
             )
+            summary[DELIVERY_SKIPPED] += 1
             continue
+        deliverable.append(notification)
 
-        # 通知メッセージを構築
-        from src.core.config import settings
-
-        opportunity_title = notification.get("opportunity_title", "不明な案件")
-        inactivity_days = settings.NOTIFICATION_INACTIVITY_DAYS
-        message = (
-            f"案件「{opportunity_title}」の進捗状況を更新してください。最終活動日から{inactivity_days}日以上経過しています。"
+    semaphore = asyncio.Semaphore(concurrency)
+    # 送信タスクと、そのメッセージに含まれる通知対象の件数
+    tasks = {
+        asyncio.ensure_future(_deliver_progress_notification(group, semaphore)): len(
+            group
         )
+        for group in _group_progress_notifications(deliverable, digest)
+    }
 
-        try:
-            # Slack通知を送信
-            await slack_bot.send_notification(
-                user_slack_id=user_slack_id,
-                message=message,
-                opportunity_data=notification,
-            )
-            success_count += 1
-            logger.info(
-                "Progress notification sent successfully",
-                extra={
-                    "user_slack_id": user_slack_id,
-                    "opportunity_id": str(notification.get("opportunity_id")),
-                },
-            )
-        except Exception as e:
-            logger.error(
-                "Failed to send progress notification",
-                extra={
-                    "user_slack_id": user_slack_id,
-                    "opportunity_id": str(notification.get("opportunity_id")),
-                    "error": str(e),
-                },
+    if tasks:
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        for task in done:
+            summary[task.result()] += tasks[task]
+
+        # 期限内に送信できなかった通知はキャンセルする
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            timed_out_count = sum(tasks[task] for task in pending)
+            summary[DELIVERY_TIMED_OUT] += timed_out_count
+            logger.warning(
+                "Progress notification deadline exceeded",
+                extra={"deadline": deadline, "timed_out_count": timed_out_count},
             )
 
-    return success_count
+    logger.info("Progress notifications delivered", extra={**summary})
+    return summary
 
 
 async def send_kpi_notification(
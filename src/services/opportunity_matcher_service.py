@@ -0,0 +1,205 @@
+"""
+案件マッチングサービス
+
+Slackメッセージの送信者が担当する案件を候補として、メッセージが指す案件を推定する。
+担当者ごとの候補はメモリにキャッシュし、メッセージごとに案件を検索しない
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import event, inspect
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.agents.opportunity_matcher import (
+    OpportunityCandidate,
+    ScoredOpportunity,
+    rank_opportunities,
+)
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.core.logger import get_opportunity_logger
+from src.db.pending_changes import PendingChanges
+from src.models.entity import Opportunity, OpportunityUser
+
+logger = get_opportunity_logger()
+
+# 全担当者のキャッシュを破棄することを表す値
+_ALL_USERS = "*"
+
+
+class OpportunityCandidateCache:
+    """
+    担当者ごとの案件候補のキャッシュ
+
+    担当案件の登録・変更はORMのイベントで該当する担当者のキャッシュを破棄する。
+    最新アクティビティ日はSQLで更新されるため、有効期限内は読み込み時点の値を使う
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        キャッシュの初期化
+
+        Args:
+            maxsize: キャッシュする担当者数の上限
+            ttl: キャッシュの有効期限（秒）
+        """
+        self.candidates: TTLCache[Any, Tuple[OpportunityCandidate, ...]] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+
+    async def get_candidates(
+        self, user_id: UUID, session: AsyncSession
+    ) -> Tuple[OpportunityCandidate, ...]:
+        """
+        担当者の案件候補を取得する
+
+        Args:
+            user_id: 担当者のユーザーID
+            session: データベースセッション（キャッシュにない場合のみ使用）
+
+        Returns:
+            担当者がオーナーまたはコラボレーターである案件の候補
+        """
+        cached = self.candidates.get(user_id)
+        if cached is not None:
+            return cached
+
+        result = await session.exec(
+            select(
+                Opportunity.id,
+                Opportunity.customer_id,
+                Opportunity.title,
+                Opportunity.last_activity_date,
+            )
+            .join(OpportunityUser, OpportunityUser.opportunity_id == Opportunity.id)
+            .where(OpportunityUser.user_id == user_id)
+        )
+        # オーナーとコラボレーターを兼ねる案件は1件にまとめる
+        rows = {row[0]: row for row in result}
+        candidates = tuple(OpportunityCandidate.create(*row) for row in rows.values())
+        self.candidates.set(user_id, candidates)
+        return candidates
+
+    def invalidate(self, user_id: Optional[Any] = None) -> None:
+        """
+        キャッシュした案件候補を破棄する
+
+        Args:
+            user_id: 担当者のユーザーID（省略時はすべて破棄）
+        """
+        if user_id is None:
+            self.candidates.clear()
+        else:
+            self.candidates.delete(user_id)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        キャッシュのメトリクスを取得する
+
+        Returns:
+            案件候補のキャッシュのメトリクス
+        """
+        return self.candidates.metrics()
+
+
+# シングルトンインスタンス
+opportunity_candidate_cache = OpportunityCandidateCache(
+    maxsize=settings.OPPORTUNITY_CANDIDATE_CACHE_MAX_SIZE,
+    ttl=settings.OPPORTUNITY_CANDIDATE_CACHE_TTL,
+)
+
+
+def _invalidate_user_ids(user_ids: Iterable[Any]) -> None:
+    """担当者IDに該当する案件候補のキャッシュを破棄する"""
+    for user_id in user_ids:
+        opportunity_candidate_cache.invalidate(
+            None if user_id == _ALL_USERS else user_id
+        )
+
+
+# コミットされた変更に該当する案件候補のキャッシュを破棄する
+_pending_invalidation = PendingChanges(
+    "invalidated_candidate_user_ids", _invalidate_user_ids
+)
+
+
+def _invalidate_candidates(target: Any, user_ids: Iterable[Any]) -> None:
+    """案件候補のキャッシュを破棄し、コミット後にも破棄するよう記録する"""
+    user_ids = set(user_ids)
+    _invalidate_user_ids(user_ids)
+
+    # コミット前に他のセッションが変更前の内容を再キャッシュする場合に備え、コミット後にも破棄する
+    _pending_invalidation.record(target, user_ids)
+
+
+@event.listens_for(OpportunityUser, "after_insert")
+@event.listens_for(OpportunityUser, "after_update")
+@event.listens_for(OpportunityUser, "after_delete")
+def _invalidate_on_assignment_change(
+    mapper, connection, target: OpportunityUser
+) -> None:
+    """担当案件の登録・変更・削除時に該当する担当者のキャッシュを破棄する"""
+    user_ids = {target.user_id}
+    # 担当者が変更された場合は変更前の担当者も破棄する
+    user_ids.update(inspect(target).attrs.user_id.history.deleted or ())
+    _invalidate_candidates(target, user_ids)
+
+
+@event.listens_for(Opportunity, "after_update")
+@event.listens_for(Opportunity, "after_delete")
+def _invalidate_on_opportunity_change(mapper, connection, target: Opportunity) -> None:
+    """
+    案件の更新・削除時にキャッシュを破棄する
+
+    担当者を調べるクエリを避けるため、全担当者のキャッシュを破棄する
+    """
+    _invalidate_candidates(target, {_ALL_USERS})
+
+
+async def match_opportunities(
+    user_id: UUID,
+    text: str,
+    session: AsyncSession,
+    customer_ids: Iterable[Any] = (),
+    today: Optional[date] = None,
+    top_k: Optional[int] = None,
+) -> List[ScoredOpportunity]:
+    """
+    メッセージが指す案件を推定する
+
+    Args:
+        user_id: メッセージ送信者のユーザーID
+        text: メッセージテキスト
+        session: データベースセッション（案件候補がキャッシュにない場合のみ使用）
+        customer_ids: メッセージから抽出した顧客ID
+        today: 最新アクティビティの新しさの基準日（省略時は SCHEDULER_TIMEZONE の今日）
+        top_k: 返す候補数（省略時は OPPORTUNITY_MATCH_TOP_K）
+
+    Returns:
+        スコアの高い順の案件候補
+    """
+    if today is None:
+        today = datetime.now(ZoneInfo(settings.SCHEDULER_TIMEZONE)).date()
+
+    candidates = await opportunity_candidate_cache.get_candidates(user_id, session)
+    matches = rank_opportunities(
+        candidates,
+        text,
+        today,
+        customer_ids={UUID(str(customer_id)) for customer_id in customer_ids},
+        top_k=top_k or settings.OPPORTUNITY_MATCH_TOP_K,
+    )
+
+    logger.info(
+        "Matched message to opportunities",
+        extra={
+            "user_id": str(user_id),
+            "candidate_count": len(candidates),
+            "match_count": len(matches),
+        },
+    )
+    return matches
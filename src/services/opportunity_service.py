@@ -2,27 +2,54 @@
 オポチュニティ関連サービス
 """
 
+import base64
 from datetime import UTC, date, datetime
-from typing import Dict, List, Optional
-from uuid import UUID
-
-from sqlmodel import Session, select
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    String,
+    and_,
+    bindparam,
+    cast,
+    column,
+    delete,
+    insert,
+    or_,
+    update,
+    values,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.core.logger import get_opportunity_logger
-from src.db.session import get_session
-from src.models.entity import Customer, Opportunity, OpportunityUser, User
+from src.models.entity import ActivityLog, Customer, Opportunity, OpportunityUser, User
 from src.models.master import Stage
+from src.services.db_service import BULK_CHUNK_SIZE, fetch_existing_ids
+from src.services.master_cache_service import master_cache
+from src.services.opportunity_matcher_service import opportunity_candidate_cache
 
 logger = get_opportunity_logger()
 
+# 検索結果の1ページあたりのデフォルト件数
+DEFAULT_SEARCH_LIMIT = 50
+
+# 更新可能フィールド
+UPDATABLE_FIELDS = ("stage_id", "amount", "title", "expected_close_date")
+
+# 一括操作で1つのトランザクションにまとめる件数
+BULK_TRANSACTION_SIZE = 1000
 
-async def get_opportunity_by_id(opportunity_id: UUID, session: Session = None) -> Dict:
+
+async def get_opportunity_by_id(opportunity_id: UUID, session: AsyncSession) -> Dict:
     """
     指定されたIDのオポチュニティ詳細を取得
 
     Args:
         opportunity_id: 取得するオポチュニティのID
-        session: データベースセッション (省略可能)
+        session: データベースセッション
 
     Returns:
         オポチュニティ詳細情報の辞書
@@ -30,34 +57,31 @@ async def get_opportunity_by_id(opportunity_id: UUID, session: Session = None) -
     Raises:
         ValueError: オポチュニティが存在しない場合
     """
-    # セッションがない場合は新しく取得
-    if session is None:
-        session = get_session()
 
-    # オポチュニティを検索
-    opportunity = session.get(Opportunity, opportunity_id)
+    # 顧客・ステージ・担当者を結合して1回のクエリで取得
+    result = await session.exec(
+        select(Opportunity)
+        .where(Opportunity.id == opportunity_id)
+        .options(
+            joinedload(Opportunity.customer),
+            joinedload(Opportunity.stage),
+            joinedload(Opportunity.users).joinedload(OpportunityUser.user),
+        )
+    )
+    opportunity = result.unique().first()
     if not opportunity:
         logger.warning(f"Opportunity not found: {opportunity_id}")
         raise ValueError(f"Opportunity not found: {opportunity_id}")
 
-    # 顧客情報を取得
-    customer = session.get(Customer, opportunity.customer_id)
-
-    # ステージ情報を取得
-    stage = session.get(Stage, opportunity.stage_id)
-
-    # 担当者情報を取得
-    opportunity_users = session.exec(
-        select(OpportunityUser).where(OpportunityUser.opportunity_id == opportunity_id)
-    ).all()
+    customer = opportunity.customer
+    stage = opportunity.stage
 
     # 担当者とコラボレーターに分ける
     owners = []
     collaborators = []
 
-    for opp_user in opportunity_users:
-        user = session.get(User, opp_user.user_id)
-        user_info = {"id": user.id, "name": user.name}
+    for opp_user in opportunity.users:
+        user_info = {"id": opp_user.user.id, "name": opp_user.user.name}
 
         if opp_user.role == "owner":
             owners.append(user_info)
@@ -88,13 +112,13 @@ async def get_opportunity_by_id(opportunity_id: UUID, session: Session = None) -
     return response
 
 
-async def create_opportunity(opportunity_data: dict, session: Session = None) -> UUID:
+async def create_opportunity(opportunity_data: dict, session: AsyncSession) -> UUID:
     """
     新規オポチュニティを作成
 
     Args:
         opportunity_data: オポチュニティ作成データ
-        session: データベースセッション (省略可能)
+        session: データベースセッション
 
     Returns:
         作成されたオポチュニティのID
@@ -102,9 +126,6 @@ async def create_opportunity(opportunity_data: dict, session: Session = None) ->
     Raises:
         ValueError: 必須フィールドがない、または参照先が存在しない場合
     """
-    # セッションがない場合は新しく取得
-    if session is None:
-        session = get_session()
     # 必須フィールドを確認
     required_fields = [
         "customer_id",
@@ -120,31 +141,33 @@ async def create_opportunity(opportunity_data: dict, session: Session = None) ->
             raise ValueError(f"Missing required field: {field}")
 
     # 顧客が存在するか確認
-    customer = session.get(Customer, opportunity_data["customer_id"])
+    customer = await session.get(Customer, opportunity_data["customer_id"])
     if not customer:
         logger.warning(f"Customer not found: {opportunity_data['customer_id']}")
         raise ValueError(f"Customer not found: {opportunity_data['customer_id']}")
 
-    # ステージが存在するか確認
-    stage = session.get(Stage, opportunity_data["stage_id"])
+    # ステージが存在するか確認（マスタキャッシュを参照）
+    stage = await master_cache.get_stage(opportunity_data["stage_id"], session)
     if not stage:
         logger.warning(f"Stage not found: {opportunity_data['stage_id']}")
         raise ValueError(f"Stage not found: {opportunity_data['stage_id']}")
 
-    # オーナーが存在するか確認
-    for owner_id in opportunity_data["owners"]:
-        user = session.get(User, owner_id)
-        if not user:
-            logger.warning(f"Owner user not found: {owner_id}")
-            raise ValueError(f"User not found: {owner_id}")
-
-    # コラボレーターが存在するか確認（存在する場合）
-    if "collaborators" in opportunity_data:
-        for collab_id in opportunity_data["collaborators"]:
-            user = session.get(User, collab_id)
-            if not user:
-                logger.warning(f"Collaborator user not found: {collab_id}")
-                raise ValueError(f"User not found: {collab_id}")
+    # オーナー・コラボレーターが存在するか1回のクエリで確認
+    owners = opportunity_data["owners"]
+    collaborators = opportunity_data.get("collaborators") or []
+    result = await session.execute(
+        select(User.id).where(User.id.in_({*owners, *collaborators}))
+    )
+    user_ids = set(result.scalars().all())
+    for role, assignee_ids in (("Owner", owners), ("Collaborator", collaborators)):
+        for user_id in assignee_ids:
+            if user_id not in user_ids:
+                logger.warning(f"{role} user not found: {user_id}")
+                raise ValueError(f"User not found: {user_id}")
+
+    expected_close_date = opportunity_data["expected_close_date"]
+    if isinstance(expected_close_date, str):
+        expected_close_date = date.fromisoformat(expected_close_date)
 
     # オポチュニティを作成
     new_opportunity = Opportunity(
@@ -152,39 +175,26 @@ async def create_opportunity(opportunity_data: dict, session: Session = None) ->
         title=opportunity_data["title"],
         amount=opportunity_data["amount"],
         stage_id=opportunity_data["stage_id"],
-        expected_close_date=date.fromisoformat(opportunity_data["expected_close_date"]),
+        expected_close_date=expected_close_date,
     )
-    session.add(new_opportunity)
-    session.commit()
-    session.refresh(new_opportunity)
-
-    # オーナー関係を作成
-    for owner_id in opportunity_data["owners"]:
-        owner_relation = OpportunityUser(
-            opportunity_id=new_opportunity.id,
-            user_id=owner_id,
-            role="owner",
-        )
-        session.add(owner_relation)
-
-    # コラボレーター関係を作成（存在する場合）
-    if "collaborators" in opportunity_data:
-        for collab_id in opportunity_data["collaborators"]:
-            collab_relation = OpportunityUser(
-                opportunity_id=new_opportunity.id,
-                user_id=collab_id,
-                role="collaborator",
-            )
-            session.add(collab_relation)
 
-    session.commit()
-    logger.info(f"Created opportunity: {new_opportunity.id}")
+    # オーナー・コラボレーター関係を作成し、オポチュニティと同じトランザクションで登録する
+    # （IDはクライアント側で採番済みのため、1回のflushでまとめてINSERTされる）
+    relations = [
+        OpportunityUser(opportunity_id=new_opportunity.id, user_id=user_id, role=role)
+        for role, assignee_ids in (("owner", owners), ("collaborator", collaborators))
+        for user_id in assignee_ids
+    ]
+    opportunity_id = new_opportunity.id
+    session.add_all([new_opportunity, *relations])
+    await session.commit()
+    logger.info(f"Created opportunity: {opportunity_id}")
 
-    return new_opportunity.id
+    return opportunity_id
 
 
 async def update_opportunity(
-    opportunity_id: UUID, update_data: dict, session: Session = None
+    opportunity_id: UUID, update_data: dict, session: AsyncSession
 ) -> bool:
     """
     オポチュニティ情報を更新
@@ -192,7 +202,7 @@ async def update_opportunity(
     Args:
         opportunity_id: 更新するオポチュニティのID
         update_data: 更新するフィールドと値
-        session: データベースセッション (省略可能)
+        session: データベースセッション
 
     Returns:
         更新が行われたかどうか
@@ -200,24 +210,18 @@ async def update_opportunity(
     Raises:
         ValueError: オポチュニティが存在しない、または参照先が存在しない場合
     """
-    # セッションがない場合は新しく取得
-    if session is None:
-        session = get_session()
     # オポチュニティが存在するか確認
-    opportunity = session.get(Opportunity, opportunity_id)
+    opportunity = await session.get(Opportunity, opportunity_id)
     if not opportunity:
         logger.warning(f"Opportunity not found: {opportunity_id}")
         raise ValueError(f"Opportunity not found: {opportunity_id}")
 
-    # 更新可能フィールド
-    allowed_fields = ["stage_id", "amount", "title", "expected_close_date"]
-
     updated = False
-    for field in allowed_fields:
+    for field in UPDATABLE_FIELDS:
         if field in update_data:
             # ステージIDが指定されている場合は存在確認
             if field == "stage_id":
-                stage = session.get(Stage, update_data[field])
+                stage = await master_cache.get_stage(update_data[field], session)
                 if not stage:
                     logger.warning(f"Stage not found: {update_data[field]}")
                     raise ValueError(f"Stage not found: {update_data[field]}")
@@ -232,19 +236,19 @@ async def update_opportunity(
     if updated:
         # 更新日時を設定
         opportunity.updated_at = datetime.now(UTC)
-        session.commit()
+        await session.commit()
         logger.info(f"Updated opportunity: {opportunity_id}")
 
     return updated
 
 
-async def delete_opportunity(opportunity_id: UUID, session: Session = None) -> bool:
+async def delete_opportunity(opportunity_id: UUID, session: AsyncSession) -> bool:
     """
     オポチュニティを削除
 
     Args:
         opportunity_id: 削除するオポチュニティのID
-        session: データベースセッション (省略可能)
+        session: データベースセッション
 
     Returns:
         削除が成功したかどうか
@@ -252,31 +256,429 @@ async def delete_opportunity(opportunity_id: UUID, session: Session = None) -> b
     Raises:
         ValueError: オポチュニティが存在しない場合
     """
-    # セッションがない場合は新しく取得
-    if session is None:
-        session = get_session()
     # オポチュニティが存在するか確認
-    opportunity = session.get(Opportunity, opportunity_id)
+    opportunity = await session.get(Opportunity, opportunity_id)
     if not opportunity:
         logger.warning(f"Opportunity not found: {opportunity_id}")
         raise ValueError(f"Opportunity not found: {opportunity_id}")
 
     # 関連するOpportunityUserを削除
-    opp_users = session.exec(
-        select(OpportunityUser).where(OpportunityUser.opportunity_id == opportunity_id)
+    opp_users = (
+        await session.exec(
+            select(OpportunityUser).where(
+                OpportunityUser.opportunity_id == opportunity_id
+            )
+        )
     ).all()
 
     for opp_user in opp_users:
-        session.delete(opp_user)
+        await session.delete(opp_user)
 
     # オポチュニティを削除
-    session.delete(opportunity)
-    session.commit()
+    await session.delete(opportunity)
+    await session.commit()
 
     logger.info(f"Deleted opportunity: {opportunity_id}")
     return True
 
 
+def _bulk_result(
+    index: int, status: str, opportunity_id: Optional[UUID] = None, error=None
+) -> Dict[str, Any]:
+    """一括操作の1件分の結果"""
+    return {"index": index, "status": status, "id": opportunity_id, "error": error}
+
+
+async def _apply_in_transactions(
+    rows: Sequence[Tuple[int, Any]],
+    session: AsyncSession,
+    apply_chunk: Callable[[Sequence[Tuple[int, Any]], AsyncSession], Awaitable[list]],
+    operation: str,
+    row_id: Callable[[Any], Optional[UUID]],
+) -> List[Dict[str, Any]]:
+    """
+    行を BULK_TRANSACTION_SIZE 件ずつ、それぞれ1つのトランザクションで処理する
+
+    トランザクションが失敗した場合はその範囲の行を "error" とし、以降の範囲の処理を続ける
+    """
+    results: List[Dict[str, Any]] = []
+    for start in range(0, len(rows), BULK_TRANSACTION_SIZE):
+        chunk = rows[start : start + BULK_TRANSACTION_SIZE]
+        try:
+            chunk_results = await apply_chunk(chunk, session)
+            await session.commit()
+        except SQLAlchemyError as e:
+            await session.rollback()
+            logger.warning(
+                f"Bulk {operation} of opportunities failed",
+                extra={"first_index": chunk[0][0], "row_count": len(chunk)},
+                exc_info=True,
+            )
+            chunk_results = [
+                _bulk_result(
+                    index,
+                    "error",
+                    row_id(data),
+                    f"Failed to {operation} opportunity: {type(e).__name__}",
+                )
+                for index, data in chunk
+            ]
+        results.extend(chunk_results)
+
+    # Core のSQL文による変更はORMのイベントで検知されないため、案件候補のキャッシュを破棄する
+    opportunity_candidate_cache.invalidate()
+    return results
+
+
+async def _insert_rows(
+    session: AsyncSession, table: Any, rows: List[Dict[str, Any]]
+) -> None:
+    """複数行のINSERT文で登録する（BULK_CHUNK_SIZE 行ずつ）"""
+    for start in range(0, len(rows), BULK_CHUNK_SIZE):
+        await session.execute(
+            insert(table).values(rows[start : start + BULK_CHUNK_SIZE])
+        )
+
+
+async def _create_chunk(
+    chunk: Sequence[Tuple[int, Dict[str, Any]]], session: AsyncSession
+) -> List[Dict[str, Any]]:
+    """オポチュニティと担当者を確認し、それぞれ複数行のINSERT文で登録する"""
+    customer_ids = await fetch_existing_ids(
+        session, Customer.id, {data["customer_id"] for _, data in chunk}
+    )
+    user_ids = await fetch_existing_ids(
+        session,
+        User.id,
+        {
+            user_id
+            for _, data in chunk
+            for user_id in (*data["owners"], *(data.get("collaborators") or []))
+        },
+    )
+
+    results: List[Dict[str, Any]] = []
+    opportunities: List[Dict[str, Any]] = []
+    assignees: List[Dict[str, Any]] = []
+    # 作成・更新日時はモデルの既定値と同じくタイムゾーンなしのUTCで記録する
+    now = datetime.utcnow()
+    for index, data in chunk:
+        assignments = [
+            (user_id, role)
+            for role, key in (("owner", "owners"), ("collaborator", "collaborators"))
+            for user_id in data.get(key) or []
+        ]
+        # 単件作成と同じ順序で参照先を確認する
+        if data["customer_id"] not in customer_ids:
+            error = f"Customer not found: {data['customer_id']}"
+        elif await master_cache.get_stage(data["stage_id"], session) is None:
+            error = f"Stage not found: {data['stage_id']}"
+        else:
+            missing = [user_id for user_id, _ in assignments if user_id not in user_ids]
+            error = f"User not found: {missing[0]}" if missing else None
+
+        if error is not None:
+            results.append(_bulk_result(index, "not_found", error=error))
+            continue
+
+        opportunity_id = uuid4()
+        opportunities.append(
+            {
+                "id": opportunity_id,
+                "customer_id": data["customer_id"],
+                "title": data["title"],
+                "amount": data["amount"],
+                "stage_id": data["stage_id"],
+                "expected_close_date": data["expected_close_date"],
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+        assignees.extend(
+            {
+                "id": uuid4(),
+                "opportunity_id": opportunity_id,
+                "user_id": user_id,
+                "role": role,
+                "created_at": now,
+            }
+            for user_id, role in assignments
+        )
+        results.append(_bulk_result(index, "created", opportunity_id))
+
+    await _insert_rows(session, Opportunity.__table__, opportunities)
+    await _insert_rows(session, OpportunityUser.__table__, assignees)
+    return results
+
+
+async def create_opportunities_bulk(
+    rows: Sequence[Tuple[int, Dict[str, Any]]], session: AsyncSession
+) -> List[Dict[str, Any]]:
+    """
+    オポチュニティを一括で作成
+
+    BULK_TRANSACTION_SIZE 件ずつのトランザクションで、顧客・担当者の存在確認を
+    それぞれ1回のIN句のクエリで行い、オポチュニティと担当者を複数行のINSERTで登録する
+
+    Args:
+        rows: (行番号, オポチュニティ作成データ) のリスト。データは検証済みで、
+            expected_close_date は日付であること
+        session: データベースセッション
+
+    Returns:
+        行ごとの結果（index, status, id, error）。status は作成した行が "created"、
+        参照先が存在しない行が "not_found"、トランザクションが失敗した行が "error"
+    """
+    results = await _apply_in_transactions(
+        rows, session, _create_chunk, "create", lambda data: None
+    )
+    logger.info(
+        "Created opportunities in bulk",
+        extra={
+            "row_count": len(rows),
+            "created_count": sum(r["status"] == "created" for r in results),
+        },
+    )
+    return results
+
+
+def _update_from_values(
+    fields: Sequence[str], rows: List[Dict[str, Any]], updated_at: datetime
+) -> Any:
+    """
+    UPDATE ... FROM (VALUES ...) で複数のオポチュニティを1つのSQL文で更新する（PostgreSQL用）
+
+    型のないバインド変数はtextとして推論されるため、VALUESには文字列を渡して
+    各カラムの型にキャストする
+    """
+    table = Opportunity.__table__
+    names = ("id", *fields)
+    data = values(*(column(name, String) for name in names), name="v").data(
+        [tuple(str(row[name]) for name in names) for row in rows]
+    )
+    return (
+        update(table)
+        .where(table.c.id == cast(data.c.id, table.c.id.type))
+        .values(
+            updated_at=updated_at,
+            **{field: cast(data.c[field], table.c[field].type) for field in fields},
+        )
+    )
+
+
+async def _update_chunk(
+    chunk: Sequence[Tuple[int, Dict[str, Any]]], session: AsyncSession
+) -> List[Dict[str, Any]]:
+    """オポチュニティを確認し、更新する項目の組み合わせごとに1つのUPDATE文で更新する"""
+    existing_ids = await fetch_existing_ids(
+        session, Opportunity.id, {data["id"] for _, data in chunk}
+    )
+
+    results: List[Dict[str, Any]] = []
+    # オポチュニティごとの更新内容（同じIDが複数回ある場合は後の行を優先する）
+    changes: Dict[UUID, Dict[str, Any]] = {}
+    for index, data in chunk:
+        opportunity_id = data["id"]
+        fields = {f: data[f] for f in UPDATABLE_FIELDS if data.get(f) is not None}
+        if opportunity_id not in existing_ids:
+            error = f"Opportunity not found: {opportunity_id}"
+        elif (
+            "stage_id" in fields
+            and await master_cache.get_stage(fields["stage_id"], session) is None
+        ):
+            error = f"Stage not found: {fields['stage_id']}"
+        else:
+            error = None
+
+        if error is not None:
+            results.append(_bulk_result(index, "not_found", opportunity_id, error))
+        elif not fields:
+            results.append(_bulk_result(index, "unchanged", opportunity_id))
+        else:
+            changes.setdefault(opportunity_id, {}).update(fields)
+            results.append(_bulk_result(index, "updated", opportunity_id))
+
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for opportunity_id, fields in changes.items():
+        groups.setdefault(tuple(sorted(fields)), []).append(
+            {"id": opportunity_id, **fields}
+        )
+
+    table = Opportunity.__table__
+    # 一括作成・モデルの既定値と同じくタイムゾーンなしのUTCで記録する
+    updated_at = datetime.utcnow()
+    for fields, group in groups.items():
+        if session.bind.dialect.name == "postgresql":
+            await session.execute(_update_from_values(fields, group, updated_at))
+        else:
+            # UPDATE ... FROM (VALUES ...) に対応しないDBでは1つのUPDATE文をexecutemanyで実行する
+            await session.execute(
+                update(table)
+                .where(table.c.id == bindparam("b_id"))
+                .values(
+                    updated_at=updated_at,
+                    **{field: bindparam(f"b_{field}") for field in fields},
+                ),
+                [{f"b_{key}": value for key, value in row.items()} for row in group],
+            )
+    return results
+
+
+async def update_opportunities_bulk(
+    rows: Sequence[Tuple[int, Dict[str, Any]]], session: AsyncSession
+) -> List[Dict[str, Any]]:
+    """
+    オポチュニティを一括で更新
+
+    BULK_TRANSACTION_SIZE 件ずつのトランザクションで、オポチュニティの存在確認を
+    1回のIN句のクエリで行い、更新する項目の組み合わせごとに1つのUPDATE文で更新する。
+    PostgreSQLでは UPDATE ... FROM (VALUES ...) を使用する
+
+    Args:
+        rows: (行番号, 更新データ) のリスト。更新データは検証済みで、id と
+            更新するフィールド（値がNoneのフィールドは更新しない）を含むこと
+        session: データベースセッション
+
+    Returns:
+        行ごとの結果（index, status, id, error）。status は更新した行が "updated"、
+        更新するフィールドがない行が "unchanged"、参照先が存在しない行が "not_found"、
+        トランザクションが失敗した行が "error"
+    """
+    results = await _apply_in_transactions(
+        rows, session, _update_chunk, "update", lambda data: data["id"]
+    )
+    logger.info(
+        "Updated opportunities in bulk",
+        extra={
+            "row_count": len(rows),
+            "updated_count": sum(r["status"] == "updated" for r in results),
+        },
+    )
+    return results
+
+
+async def _delete_chunk(
+    chunk: Sequence[Tuple[int, UUID]], session: AsyncSession
+) -> List[Dict[str, Any]]:
+    """
+    オポチュニティを確認し、担当者とオポチュニティをそれぞれ1つのDELETE文で削除する
+
+    アクティビティログが記録されているオポチュニティは、活動履歴を残すため削除しない
+    """
+    existing_ids = await fetch_existing_ids(
+        session, Opportunity.id, {opportunity_id for _, opportunity_id in chunk}
+    )
+    logged_ids = set()
+    if existing_ids:
+        logged_ids = await fetch_existing_ids(
+            session, ActivityLog.opportunity_id, existing_ids
+        )
+    deletable_ids = existing_ids - logged_ids
+    if deletable_ids:
+        await session.execute(
+            delete(OpportunityUser.__table__).where(
+                OpportunityUser.__table__.c.opportunity_id.in_(deletable_ids)
+            )
+        )
+        await session.execute(
+            delete(Opportunity.__table__).where(
+                Opportunity.__table__.c.id.in_(deletable_ids)
+            )
+        )
+
+    results = []
+    for index, opportunity_id in chunk:
+        if opportunity_id in deletable_ids:
+            results.append(_bulk_result(index, "deleted", opportunity_id))
+        elif opportunity_id in logged_ids:
+            results.append(
+                _bulk_result(
+                    index,
+                    "conflict",
+                    opportunity_id,
+                    f"Opportunity has activity logs: {opportunity_id}",
+                )
+            )
+        else:
+            results.append(
+                _bulk_result(
+                    index,
+                    "not_found",
+                    opportunity_id,
+                    f"Opportunity not found: {opportunity_id}",
+                )
+            )
+    return results
+
+
+async def delete_opportunities_bulk(
+    rows: Sequence[Tuple[int, UUID]], session: AsyncSession
+) -> List[Dict[str, Any]]:
+    """
+    オポチュニティを一括で削除
+
+    BULK_TRANSACTION_SIZE 件ずつのトランザクションで、オポチュニティの存在確認を
+    1回のIN句のクエリで行い、担当者とオポチュニティをそれぞれ1つのDELETE文で削除する
+
+    Args:
+        rows: (行番号, オポチュニティID) のリスト
+        session: データベースセッション
+
+    Returns:
+        行ごとの結果（index, status, id, error）。status は削除した行が "deleted"、
+        存在しない行が "not_found"、トランザクションが失敗した行が "error"
+    """
+    results = await _apply_in_transactions(
+        rows, session, _delete_chunk, "delete", lambda opportunity_id: opportunity_id
+    )
+    logger.info(
+        "Deleted opportunities in bulk",
+        extra={
+            "row_count": len(rows),
+            "deleted_count": sum(r["status"] == "deleted" for r in results),
+        },
+    )
+    return results
+
+
+def _encode_search_cursor(expected_close_date: date, opportunity_id: UUID) -> str:
+    """
+    検索結果の続きを取得するためのカーソルを生成
+
+    Args:
+        expected_close_date: 最終行の予想クロージング日
+        opportunity_id: 最終行のオポチュニティID
+
+    Returns:
+        不透明なカーソル文字列
+    """
+    raw = f"{expected_close_date.isoformat()}|{opportunity_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_search_cursor(cursor: str) -> Tuple[date, UUID]:
+    """
+    カーソル文字列を(予想クロージング日, オポチュニティID)に復元
+
+    Args:
+        cursor: _encode_search_cursorで生成したカーソル
+
+    Returns:
+        (予想クロージング日, オポチュニティID)
+
+    Raises:
+        ValueError: カーソルが不正な場合
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        close_date, opportunity_id = raw.split("|")
+        return date.fromisoformat(close_date), UUID(opportunity_id)
+    except (ValueError, UnicodeDecodeError):
+        logger.warning(f"Invalid search cursor: {cursor}")
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
 async def search_opportunities(
     customer_id: Optional[UUID] = None,
     title: Optional[str] = None,
@@ -285,11 +687,16 @@ async def search_opportunities(
     to_date: Optional[date] = None,
     min_amount: Optional[int] = None,
     max_amount: Optional[int] = None,
-    session: Session = None,
-) -> List[Dict]:
+    limit: int = DEFAULT_SEARCH_LIMIT,
+    cursor: Optional[str] = None,
+    *,
+    session: AsyncSession,
+) -> Dict:
     """
     オポチュニティを検索
 
+    結果は(予想クロージング日, ID)の昇順で返し、キーセット方式でページングする。
+
     Args:
         customer_id: 顧客ID
         title: 案件名（部分一致）
@@ -298,13 +705,20 @@ async def search_opportunities(
         to_date: 予想クロージング日終了
         min_amount: 金額下限（任意）
         max_amount: 金額上限（任意）
+        limit: 1ページあたりの最大件数
+        cursor: 前ページのnext_cursor（省略時は先頭から）
         session: データベースセッション
 
     Returns:
-        検索条件に合致するオポチュニティのリスト
+        検索結果（items）と次ページ取得用カーソル（next_cursor）の辞書
+
+    Raises:
+        ValueError: カーソルが不正な場合
     """
-    # 検索クエリを構築
-    query = select(Opportunity)
+    # 顧客を結合して検索クエリを構築（ステージ名はマスタキャッシュから取得する）
+    query = select(Opportunity, Customer).join(
+        Customer, Customer.id == Opportunity.customer_id
+    )
 
     if customer_id:
         query = query.where(Opportunity.customer_id == customer_id)
@@ -327,35 +741,64 @@ async def search_opportunities(
     if max_amount:
         query = query.where(Opportunity.amount <= max_amount)
 
-    # セッションがない場合は新しく取得
-    if session is None:
-        session = get_session()
+    # カーソル以降の行のみを対象にする
+    if cursor:
+        last_close_date, last_id = _decode_search_cursor(cursor)
+        query = query.where(
+            or_(
+                Opportunity.expected_close_date > last_close_date,
+                and_(
+                    Opportunity.expected_close_date == last_close_date,
+                    Opportunity.id > last_id,
+                ),
+            )
+        )
+
+    # 次ページの有無を判定するため1件多く取得
+    query = query.order_by(Opportunity.expected_close_date, Opportunity.id).limit(
+        limit + 1
+    )
 
     # 検索実行
-    opportunities = session.exec(query).all()
+    rows = (await session.exec(query)).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    # ステージはマスタキャッシュから取得し、キャッシュにない場合はDBから取得する
+    stages = {}
+    for row_stage_id in {opp.stage_id for opp, _ in rows}:
+        stage = await master_cache.get_stage(row_stage_id, session)
+        if stage is None:
+            stage = await session.get(Stage, row_stage_id)
+        if stage is None:
+            # 外部キーにより通常は発生しない（参照先のないステージの案件は返さない）
+            logger.error(f"Stage not found for search result: {row_stage_id}")
+        stages[row_stage_id] = stage
 
     # 検索結果をフォーマット
-    result = []
-    for opp in opportunities:
-        customer = session.get(Customer, opp.customer_id)
-        stage = session.get(Stage, opp.stage_id)
+    items = [
+        {
+            "id": opp.id,
+            "customer": {
+                "id": customer.id,
+                "name": customer.name,
+            },
+            "title": opp.title,
+            "amount": opp.amount,
+            "stage": {
+                "id": stage.id,
+                "name": stage.name,
+            },
+            "expected_close_date": opp.expected_close_date.isoformat(),
+        }
+        for opp, customer in rows
+        if (stage := stages[opp.stage_id]) is not None
+    ]
 
-        result.append(
-            {
-                "id": opp.id,
-                "customer": {
-                    "id": customer.id,
-                    "name": customer.name,
-                },
-                "title": opp.title,
-                "amount": opp.amount,
-                "stage": {
-                    "id": stage.id,
-                    "name": stage.name,
-                },
-                "expected_close_date": opp.expected_close_date.isoformat(),
-            }
-        )
+    next_cursor = None
+    if has_next:
+        last_opp = rows[-1][0]
+        next_cursor = _encode_search_cursor(last_opp.expected_close_date, last_opp.id)
 
-    logger.info(f"Search opportunities: found {len(result)} results")
-    return result
+    logger.info(f"Search opportunities: found {len(items)} results")
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,175 @@
+"""
+Slackイベント重複排除サービス
+
+Slackは応答が遅い場合などに同じイベントを再送するため、event_id と
+メッセージの (channel, ts) をキーに受信済みイベントを記録し、再送分を処理前に破棄する
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.core.logger import get_slack_logger
+from src.db.session import session_scope
+from src.models.slack import SlackEventReceipt
+
+logger = get_slack_logger()
+
+# 期限切れの受信記録をDBから削除する間隔（記録した件数）
+RECEIPT_PURGE_INTERVAL = 1000
+
+
+def get_event_keys(event_data: Dict[str, Any]) -> List[str]:
+    """
+    イベントの重複判定に使うキーを取得する
+
+    Args:
+        event_data: Slackから受信したイベントデータ
+
+    Returns:
+        event_id と (channel, ts) から作成したキーのリスト
+    """
+    keys = []
+    if event_data.get("event_id"):
+        keys.append(f"event:{event_data['event_id']}")
+
+    event = event_data.get("event", {})
+    if event.get("channel") and event.get("ts"):
+        keys.append(f"message:{event['channel']}:{event['ts']}")
+    return keys
+
+
+class SlackEventDeduplicator:
+    """
+    受信済みSlackイベントの重複排除
+
+    プロセス内のLRU（TTL付き）で判定し、複数ワーカー構成の場合は
+    DBの受信記録テーブルへの登録（主キーの一意制約）でワーカー間の重複も排除する
+    """
+
+    def __init__(self, maxsize: int, ttl: float, use_db: bool):
+        """
+        重複排除の初期化
+
+        Args:
+            maxsize: メモリに保持する受信記録の最大件数
+            ttl: 受信記録の保持期間（秒）
+            use_db: DBの受信記録テーブルも使用するかどうか
+        """
+        self.ttl = ttl
+        self.use_db = use_db
+        self.seen: TTLCache[str, bool] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.duplicates = 0
+        self._claims = 0
+
+    async def is_duplicate(self, event_data: Dict[str, Any]) -> bool:
+        """
+        受信済みのイベントかどうかを判定し、未受信であれば受信済みとして記録する
+
+        Args:
+            event_data: Slackから受信したイベントデータ
+
+        Returns:
+            受信済み（再送）のイベントであればTrue
+        """
+        keys = get_event_keys(event_data)
+        if not keys:
+            return False
+
+        # 判定と記録の間にawaitを挟まないため、同じプロセス内では同時受信でも1件だけが通る
+        if any(self.seen.get(key) for key in keys):
+            return self._drop(event_data)
+        for key in keys:
+            self.seen.set(key, True)
+
+        if self.use_db:
+            try:
+                claimed = await self._claim_in_db(keys)
+            except Exception:
+                # 登録できなかったイベントを再送時に受け付けられるよう、受信記録を取り消す
+                for key in keys:
+                    self.seen.delete(key)
+                raise
+            if not claimed:
+                return self._drop(event_data)
+        return False
+
+    async def release(self, event_data: Dict[str, Any]) -> None:
+        """
+        受信記録を取り消す（処理を受け付けられず、Slackに再送させる場合に使用）
+
+        Args:
+            event_data: Slackから受信したイベントデータ
+        """
+        keys = get_event_keys(event_data)
+        for key in keys:
+            self.seen.delete(key)
+
+        if self.use_db and keys:
+            async with session_scope() as session:
+                await session.execute(
+                    delete(SlackEventReceipt).where(
+                        SlackEventReceipt.event_key.in_(keys)
+                    )
+                )
+                await session.commit()
+
+    def _drop(self, event_data: Dict[str, Any]) -> bool:
+        """重複イベントを記録して True を返す"""
+        self.duplicates += 1
+        logger.info(
+            "Duplicate Slack event dropped",
+            extra={"event_id": event_data.get("event_id")},
+        )
+        return True
+
+    async def _claim_in_db(self, keys: List[str]) -> bool:
+        """
+        DBに受信記録を登録する
+
+        Args:
+            keys: イベントのキー
+
+        Returns:
+            登録できた（他のワーカーが未受信）場合はTrue
+        """
+        async with session_scope() as session:
+            self._claims += 1
+            if self._claims % RECEIPT_PURGE_INTERVAL == 0:
+                # 保持期間を過ぎた受信記録を削除
+                cutoff = datetime.utcnow() - timedelta(seconds=self.ttl)
+                await session.execute(
+                    delete(SlackEventReceipt).where(
+                        SlackEventReceipt.created_at < cutoff
+                    )
+                )
+                await session.commit()
+
+            session.add_all([SlackEventReceipt(event_key=key) for key in keys])
+            try:
+                await session.commit()
+            except IntegrityError:
+                await session.rollback()
+                return False
+        return True
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        重複排除のメトリクスを取得する
+
+        Returns:
+            破棄した重複イベント数と受信記録キャッシュのメトリクス
+        """
+        return {"duplicates": self.duplicates, "cache": self.seen.metrics()}
+
+
+# シングルトンインスタンス
+slack_event_deduplicator = SlackEventDeduplicator(
+    maxsize=settings.SLACK_EVENT_DEDUP_MAX_SIZE,
+    ttl=settings.SLACK_EVENT_DEDUP_TTL,
+    use_db=settings.SLACK_EVENT_DEDUP_USE_DB,
+)
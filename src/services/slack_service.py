@@ -2,13 +2,64 @@
 Slackサービスモジュール - API層とSlack処理モジュールの橋渡し
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from src.agents.date_parser import RelativeDateParser
+from src.agents.extraction import EXTRACTION_SYSTEM_PROMPT, TieredExtractor
+from src.agents.llm_batcher import ExtractionBatcher
+from src.agents.llm_client import LLMClient
+from src.core.config import settings
 from src.core.logger import get_slack_logger
+from src.db.session import session_scope
+from src.services.activity_matcher_service import (
+    activity_type_matcher_provider,
+    refresh_activity_type_matcher,
+)
+from src.services.activity_pipeline import ActivityIngestionPipeline
+from src.services.customer_index_service import (
+    customer_index_provider,
+    refresh_customer_index,
+)
+from src.services.master_cache_service import master_cache
+from src.services.opportunity_matcher_service import opportunity_candidate_cache
+from src.services.slack_dedup_service import slack_event_deduplicator
+from src.services.user_service import slack_user_resolver
+from src.services.work_queue import QueueFullError, WorkQueue
+from src.slack.bot import slack_bot
 from src.slack.handlers import slack_event_handler
 
 logger = get_slack_logger()
 
+# 日付表現パーサーと抽出器はDBを参照しないため、読み込み時にSlackハンドラへ設定する
+slack_event_handler.date_parser = RelativeDateParser(settings.SCHEDULER_TIMEZONE)
+_llm_client = LLMClient(
+    api_key=settings.OPENAI_API_KEY,
+    model=settings.OPENAI_MODEL,
+    api_base=settings.OPENAI_API_BASE,
+    timeout=settings.OPENAI_TIMEOUT,
+    max_connections=settings.OPENAI_MAX_CONNECTIONS,
+)
+slack_event_handler.extractor = TieredExtractor(
+    llm=_llm_client,
+    threshold=settings.EXTRACTION_CONFIDENCE_THRESHOLD,
+    cache_size=settings.EXTRACTION_LLM_CACHE_MAX_SIZE,
+    cache_ttl=settings.EXTRACTION_LLM_CACHE_TTL,
+    batcher=ExtractionBatcher(
+        _llm_client,
+        system_prompt=EXTRACTION_SYSTEM_PROMPT,
+        max_batch_size=settings.EXTRACTION_BATCH_MAX_SIZE,
+        max_wait_ms=settings.EXTRACTION_BATCH_MAX_WAIT_MS,
+        mode=settings.EXTRACTION_BATCH_MODE,
+    ),
+)
+
+# Slackメッセージをアクティビティログとして記録するパイプライン
+activity_ingestion_pipeline = ActivityIngestionPipeline(
+    handler=slack_event_handler,
+    stage_timeout=settings.ACTIVITY_PIPELINE_STAGE_TIMEOUT,
+    timezone=settings.SCHEDULER_TIMEZONE,
+)
+
 
 # イベントタイプ定数
 class EventType:
@@ -34,6 +85,31 @@ async def handle_slack_verification_challenge(
     return {"challenge": challenge}
 
 
+def _get_message_event(event_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    処理対象のメッセージイベントを取り出す
+
+    Args:
+        event_data: Slackから受信したイベントデータ
+
+    Returns:
+        メッセージイベント。処理対象外の場合はNone
+    """
+    event = event_data.get("event", {})
+    event_type = event.get("type")
+
+    if event_type != EventType.MESSAGE:
+        # 未対応のイベントタイプ
+        logger.info(f"Unsupported inner event type: {event_type}")
+        return None
+
+    if not event.get("user") or not event.get("text"):
+        logger.warning("Received message event without user or text")
+        return None
+
+    return event
+
+
 async def process_slack_event(event_data: Dict[str, Any]) -> bool:
     """
     Slackイベントを処理する
@@ -44,36 +120,108 @@ async def process_slack_event(event_data: Dict[str, Any]) -> bool:
     Returns:
         処理が成功したかどうか
     """
-    event = event_data.get("event", {})
-    event_type = event.get("type")
+    event = _get_message_event(event_data)
+    if event is None:
+        return False
 
     # メッセージイベントの処理
-    if event_type == EventType.MESSAGE:
-        user_id = event.get("user")
-        text = event.get("text")
-        channel = event.get("channel")
-        ts = event.get("ts")
-
-        if not user_id or not text:
-            logger.warning("Received message event without user or text")
-            return False
-
-        logger.info(
-            "Processing message through service layer",
-            extra={
-                "user_id": user_id,
-                "channel": channel,
-                "ts": ts,
-                "text_length": len(text) if text else 0,
-            },
-        )
-
-        # Slackハンドラにイベント処理を委譲
-        await slack_event_handler.process_message_event(
-            user_id=user_id, text=text, channel=channel, ts=ts, event_data=event_data
-        )
-        return True
-
-    # 未対応のイベントタイプ
-    logger.info(f"Unsupported inner event type: {event_type}")
-    return False
+    user_id = event.get("user")
+    text = event.get("text")
+    channel = event.get("channel")
+    ts = event.get("ts")
+
+    logger.info(
+        "Processing message through service layer",
+        extra={
+            "user_id": user_id,
+            "channel": channel,
+            "ts": ts,
+            "text_length": len(text) if text else 0,
+        },
+    )
+
+    # マスタが変更されていれば活動種別マッチャー・顧客名の索引を再構築する
+    await refresh_activity_type_matcher()
+    await refresh_customer_index()
+
+    # 送信者の解決から記録までをパイプラインで処理する
+    async with session_scope() as session:
+        await activity_ingestion_pipeline.run(event_data, session)
+    return True
+
+
+# Slackイベントをバックグラウンドで処理するワークキュー
+slack_event_queue = WorkQueue(
+    name="slack_events",
+    handler=process_slack_event,
+    workers=settings.SLACK_EVENT_WORKERS,
+    max_depth=settings.SLACK_EVENT_QUEUE_MAX_DEPTH,
+    put_timeout=settings.SLACK_EVENT_ENQUEUE_TIMEOUT,
+)
+
+
+async def enqueue_slack_event(event_data: Dict[str, Any]) -> bool:
+    """
+    Slackイベントをワークキューに投入する
+
+    Slackの3秒以内の応答期限に間に合わせるため、処理対象かどうかだけを判定して
+    実際の処理はワーカーに任せる
+
+    Args:
+        event_data: Slackから受信したイベントデータ
+
+    Returns:
+        処理対象としてキューに投入したかどうか（再送された重複イベントはFalse）
+
+    Raises:
+        QueueFullError: キューが上限に達している場合
+    """
+    # 再送された重複イベントは解析・DB処理の前に破棄する
+    if await slack_event_deduplicator.is_duplicate(event_data):
+        return False
+
+    if _get_message_event(event_data) is None:
+        return False
+
+    try:
+        await slack_event_queue.put(event_data)
+    except QueueFullError:
+        # 受け付けられなかったイベントはSlackの再送で処理できるよう受信記録を取り消す
+        await slack_event_deduplicator.release(event_data)
+        raise
+    return True
+
+
+async def start_slack_event_queue() -> None:
+    """Slackイベントのワーカーを起動する"""
+    slack_event_queue.start()
+
+
+async def stop_slack_event_queue() -> None:
+    """キューに残ったSlackイベントを処理し終えてからワーカーを停止する"""
+    await slack_event_queue.stop(drain_timeout=settings.SLACK_EVENT_DRAIN_TIMEOUT)
+    # ワーカーの停止後に、送信中のLLMへの問い合わせを待って接続プールを閉じる
+    await slack_event_handler.extractor.close()
+
+
+def get_slack_metrics() -> Dict[str, Any]:
+    """
+    Slack連携のメトリクスを取得する
+
+    Returns:
+        イベントキュー・重複排除・ユーザーキャッシュ・活動種別マッチャー・
+        顧客名の索引・案件候補のキャッシュ・マスタキャッシュ・抽出（LLM補完）・
+        取り込みパイプライン・APIレート制限のメトリクス
+    """
+    return {
+        "event_queue": slack_event_queue.metrics(),
+        "dedup": slack_event_deduplicator.metrics(),
+        "user_cache": slack_user_resolver.metrics(),
+        "activity_matcher": activity_type_matcher_provider.metrics(),
+        "customer_index": customer_index_provider.metrics(),
+        "opportunity_candidates": opportunity_candidate_cache.metrics(),
+        "master_cache": master_cache.metrics(),
+        "extraction": slack_event_handler.extractor.metrics(),
+        "ingestion": activity_ingestion_pipeline.metrics(),
+        "rate_limiter": slack_bot.rate_limiter.metrics(),
+    }
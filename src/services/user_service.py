@@ -0,0 +1,185 @@
+"""
+ユーザー関連サービス
+
+Slackから受信したメッセージの送信者（Slack ユーザーID）を、DBのユーザーと
+Slackのプロフィールに解決する。解決結果はメモリにキャッシュし、
+起動時に全ユーザーを一括で読み込んでおく
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import event, inspect
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.core.logger import get_app_logger
+from src.db.pending_changes import PendingChanges
+from src.db.session import session_scope
+from src.models.entity import User
+from src.slack.bot import slack_bot
+
+logger = get_app_logger()
+
+# DBに存在しないSlack ユーザーIDを表すキャッシュ値
+_NOT_FOUND: Dict[str, Any] = {}
+
+
+class SlackUserResolver:
+    """
+    Slack ユーザーIDからユーザーを解決するキャッシュ付きのリゾルバ
+
+    DBに存在しないSlack ユーザーIDも「存在しない」結果としてキャッシュし、
+    同じ送信者からのメッセージのたびにDBへ問い合わせないようにする
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        リゾルバの初期化
+
+        Args:
+            maxsize: キャッシュする最大件数
+            ttl: キャッシュの有効期限（秒）
+        """
+        self.users: TTLCache[str, Dict[str, Any]] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def _cache_user(self, user_id: Any, name: str, slack_id: str) -> Dict[str, Any]:
+        """ユーザーの解決結果をキャッシュする"""
+        resolved = {"id": user_id, "name": name, "slack_id": slack_id}
+        self.users.set(slack_id, resolved)
+        return resolved
+
+    async def warm(self, session: AsyncSession) -> int:
+        """
+        全ユーザーを1回のクエリで読み込み、キャッシュを温める
+
+        Args:
+            session: データベースセッション
+
+        Returns:
+            読み込んだユーザー数
+        """
+        result = await session.exec(select(User.id, User.name, User.slack_id))
+        count = 0
+        for user_id, name, slack_id in result:
+            self._cache_user(user_id, name, slack_id)
+            count += 1
+
+        logger.info("Slack user cache warmed", extra={"user_count": count})
+        return count
+
+    async def resolve_user(
+        self, slack_id: str, session: AsyncSession
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Slack ユーザーIDに対応するユーザーを取得する
+
+        Args:
+            slack_id: Slack ユーザーID
+            session: データベースセッション（キャッシュにない場合のみ使用）
+
+        Returns:
+            ユーザー（id, name, slack_id）。存在しない場合はNone
+        """
+        cached = self.users.get(slack_id)
+        if cached is not None:
+            return cached or None
+
+        result = await session.exec(
+            select(User.id, User.name).where(User.slack_id == slack_id)
+        )
+        row = result.first()
+        if row is None:
+            self.users.set(slack_id, _NOT_FOUND)
+            return None
+        return self._cache_user(row[0], row[1], slack_id)
+
+    async def get_slack_profile(self, slack_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Slack ユーザーIDに対応するSlackのプロフィールを取得する
+
+        Args:
+            slack_id: Slack ユーザーID
+
+        Returns:
+            Slackのユーザー情報。取得できなかった場合はNone
+        """
+        response = await slack_bot.get_user_info(slack_id)
+        if not response or not response.get("ok"):
+            return None
+        return response.get("user")
+
+    def invalidate(self, slack_id: Optional[str] = None) -> None:
+        """
+        キャッシュした解決結果を破棄する
+
+        Args:
+            slack_id: Slack ユーザーID（省略時はすべて破棄）
+        """
+        if slack_id is None:
+            self.users.clear()
+        else:
+            self.users.delete(slack_id)
+        slack_bot.invalidate_user_info(slack_id)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        キャッシュのメトリクスを取得する
+
+        Returns:
+            ユーザー解決結果とSlackプロフィールのキャッシュのメトリクス
+        """
+        return {
+            "users": self.users.metrics(),
+            "slack_profiles": slack_bot.user_info_cache.metrics(),
+        }
+
+
+# シングルトンインスタンス
+slack_user_resolver = SlackUserResolver(
+    maxsize=settings.SLACK_USER_CACHE_MAX_SIZE,
+    ttl=settings.SLACK_USER_CACHE_TTL,
+)
+
+
+def _invalidate_slack_ids(slack_ids: Iterable[str]) -> None:
+    """Slack ユーザーIDに該当するキャッシュを破棄する"""
+    for slack_id in slack_ids:
+        slack_user_resolver.invalidate(slack_id)
+
+
+# コミットされたユーザーの変更に該当するキャッシュを破棄する
+_pending_invalidation = PendingChanges("invalidated_slack_ids", _invalidate_slack_ids)
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user_cache(mapper, connection, target: User) -> None:
+    """
+    ユーザーの登録・更新・削除時に該当するキャッシュを破棄する
+
+    ORMを経由しない一括UPDATE/DELETEでは呼ばれないため、その場合は
+    slack_user_resolver.invalidate() を明示的に呼び出すこと
+    """
+    slack_ids = {target.slack_id}
+    # Slack IDが変更された場合は変更前のIDも破棄する
+    slack_ids.update(inspect(target).attrs.slack_id.history.deleted or ())
+    _invalidate_slack_ids(slack_ids)
+
+    # コミット前に他のセッションが変更前の内容を再キャッシュする場合に備え、コミット後にも破棄する
+    _pending_invalidation.record(target, slack_ids)
+
+
+async def warm_slack_user_cache() -> None:
+    """
+    起動時にSlack ユーザーIDの解決キャッシュを温める
+
+    キャッシュは最適化のため、読み込みに失敗しても起動は継続する
+    """
+    try:
+        async with session_scope() as session:
+            await slack_user_resolver.warm(session)
+    except Exception as e:
+        logger.warning("Failed to warm Slack user cache", extra={"error": str(e)})
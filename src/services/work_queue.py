@@ -0,0 +1,230 @@
+"""
+非同期ワークキューモジュール - 受け付けた処理をプロセス内のワーカーでバックグラウンド実行する
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from src.core.logger import get_app_logger
+
+logger = get_app_logger()
+
+# レイテンシの分位点計算に保持する直近のサンプル数
+LATENCY_SAMPLE_SIZE = 1000
+
+
+class QueueFullError(Exception):
+    """キューが上限に達しており、処理を受け付けられない場合の例外"""
+
+
+class LatencyStats:
+    """処理段階ごとのレイテンシ統計"""
+
+    def __init__(self, sample_size: int = LATENCY_SAMPLE_SIZE):
+        """
+        レイテンシ統計の初期化
+
+        Args:
+            sample_size: 分位点計算に保持する直近のサンプル数
+        """
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: Deque[float] = deque(maxlen=sample_size)
+
+    def record(self, seconds: float) -> None:
+        """
+        レイテンシを記録する
+
+        Args:
+            seconds: 経過秒数
+        """
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.samples.append(seconds)
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        統計値を取得する
+
+        Returns:
+            件数・平均・p50・p95・最大（ミリ秒）
+        """
+        samples = sorted(self.samples)
+
+        def percentile(p: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(len(samples) * p))] * 1000
+
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(percentile(0.5), 3),
+            "p95_ms": round(percentile(0.95), 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class WorkQueue:
+    """
+    上限付きの非同期ワークキュー
+
+    受け付けた項目をasyncio.Queueに積み、固定数のワーカーがハンドラで処理する。
+    キューが満杯の場合は一定時間だけ投入を待機させ（バックプレッシャー）、
+    それでも空かなければ QueueFullError を送出する
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], Awaitable[Any]],
+        workers: int,
+        max_depth: int,
+        put_timeout: float,
+    ):
+        """
+        ワークキューの初期化
+
+        Args:
+            name: キュー名（ログ・メトリクス用）
+            handler: 項目を処理するコルーチン関数
+            workers: ワーカー数
+            max_depth: キューに保持できる最大件数
+            put_timeout: キューが満杯の場合に投入を待機する秒数
+        """
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.max_depth = max_depth
+        self.put_timeout = put_timeout
+        self.enqueued = 0
+        self.rejected = 0
+        self.failed = 0
+        self.latency = {
+            "enqueue": LatencyStats(),  # 投入待ち（バックプレッシャー）
+            "queue_wait": LatencyStats(),  # 投入からワーカーが取り出すまで
+            "process": LatencyStats(),  # ハンドラの処理時間
+            "total": LatencyStats(),  # 投入から処理完了まで
+        }
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        """ワーカーが起動しているかどうか"""
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """ワーカーを起動する（実行中のイベントループ上で呼び出すこと）"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_depth)
+        self._tasks = [
+            asyncio.ensure_future(self._worker(i)) for i in range(self.workers)
+        ]
+        logger.info(
+            "Work queue started",
+            extra={"queue": self.name, "workers": self.workers},
+        )
+
+    async def put(self, item: Any) -> None:
+        """
+        項目をキューに投入する
+
+        Args:
+            item: ハンドラに渡す項目
+
+        Raises:
+            QueueFullError: 待機時間内にキューが空かなかった場合
+        """
+        if not self.running:
+            self.start()
+
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(
+                self._queue.put((started, item)), timeout=self.put_timeout
+            )
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            logger.warning(
+                "Work queue is full",
+                extra={"queue": self.name, "max_depth": self.max_depth},
+            )
+            raise QueueFullError(f"Work queue is full: {self.name}")
+
+        self.enqueued += 1
+        self.latency["enqueue"].record(time.monotonic() - started)
+
+    async def _worker(self, worker_id: int) -> None:
+        """
+        キューから項目を取り出して処理し続けるワーカー
+
+        Args:
+            worker_id: ワーカー番号
+        """
+        while True:
+            enqueued_at, item = await self._queue.get()
+            dequeued_at = time.monotonic()
+            self.latency["queue_wait"].record(dequeued_at - enqueued_at)
+            try:
+                await self.handler(item)
+            except Exception as e:
+                # 1件の失敗でワーカーを止めない
+                self.failed += 1
+                logger.error(
+                    "Work queue item failed",
+                    extra={"queue": self.name, "worker": worker_id, "error": str(e)},
+                )
+            finally:
+                finished_at = time.monotonic()
+                self.latency["process"].record(finished_at - dequeued_at)
+                self.latency["total"].record(finished_at - enqueued_at)
+                self._queue.task_done()
+
+    async def stop(self, drain_timeout: float) -> None:
+        """
+        キューに残った項目を処理し終えてからワーカーを停止する
+
+        Args:
+            drain_timeout: 残りの項目の処理を待機する最大秒数
+        """
+        if not self.running:
+            return
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Work queue drain timed out",
+                extra={"queue": self.name, "remaining": self._queue.qsize()},
+            )
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Work queue stopped", extra={"queue": self.name})
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        キューのメトリクスを取得する
+
+        Returns:
+            キュー深さ・処理件数・処理段階ごとのレイテンシ
+        """
+        return {
+            "depth": self._queue.qsize() if self._queue else 0,
+            "max_depth": self.max_depth,
+            "workers": len(self._tasks),
+            "enqueued": self.enqueued,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "latency": {
+                stage: stats.snapshot() for stage, stats in self.latency.items()
+            },
+        }
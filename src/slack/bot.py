@@ -4,16 +4,25 @@ Slack Bot モジュール - Slackへのメッセージ送信と情報取得を
 
 import asyncio
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from slack_sdk.errors import SlackApiError
 from slack_sdk.web.async_client import AsyncWebClient
 
+from src.core.cache import TTLCache
 from src.core.config import settings
 from src.core.logger import get_slack_logger
+from src.slack.rate_limiter import SlackRateLimiter
 
 logger = get_slack_logger()
 
+# 1メッセージに含められるブロック数の上限（Slack APIの制約）
+SLACK_MAX_BLOCKS = 50
+# 通知メッセージの見出し部分のブロック数（本文 + ページ番号）
+NOTIFICATION_HEADER_BLOCKS = 2
+# 案件1件分のブロック数（区切り線 + 案件情報 + アクションボタン）
+OPPORTUNITY_BLOCKS = 3
+
 
 class SlackBot:
     """
@@ -26,13 +35,23 @@ class SlackBot:
         self.client = AsyncWebClient(token=self.bot_token)
         self.rate_limit_delay = 1.0  # APIレート制限時のデフォルト遅延(秒)
         self.max_retries = 3  # API呼び出し失敗時の最大リトライ回数
+        self.rate_limiter = SlackRateLimiter()  # Tierごとの送信ペース制御
+        # users.info の結果のキャッシュ（Slack ユーザーID → レスポンス）
+        self.user_info_cache: TTLCache[str, Dict[str, Any]] = TTLCache(
+            maxsize=settings.SLACK_USER_CACHE_MAX_SIZE,
+            ttl=settings.SLACK_USER_CACHE_TTL,
+        )
         logger.info("Initializing SlackBot")
 
         # 本番実装
         self.use_mock = False
 
     async def send_message(
-        self, channel_id: str, text: str, blocks: Optional[List[Dict[str, Any]]] = None
+        self,
+        channel_id: str,
+        text: str,
+        blocks: Optional[List[Dict[str, Any]]] = None,
+        thread_ts: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Slackにメッセージを送信する
@@ -41,6 +60,7 @@ class SlackBot:
             channel_id: 送信先チャンネルまたはDM ID
             text: 送信するテキストメッセージ
             blocks: Block Kit形式のメッセージ構造（オプション）
+            thread_ts: スレッドに返信する場合の親メッセージのタイムスタンプ（オプション）
 
         Returns:
             Slack APIレスポンス
@@ -52,6 +72,7 @@ class SlackBot:
                     "channel_id": channel_id,
                     "text": text,
                     "has_blocks": blocks is not None,
+                    "thread_ts": thread_ts,
                 },
             )
             # モックレスポンスを返す
@@ -71,6 +92,7 @@ class SlackBot:
                 channel=channel_id,
                 text=text,
                 blocks=blocks,
+                thread_ts=thread_ts,
             )
 
     async def send_notification(
@@ -100,8 +122,82 @@ class SlackBot:
             blocks=blocks,  # リッチなメッセージ表示用ブロック
         )
 
+    async def send_digest_notification(
+        self,
+        user_slack_id: str,
+        message: str,
+        opportunities: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        複数の案件をまとめた通知（ダイジェスト）をユーザーに送信する
+
+        1メッセージのブロック数上限を超える場合はページに分割し、
+        2ページ目以降は1ページ目のメッセージへのスレッド返信として送信する
+
+        Args:
+            user_slack_id: 通知先ユーザーのSlack ID
+            message: 通知メッセージ
+            opportunities: 案件関連データのリスト
+
+        Returns:
+            1ページ目の送信結果（通知はユーザーに届いているため、
+            2ページ目以降の失敗はログに記録し、残りのページの送信を続ける）
+        """
+        pages = self._paginate_opportunities(opportunities)
+        first_response: Dict[str, Any] = {}
+
+        for page_no, page in enumerate(pages, start=1):
+            blocks = self._build_notification_blocks(
+                message, opportunities=page, page=(page_no, len(pages))
+            )
+            response = await self.send_message(
+                channel_id=user_slack_id,  # DMの場合はユーザーIDを直接指定
+                text=message,  # フォールバック用テキスト
+                blocks=blocks,
+                thread_ts=first_response.get("ts"),
+            )
+            if page_no == 1:
+                if not response.get("ok", True):
+                    return response
+                first_response = response
+            elif not response.get("ok", True):
+                logger.warning(
+                    "Failed to send digest notification page",
+                    extra={
+                        "user_slack_id": user_slack_id,
+                        "page": page_no,
+                        "pages": len(pages),
+                        "opportunity_count": len(page),
+                        "error": response.get("error"),
+                    },
+                )
+
+        return first_response
+
+    def _paginate_opportunities(
+        self, opportunities: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        1メッセージのブロック数上限に収まるよう案件リストをページに分割する
+
+        Args:
+            opportunities: 案件関連データのリスト
+
+        Returns:
+            ページごとの案件関連データのリスト
+        """
+        per_page = (SLACK_MAX_BLOCKS - NOTIFICATION_HEADER_BLOCKS) // OPPORTUNITY_BLOCKS
+        return [
+            opportunities[i : i + per_page]
+            for i in range(0, len(opportunities), per_page)
+        ]
+
     def _build_notification_blocks(
-        self, message: str, opportunity_data: Optional[Dict[str, Any]] = None
+        self,
+        message: str,
+        opportunity_data: Optional[Dict[str, Any]] = None,
+        opportunities: Optional[List[Dict[str, Any]]] = None,
+        page: Optional[Tuple[int, int]] = None,
     ) -> List[Dict[str, Any]]:
         """
         通知用のBlock Kitブロックを構築する
@@ -109,6 +205,8 @@ class SlackBot:
         Args:
             message: 通知メッセージ
             opportunity_data: 案件関連データ（オプション）
+            opportunities: ダイジェスト通知に含める案件関連データのリスト（オプション）
+            page: ダイジェスト通知のページ番号と総ページ数（オプション）
 
         Returns:
             Block Kit形式のブロックリスト
@@ -117,51 +215,81 @@ class SlackBot:
             {"type": "section", "text": {"type": "mrkdwn", "text": f"*通知*\n{message}"}}
         ]
 
+        # ページ分割されている場合はページ番号を表示
+        if page and page[1] > 1:
+            blocks.append(
+                {
+                    "type": "context",
+                    "elements": [
+                        {"type": "mrkdwn", "text": f"{page[0]} / {page[1]} ページ"}
+                    ],
+                }
+            )
+
+        for data in opportunities or []:
+            blocks.extend(self._build_opportunity_blocks(data))
+
         # 案件データがある場合は追加情報を表示
         if opportunity_data:
-            blocks.append({"type": "divider"})
+            blocks.extend(self._build_opportunity_blocks(opportunity_data))
 
-            fields = []
-            if opportunity_data.get("opportunity_title"):
-                title = opportunity_data.get("opportunity_title")
-                fields.append(
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*【案件名】*\n{title}",
-                    }
-                )
+        return blocks
 
-            if opportunity_data.get("last_activity_date"):
-                last_date = opportunity_data.get("last_activity_date")
-                fields.append(
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*【最終活動日】*\n{last_date}",
-                    }
-                )
+    def _build_opportunity_blocks(
+        self, opportunity_data: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        案件1件分の情報を表示するブロックを構築する
 
-            blocks.append({"type": "section", "fields": fields})
+        Args:
+            opportunity_data: 案件関連データ
 
-            # アクションボタン（将来的に機能を追加予定）
-            opp_id = opportunity_data.get("opportunity_id")
-            blocks.append(
+        Returns:
+            Block Kit形式のブロックリスト（OPPORTUNITY_BLOCKS 個）
+        """
+        blocks: List[Dict[str, Any]] = [{"type": "divider"}]
+
+        fields = []
+        if opportunity_data.get("opportunity_title"):
+            title = opportunity_data.get("opportunity_title")
+            fields.append(
                 {
-                    "type": "actions",
-                    "elements": [
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "案件を表示",
-                                "emoji": True,
-                            },
-                            "value": f"view_opportunity_{opp_id}",
-                            "action_id": "view_opportunity",
-                        }
-                    ],
+                    "type": "mrkdwn",
+                    "text": f"*【案件名】*\n{title}",
                 }
             )
 
+        if opportunity_data.get("last_activity_date"):
+            last_date = opportunity_data.get("last_activity_date")
+            fields.append(
+                {
+                    "type": "mrkdwn",
+                    "text": f"*【最終活動日】*\n{last_date}",
+                }
+            )
+
+        blocks.append({"type": "section", "fields": fields})
+
+        # アクションボタン（将来的に機能を追加予定）
+        opp_id = opportunity_data.get("opportunity_id")
+        blocks.append(
+            {
+                "type": "actions",
+                "elements": [
+                    {
+                        "type": "button",
+                        "text": {
+                            "type": "plain_text",
+                            "text": "案件を表示",
+                            "emoji": True,
+                        },
+                        "value": f"view_opportunity_{opp_id}",
+                        "action_id": "view_opportunity",
+                    }
+                ],
+            }
+        )
+
         return blocks
 
     async def get_user_info(self, user_id: str) -> Optional[Dict[str, Any]]:
@@ -192,8 +320,28 @@ class SlackBot:
                 },
             }
         else:
+            # プロフィールはほとんど変わらないため、取得できた結果をキャッシュする
+            cached = self.user_info_cache.get(user_id)
+            if cached is not None:
+                return cached
+
             # 実際のSlack APIを呼び出す実装
-            return await self._call_slack_api(method="users_info", user=user_id)
+            response = await self._call_slack_api(method="users_info", user=user_id)
+            if response and response.get("ok"):
+                self.user_info_cache.set(user_id, response)
+            return response
+
+    def invalidate_user_info(self, user_id: Optional[str] = None) -> None:
+        """
+        キャッシュしたユーザー情報を破棄する
+
+        Args:
+            user_id: Slack ユーザーID（省略時はすべて破棄）
+        """
+        if user_id is None:
+            self.user_info_cache.clear()
+        else:
+            self.user_info_cache.delete(user_id)
 
     async def _call_slack_api(
         self, method: str, retry_count: int = 0, **kwargs
@@ -210,6 +358,9 @@ class SlackBot:
             APIレスポンス
         """
         try:
+            # レート制限を超えないよう、トークンを取得してから呼び出す
+            await self.rate_limiter.acquire(method, kwargs.get("channel"))
+
             # APIメソッドの動的呼び出し
             api_method = getattr(self.client, method)
             response = await api_method(**kwargs)
@@ -217,8 +368,8 @@ class SlackBot:
         except SlackApiError as e:
             error = e.response["error"]
 
-            # レート制限エラーの処理
-            if error == "ratelimited":
+            # レート制限エラーの処理（リトライ上限を超えた場合は下の失敗処理へ）
+            if error == "ratelimited" and retry_count < self.max_retries:
                 retry_after = int(
                     e.response.headers.get("Retry-After", self.rate_limit_delay)
                 )
@@ -227,9 +378,9 @@ class SlackBot:
                     extra={"method": method, "retry_after": retry_after},
                 )
 
-                # 適切な時間待機後、リトライ
-                await asyncio.sleep(retry_after)
-                return await self._call_slack_api(method, retry_count, **kwargs)
+                # 同じ制限を受ける呼び出しもまとめて停止し、待機後にリトライ
+                self.rate_limiter.pause(method, retry_after, kwargs.get("channel"))
+                return await self._call_slack_api(method, retry_count + 1, **kwargs)
 
             # その他のエラーの処理
             elif retry_count < self.max_retries:
@@ -1,4 +1,5 @@
 import json
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 from src.core.logger import get_slack_logger
@@ -11,13 +12,35 @@ class SlackEventHandler:
     Slack Event APIからのイベントを処理するハンドラクラス
     """
 
-    def __init__(self):
-        """SlackEventHandlerの初期化"""
+    def __init__(
+        self,
+        activity_matcher: Optional[Any] = None,
+        customer_index: Optional[Any] = None,
+        date_parser: Optional[Any] = None,
+        extractor: Optional[Any] = None,
+    ):
+        """
+        SlackEventHandlerの初期化
+
+        Args:
+            activity_matcher: メッセージから活動種別を取り出すマッチャー
+                （find_all(text) で出現のリストを返すもの。サービス層から設定される）
+            customer_index: メッセージから顧客名を取り出す索引
+                （find_all(text) で出現のリストを返すもの。サービス層から設定される）
+            date_parser: メッセージから活動日を取り出すパーサー
+                （parse(text, reference) で活動日を返すもの。サービス層から設定される）
+            extractor: ルールベースの抽出結果の確信度が低い場合にLLMで補完する抽出器
+                （extract(text, rule_info, context) を持つもの。サービス層から設定される）
+        """
         logger.info("Initializing SlackEventHandler")
+        self.activity_matcher = activity_matcher
+        self.customer_index = customer_index
+        self.date_parser = date_parser
+        self.extractor = extractor
 
     async def process_message_event(
         self, user_id: str, text: str, channel: str, ts: str, event_data: Dict[str, Any]
-    ) -> None:
+    ) -> Optional[Dict[str, Any]]:
         """
         メッセージイベントを処理する
 
@@ -27,6 +50,9 @@ class SlackEventHandler:
             channel: チャンネルID
             ts: メッセージタイムスタンプ
             event_data: Slackイベント全体のデータ
+
+        Returns:
+            抽出された活動情報の辞書。営業活動の報告でない場合はNone
         """
         logger.info(
             "Processing message event",
@@ -37,11 +63,17 @@ class SlackEventHandler:
             },
         )
 
-        # TODO: この部分に自然言語処理やデータベース保存ロジックを実装
-        # 現時点ではログ出力のみ
+        # メッセージを解析して営業活動情報を抽出する
+        # （案件の推定とアクティビティログの記録はサービス層のパイプラインで行う）
+        # 相対的な日付表現はメッセージの投稿日時を基準に解釈する
+        posted_at = datetime.fromtimestamp(float(ts), tz=timezone.utc) if ts else None
+        activity_info = self._extract_activity_info(text, posted_at)
 
-        # メッセージを解析して営業活動情報を抽出（将来実装）
-        activity_info = self._extract_activity_info(text)
+        # ルールベースの抽出結果の確信度が低い場合のみLLMで補完する
+        if self.extractor is not None:
+            activity_info = await self.extractor.extract(
+                text, activity_info, self._extraction_context(user_id, posted_at)
+            )
 
         if activity_info:
             logger.info(
@@ -50,36 +82,114 @@ class SlackEventHandler:
             )
         else:
             logger.info("No activity information extracted from message")
+        return activity_info
+
+    def _extraction_context(
+        self, user_id: str, posted_at: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """
+        LLMでの補完に使う送信者・基準日・活動種別の一覧を作成する
+
+        Args:
+            user_id: Slack ユーザーID
+            posted_at: メッセージの投稿日時
 
-    def _extract_activity_info(self, text: str) -> Optional[Dict[str, Any]]:
+        Returns:
+            抽出器に渡すコンテキスト
+        """
+        reference_date = (
+            self.date_parser.reference_date(posted_at).isoformat()
+            if self.date_parser is not None
+            else None
+        )
+        activity_types = (
+            dict(self.activity_matcher.activity_types)
+            if self.activity_matcher is not None
+            else {}
+        )
+        return {
+            "user_id": user_id,
+            "reference_date": reference_date,
+            "activity_types": activity_types,
+        }
+
+    def _extract_activity_info(
+        self, text: str, posted_at: Optional[datetime] = None
+    ) -> Optional[Dict[str, Any]]:
         """
-        テキストから営業活動情報を抽出する（モック実装）
+        テキストから営業活動情報を抽出する
 
         Args:
             text: メッセージテキスト
+            posted_at: メッセージの投稿日時（省略時は現在時刻）
 
         Returns:
             抽出された活動情報の辞書。見つからない場合はNone
         """
-        # 現時点ではモック実装
-        # 実際の実装では自然言語処理モジュールを使用して情報を抽出
-
-        # 「訪問」という単語があれば訪問イベントと判断（単純なモック）
-        if "訪問" in text:
-            return {
-                "type": "訪問",
-                "customer": None,  # 顧客名の抽出はまだ実装なし
-                "date": None,  # 日付の抽出はまだ実装なし
-            }
-        # 「電話」という単語があれば電話イベントと判断
-        elif "電話" in text:
-            return {
-                "type": "電話",
-                "customer": None,
-                "date": None,
-            }
-        # それ以外はNone
-        return None
+        # アクティビティ種別マスタが読み込まれていない場合は抽出できない
+        if self.activity_matcher is None:
+            return None
+
+        # メッセージを1回走査して、含まれる活動種別をすべて取り出す
+        matches = self.activity_matcher.find_all(text)
+        if not matches:
+            return None
+
+        # 最初に出現した活動種別を主な活動とする
+        primary = matches[0]
+        return {
+            "type": primary.activity_type,
+            "activity_type_id": primary.activity_type_id,
+            **self._extract_customer(text),
+            **self._extract_date(text, posted_at),
+            "matches": [match._asdict() for match in matches],
+        }
+
+    def _extract_date(self, text: str, posted_at: Optional[datetime]) -> Dict[str, Any]:
+        """
+        テキストから活動日を抽出する
+
+        Args:
+            text: メッセージテキスト
+            posted_at: メッセージの投稿日時
+
+        Returns:
+            活動日（ISO形式）・根拠の表現と、モデルでの判断が必要かどうか
+        """
+        if self.date_parser is None:
+            return {"date": None, "date_phrase": None, "date_needs_model": True}
+
+        extraction = self.date_parser.parse(text, posted_at)
+        return {
+            "date": extraction.date.isoformat() if extraction.date else None,
+            "date_phrase": extraction.phrase,
+            "date_needs_model": extraction.needs_model,
+        }
+
+    def _extract_customer(self, text: str) -> Dict[str, Any]:
+        """
+        テキストから顧客を抽出する
+
+        Args:
+            text: メッセージテキスト
+
+        Returns:
+            顧客名・顧客ID（1社に特定できない場合はNone）と顧客の候補
+        """
+        candidates = []
+        if self.customer_index is not None:
+            for match in self.customer_index.find_all(text):
+                candidate = {"id": str(match.customer_id), "name": match.name}
+                if candidate not in candidates:
+                    candidates.append(candidate)
+
+        # 候補が1社の場合のみ顧客を特定する（複数の場合は後段で判断する）
+        customer = candidates[0] if len(candidates) == 1 else None
+        return {
+            "customer": customer["name"] if customer else None,
+            "customer_id": customer["id"] if customer else None,
+            "customer_candidates": candidates,
+        }
 
 
 # シングルトンインスタンス
@@ -0,0 +1,241 @@
+"""
+Slack APIレート制限モジュール - メソッドのTierごとのトークンバケットで送信ペースを制御する
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from src.core.logger import get_slack_logger
+
+logger = get_slack_logger()
+
+# Tierごとのレート制限（1分あたりのリクエスト数, バースト許容数）
+# https://api.slack.com/docs/rate-limits
+RATE_LIMIT_TIERS: Dict[str, Tuple[float, float]] = {
+    "tier1": (1, 1),
+    "tier2": (20, 3),
+    "tier3": (50, 5),
+    "tier4": (100, 10),
+    # chat.postMessage はチャンネルごとに1秒1件
+    "post_message": (60, 1),
+}
+
+# APIメソッド（AsyncWebClientのメソッド名）と適用するTier
+METHOD_TIERS: Dict[str, str] = {
+    "chat_postMessage": "post_message",
+    "chat_update": "tier3",
+    "conversations_history": "tier3",
+    "conversations_open": "tier3",
+    "users_info": "tier4",
+    "users_list": "tier2",
+}
+
+# 一覧にないメソッドに適用するTier
+DEFAULT_TIER = "tier3"
+
+# チャンネルごとにバケットを分けるTier
+PER_CHANNEL_TIERS = {"post_message"}
+
+# 保持するバケット数の目安（超えた場合は待機のない満タンのバケットを破棄する）
+MAX_BUCKETS = 10000
+
+
+class TokenBucket:
+    """
+    トークンバケット
+
+    一定レートでトークンを補充し、送信ごとに1トークンを消費する。
+    トークンが不足している場合は補充されるまで先着順に待機させる
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float):
+        """
+        トークンバケットの初期化
+
+        Args:
+            rate_per_minute: 1分あたりのトークン補充数
+            capacity: バケットに保持できる最大トークン数（バースト許容数）
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self.waiting = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self) -> None:
+        """経過時間に応じてトークンを補充する"""
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    async def acquire(self) -> float:
+        """
+        トークンを1つ取得する（不足している場合は補充されるまで待機）
+
+        Returns:
+            待機した秒数
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            # ロックは先着順に取得されるため、待機中の呼び出しは到着順に送信される
+            async with self._lock:
+                while True:
+                    self._refill()
+                    delay = max(
+                        self.paused_until - time.monotonic(),
+                        (1 - self.tokens) / self.rate,
+                    )
+                    if delay <= 0:
+                        break
+                    await asyncio.sleep(delay)
+                self.tokens -= 1
+        finally:
+            self.waiting -= 1
+
+        waited = time.monotonic() - started
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """
+        指定秒数の間、トークンの払い出しを停止する（Retry-Afterの反映用）
+
+        Args:
+            seconds: 停止する秒数
+        """
+        self._refill()
+        self.tokens = 0
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        バケットの状態を取得する
+
+        Returns:
+            残りトークン数・待機数・待機時間などのメトリクス
+        """
+        self._refill()
+        return {
+            "tokens": round(self.tokens, 3),
+            "queue_depth": self.waiting,
+            "acquired": self.acquired,
+            "total_wait_seconds": round(self.total_wait, 3),
+            "max_wait_seconds": round(self.max_wait, 3),
+        }
+
+
+class SlackRateLimiter:
+    """
+    Slack APIのレート制限を事前に守るためのリミッター
+
+    メソッドのTier（chat.postMessageはチャンネル単位）ごとにトークンバケットを共有し、
+    同じ制限を受ける呼び出しが同時に制限超過しないよう送信ペースを揃える
+    """
+
+    def __init__(self, tiers: Optional[Dict[str, Tuple[float, float]]] = None):
+        """
+        リミッターの初期化
+
+        Args:
+            tiers: Tierごとのレート制限（省略時は RATE_LIMIT_TIERS）
+        """
+        self.tiers = tiers or RATE_LIMIT_TIERS
+        self.buckets: Dict[str, TokenBucket] = {}
+
+    def _bucket_key(self, method: str, channel: Optional[str] = None) -> str:
+        """
+        APIメソッドに対応するバケットのキーを取得する
+
+        Args:
+            method: APIメソッド名
+            channel: 送信先チャンネル（チャンネル単位のTierのみ使用）
+
+        Returns:
+            バケットのキー
+        """
+        tier = METHOD_TIERS.get(method, DEFAULT_TIER)
+        if tier in PER_CHANNEL_TIERS:
+            return f"{tier}:{channel}"
+        # Tier1〜4の制限はメソッドごとに適用される
+        return f"{tier}:{method}"
+
+    def _get_bucket(self, method: str, channel: Optional[str] = None) -> TokenBucket:
+        """
+        APIメソッドに対応するトークンバケットを取得する（なければ作成）
+
+        Args:
+            method: APIメソッド名
+            channel: 送信先チャンネル
+
+        Returns:
+            トークンバケット
+        """
+        key = self._bucket_key(method, channel)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            if len(self.buckets) >= MAX_BUCKETS:
+                self._prune()
+            tier = key.split(":", 1)[0]
+            bucket = TokenBucket(*self.tiers[tier])
+            self.buckets[key] = bucket
+        return bucket
+
+    def _prune(self) -> None:
+        """待機がなくトークンが満タンのバケットを破棄する（初期状態と区別できないため）"""
+        for key, bucket in list(self.buckets.items()):
+            bucket._refill()
+            if bucket.waiting == 0 and bucket.tokens >= bucket.capacity:
+                del self.buckets[key]
+
+    async def acquire(self, method: str, channel: Optional[str] = None) -> float:
+        """
+        API呼び出し前にトークンを取得する
+
+        Args:
+            method: APIメソッド名
+            channel: 送信先チャンネル
+
+        Returns:
+            待機した秒数
+        """
+        waited = await self._get_bucket(method, channel).acquire()
+        if waited > 0:
+            logger.debug(
+                "Waited for Slack API rate limit",
+                extra={"method": method, "wait_seconds": round(waited, 3)},
+            )
+        return waited
+
+    def pause(self, method: str, seconds: float, channel: Optional[str] = None) -> None:
+        """
+        レート制限エラーを受けた場合に、同じバケットを共有する呼び出しをまとめて停止する
+
+        Args:
+            method: APIメソッド名
+            seconds: 停止する秒数（Retry-After）
+            channel: 送信先チャンネル
+        """
+        self._get_bucket(method, channel).pause(seconds)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        全バケットのメトリクスを取得する
+
+        Returns:
+            バケットのキーごとのメトリクス
+        """
+        return {key: bucket.metrics() for key, bucket in self.buckets.items()}
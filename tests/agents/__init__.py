@@ -0,0 +1 @@
+# AIエージェントモジュールテストパッケージ
@@ -0,0 +1,72 @@
+"""
+活動種別マッチャーのテスト
+"""
+
+import random
+
+from agents.activity_matcher import ActivityTypeMatcher, AhoCorasick
+
+ACTIVITY_TYPES = [(1, "訪問"), (2, "電話"), (3, "メール")]
+
+
+def test_aho_corasick_finds_overlapping_keywords():
+    """重なり合う出現も含め、すべてのキーワードの出現位置を返すこと"""
+    automaton = AhoCorasick({"he": 1, "she": 2, "his": 3, "hers": 4})
+
+    found = sorted(automaton.finditer("ushers"))
+
+    assert found == [(1, 4, "she", 2), (2, 4, "he", 1), (2, 6, "hers", 4)]
+
+
+def test_aho_corasick_matches_naive_search():
+    """ランダムなキーワードとテキストで、単純な全探索と同じ結果になること"""
+    rng = random.Random(0)
+    for _ in range(200):
+        keywords = {
+            "".join(rng.choice("abc") for _ in range(rng.randint(1, 4))): None
+            for _ in range(rng.randint(1, 8))
+        }
+        text = "".join(rng.choice("abcd") for _ in range(40))
+
+        found = sorted(
+            (start, end) for start, end, _, _ in AhoCorasick(keywords).finditer(text)
+        )
+        expected = sorted(
+            (start, start + len(keyword))
+            for keyword in keywords
+            for start in range(len(text))
+            if text.startswith(keyword, start)
+        )
+        assert found == expected
+
+
+def test_matcher_returns_all_types_with_offsets():
+    """種別名と同義語から、メッセージに含まれるすべての活動種別を位置付きで返すこと"""
+    matcher = ActivityTypeMatcher(ACTIVITY_TYPES)
+    text = "A社と商談後、ＴＥＬで見積もりの件を伝え、資料送付しました"
+
+    matches = matcher.find_all(text)
+
+    assert [(m.activity_type_id, m.activity_type, m.keyword) for m in matches] == [
+        (1, "訪問", "商談"),
+        (2, "電話", "ＴＥＬ"),
+        (3, "メール", "資料送付"),
+    ]
+    assert all(text[m.start : m.end] == m.keyword for m in matches)
+
+
+def test_matcher_uses_only_synonyms_of_existing_types():
+    """マスタに存在しない種別の同義語は照合しないこと"""
+    matcher = ActivityTypeMatcher([(2, "電話")])
+
+    assert matcher.find_all("A社に訪問して商談しました") == []
+    assert matcher.find_all("B社にTELしました")[0].activity_type == "電話"
+
+
+def test_matcher_prefers_master_names_over_synonyms():
+    """同義語と同じ名称の種別がマスタにある場合は、その種別として照合すること"""
+    matcher = ActivityTypeMatcher(ACTIVITY_TYPES + [(4, "商談")])
+
+    matches = matcher.find_all("C社と商談しました")
+
+    assert [(m.activity_type_id, m.activity_type) for m in matches] == [(4, "商談")]
@@ -0,0 +1,51 @@
+"""
+顧客名マッチャーのテスト
+"""
+
+from agents.customer_matcher import CustomerNameIndex, normalize_name
+
+
+def test_normalize_name_folds_variants():
+    """法人格・全角半角・ひらがなカタカナの表記ゆれを揃えること"""
+    assert normalize_name("株式会社ＡＢＣ") == normalize_name("㈱abc")
+    assert normalize_name("（株）ｴｰﾋﾞｰｼｰ") == normalize_name("(株) えーびーしー")
+    assert normalize_name("さくら・工業") == "サクラ工業"
+
+
+def test_index_resolves_name_variants():
+    """正式名称以外の表記（〜社、法人格の省略・位置違い）でも顧客を解決すること"""
+    index = CustomerNameIndex([(1, "株式会社A"), (2, "エービーシー商事株式会社"), (3, "さくら工業有限会社")])
+
+    assert [m.customer_id for m in index.find_all("今日はA社に訪問しました")] == [1]
+    assert [m.customer_id for m in index.find_all("㈱えーびーしー商事と商談")] == [2]
+    assert [m.customer_id for m in index.find_all("ｻｸﾗ工業とｴｰﾋﾞｰｼｰ商事")] == [3, 2]
+    assert index.find_all("来週の予定を確認します") == []
+
+
+def test_index_does_not_match_inside_words():
+    """英数字の顧客名が英数字の途中で一致しないこと"""
+    index = CustomerNameIndex([(1, "ABC")])
+
+    assert index.find_all("ABCD社に訪問") == []
+    assert [m.customer_id for m in index.find_all("abcと打ち合わせ")] == [1]
+
+
+def test_index_returns_all_customers_sharing_an_alias():
+    """同じ別名を持つ顧客が複数ある場合はすべて返すこと"""
+    index = CustomerNameIndex([(1, "株式会社みらい"), (2, "みらい有限会社")])
+
+    assert {m.customer_id for m in index.find_all("ミライに電話")} == {1, 2}
+
+
+def test_index_updates_incrementally():
+    """顧客の追加・名称変更・削除を索引に個別に反映できること"""
+    index = CustomerNameIndex([(1, "株式会社A")])
+
+    index.upsert(2, "B商事")
+    index.upsert(1, "株式会社C")
+    assert [m.customer_id for m in index.find_all("B商事とC社")] == [2, 1]
+    assert index.find_all("A社") == []
+
+    index.remove(2)
+    assert index.find_all("B商事") == []
+    assert len(index) == 1
@@ -0,0 +1,114 @@
+"""
+日付表現パーサーのテスト
+"""
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from agents.date_parser import RelativeDateParser
+
+# 2024-05-16（木）01:00 JST
+POSTED_AT = datetime(2024, 5, 15, 16, 0, tzinfo=timezone.utc)
+# 2026-10-16 12:00 JST
+OCTOBER_16 = datetime(2026, 10, 16, 3, 0, tzinfo=timezone.utc)
+# 2026-01-05 12:00 JST（年をまたいだ直後）
+JANUARY_5 = datetime(2026, 1, 5, 3, 0, tzinfo=timezone.utc)
+# 2026-03-01 12:00 JST（直近の2月29日は2024年）
+MARCH_1 = datetime(2026, 3, 1, 3, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def parser():
+    """日本時間を基準にするパーサー"""
+    return RelativeDateParser("Asia/Tokyo")
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("今日はA社に訪問しました", date(2024, 5, 16)),
+        ("昨日B社に電話", date(2024, 5, 15)),
+        ("一昨日の商談の件", date(2024, 5, 14)),
+        ("先週金曜に訪問", date(2024, 5, 10)),
+        ("先週の月曜日に打ち合わせ", date(2024, 5, 6)),
+        ("３日前に資料送付", date(2024, 5, 13)),
+        ("三日前に資料送付", date(2024, 5, 13)),
+        ("十日前に資料送付", date(2024, 5, 6)),
+        ("二十一日前に訪問", date(2024, 4, 25)),
+        ("2週間前に訪問", date(2024, 5, 2)),
+        ("5月10日に訪問", date(2024, 5, 10)),
+        ("5/10に訪問", date(2024, 5, 10)),
+        ("12/28に訪問", date(2023, 12, 28)),
+        ("2023年12月1日に訪問", date(2023, 12, 1)),
+        ("火曜に電話", date(2024, 5, 14)),
+    ],
+)
+def test_parse_resolves_common_phrases(parser, text, expected):
+    """よく使われる日付表現を投稿日（日本時間）基準で活動日に変換すること"""
+    extraction = parser.parse(text, POSTED_AT)
+
+    assert extraction.date == expected
+    assert extraction.needs_model is False
+
+
+@pytest.mark.parametrize(
+    "posted_at,text,expected",
+    [
+        (OCTOBER_16, "11月20日に訪問しました", date(2025, 11, 20)),
+        (OCTOBER_16, "12月31日に訪問", date(2025, 12, 31)),
+        (OCTOBER_16, "1/2に訪問", date(2026, 1, 2)),
+        (OCTOBER_16, "10月16日に訪問", date(2026, 10, 16)),
+        (JANUARY_5, "12月28日に訪問しました", date(2025, 12, 28)),
+        (JANUARY_5, "1/6に訪問", date(2025, 1, 6)),
+        (MARCH_1, "2月29日に訪問", date(2024, 2, 29)),
+    ],
+)
+def test_parse_month_day_resolves_to_latest_past_date(
+    parser, posted_at, text, expected
+):
+    """年を省略した月日は投稿日以前で直近の日付とし、未来の日付にしないこと"""
+    extraction = parser.parse(text, posted_at)
+
+    assert extraction.date == expected
+    assert extraction.needs_model is False
+
+
+@pytest.mark.parametrize(
+    "text", ["資料v1/2を送付", "ver.1/2を送付", "手順書1.1/2を共有", "ID:A1/2を確認"]
+)
+def test_parse_ignores_slash_inside_tokens(parser, text):
+    """バージョン表記などの一部のスラッシュは日付としないこと"""
+    extraction = parser.parse(text, POSTED_AT)
+
+    assert (extraction.date, extraction.phrase) == (None, None)
+    assert extraction.needs_model is False
+
+
+def test_parse_without_date_phrase(parser):
+    """日付表現がない場合は活動日なし・モデル不要として返すこと"""
+    extraction = parser.parse("A社に訪問しました", POSTED_AT)
+
+    assert extraction.date is None
+    assert extraction.needs_model is False
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "先日A社に訪問",
+        "先週A社に訪問",
+        "2月30日に訪問",
+        "昨日電話して今日訪問しました",
+        "十十日前に訪問",
+        "一二十日前に訪問",
+    ],
+)
+def test_parse_escalates_ambiguous_text(parser, text):
+    """日付を特定できない表現・存在しない日付・読めない数・複数の日付はモデルでの判断が必要とすること"""
+    assert parser.parse(text, POSTED_AT).needs_model is True
+
+
+def test_parse_uses_configured_timezone():
+    """基準日をタイムゾーンの日付で決めること"""
+    assert RelativeDateParser("UTC").parse("今日", POSTED_AT).date == date(2024, 5, 15)
@@ -0,0 +1,158 @@
+"""
+営業活動情報の段階的抽出のテスト
+"""
+
+import asyncio
+
+import pytest
+
+from agents.extraction import TieredExtractor, rule_confidence
+from agents.llm_batcher import ExtractionBatcher
+from agents.llm_client import LLMClient
+
+CONTEXT = {
+    "user_id": "U1",
+    "reference_date": "2024-05-16",
+    "activity_types": {"訪問": 1, "電話": 2},
+}
+
+# ルールベースで顧客・活動日まで特定できた抽出結果
+CONFIDENT_INFO = {
+    "type": "訪問",
+    "activity_type_id": 1,
+    "customer": "株式会社A",
+    "customer_id": "c1",
+    "customer_candidates": [{"id": "c1", "name": "株式会社A"}],
+    "date": "2024-05-15",
+    "date_phrase": "昨日",
+    "date_needs_model": False,
+    "matches": [{"activity_type": "訪問"}],
+}
+
+# 顧客を特定できず、日付も曖昧な抽出結果
+UNCERTAIN_INFO = {
+    **CONFIDENT_INFO,
+    "customer": None,
+    "customer_id": None,
+    "customer_candidates": [
+        {"id": "c1", "name": "株式会社A"},
+        {"id": "c2", "name": "B商事"},
+    ],
+    "date": None,
+    "date_phrase": None,
+    "date_needs_model": True,
+}
+
+
+@pytest.fixture
+async def extractor(fake_llm):
+    """フェイクLLMサーバーに接続する抽出器"""
+    llm = LLMClient(api_key="sk-test", model="test", api_base=fake_llm.url, timeout=5)
+    extractor = TieredExtractor(llm, threshold=0.75, cache_size=100, cache_ttl=60)
+    yield extractor
+    await extractor.close()
+
+
+def test_rule_confidence():
+    """顧客・活動日を特定できない場合は確信度が下がること"""
+    assert rule_confidence(CONFIDENT_INFO) == 1.0
+    assert rule_confidence({**CONFIDENT_INFO, "date": None}) == 0.95
+    assert rule_confidence(UNCERTAIN_INFO) == 0.4
+
+
+@pytest.mark.asyncio
+async def test_confident_rules_skip_llm(extractor, fake_llm):
+    """確信度がしきい値以上の場合はLLMを呼び出さないこと"""
+    result = await extractor.extract("昨日A社に訪問", CONFIDENT_INFO, CONTEXT)
+
+    assert result["source"] == "rules"
+    assert result["customer_id"] == "c1"
+    assert fake_llm.requests == []
+    assert await extractor.extract("来週の予定", None, CONTEXT) is None
+
+
+@pytest.mark.asyncio
+async def test_uncertain_rules_escalate_to_llm_and_cache(extractor, fake_llm):
+    """確信度が低い場合はLLMで補完し、同じ内容のメッセージは応答を再利用すること"""
+    fake_llm.responder = lambda messages: {
+        "is_activity": True,
+        "activity_type": "訪問",
+        "customer": "B商事",
+        "date": "2024-05-13",
+    }
+
+    result = await extractor.extract("先日A社とB商事に訪問", UNCERTAIN_INFO, CONTEXT)
+    again = await extractor.extract("先日Ａ社と B商事に訪問 ", UNCERTAIN_INFO, CONTEXT)
+
+    assert result["source"] == "llm"
+    assert result["customer_id"] == "c2"
+    assert result["date"] == "2024-05-13"
+    assert again == result
+    assert len(fake_llm.requests) == 1
+    assert "B商事" in fake_llm.requests[0]["messages"][1]["content"]
+
+    metrics = extractor.metrics()
+    assert metrics["escalation_rate"] == 1.0
+    assert metrics["cache"]["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_llm_rejects_non_activity(extractor, fake_llm):
+    """LLMが営業活動の報告でないと判定した場合はNoneを返すこと"""
+    fake_llm.responder = lambda messages: {"is_activity": False}
+
+    assert await extractor.extract("電話番号は?", UNCERTAIN_INFO, CONTEXT) is None
+
+
+@pytest.mark.asyncio
+async def test_llm_failure_falls_back_to_rules(extractor, fake_llm):
+    """LLMの呼び出しに失敗した場合はルールベースの結果を使うこと"""
+    fake_llm.status = 500
+
+    result = await extractor.extract("先日訪問", UNCERTAIN_INFO, CONTEXT)
+
+    assert result["source"] == "rules"
+    assert result["customer_id"] is None
+    assert extractor.metrics()["llm"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_messages_share_one_call(extractor, fake_llm):
+    """同じ内容のメッセージを同時に抽出する場合はLLMを1回だけ呼び出すこと"""
+    fake_llm.delay = 0.05
+    fake_llm.responder = lambda messages: {"is_activity": True, "customer": "B商事"}
+
+    results = await asyncio.gather(
+        *[extractor.extract("先日訪問", UNCERTAIN_INFO, CONTEXT) for _ in range(5)]
+    )
+
+    assert len(fake_llm.requests) == 1
+    assert all(result["customer_id"] == "c2" for result in results)
+
+
+@pytest.mark.asyncio
+async def test_batched_escalations_share_one_request(fake_llm):
+    """バッチャーを指定した場合は、異なるメッセージの問い合わせを1回で送信すること"""
+    fake_llm.responder = lambda messages: {
+        "results": [
+            {"id": 0, "is_activity": True, "customer": "株式会社A"},
+            {"id": 1, "is_activity": True, "customer": "B商事"},
+        ]
+    }
+    llm = LLMClient(api_key="sk-test", model="test", api_base=fake_llm.url, timeout=5)
+    batcher = ExtractionBatcher(
+        llm, "system", max_batch_size=2, max_wait_ms=1000, mode="prompt"
+    )
+    extractor = TieredExtractor(
+        llm, threshold=0.75, cache_size=100, cache_ttl=60, batcher=batcher
+    )
+
+    first, second = await asyncio.gather(
+        extractor.extract("先日A社に訪問", UNCERTAIN_INFO, CONTEXT),
+        extractor.extract("先日B商事に訪問", UNCERTAIN_INFO, CONTEXT),
+    )
+    await extractor.close()
+
+    assert len(fake_llm.requests) == 1
+    assert (first["customer_id"], second["customer_id"]) == ("c1", "c2")
+    assert extractor.metrics()["batcher"]["size_flushes"] == 1
@@ -0,0 +1,144 @@
+"""
+LLM呼び出しのマイクロバッチのテスト
+"""
+
+import asyncio
+import re
+
+import pytest
+
+from agents.llm_batcher import ExtractionBatcher
+from agents.llm_client import LLMClient, LLMError
+
+_ITEM = re.compile(r"### id: (\d+)\n(.*)")
+
+
+def echo_batch(messages):
+    """まとめた問い合わせには各問い合わせの内容を、1件の問い合わせにはその内容を返す"""
+    content = messages[-1]["content"]
+    items = _ITEM.findall(content)
+    if not items:
+        return {"echo": content}
+    return {"results": [{"id": int(i), "echo": prompt} for i, prompt in items]}
+
+
+@pytest.fixture
+async def llm(fake_llm):
+    """フェイクLLMサーバーに接続するLLMクライアント"""
+    fake_llm.responder = echo_batch
+    client = LLMClient(
+        api_key="sk-test", model="test", api_base=fake_llm.url, timeout=5
+    )
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_prompt_routes_results_to_callers(llm, fake_llm):
+    """件数の上限に達した問い合わせを1リクエストで送信し、回答を呼び出し元に返すこと"""
+    batcher = ExtractionBatcher(llm, "system", max_batch_size=3, max_wait_ms=1000)
+
+    results = await asyncio.gather(*[batcher.complete(f"msg{i}") for i in range(3)])
+
+    assert results == [{"echo": "msg0"}, {"echo": "msg1"}, {"echo": "msg2"}]
+    assert len(fake_llm.requests) == 1
+    # 共通のシステムプロンプトは1回だけ送信する
+    messages = fake_llm.requests[0]["messages"]
+    assert [m["role"] for m in messages] == ["system", "user"]
+    assert messages[0]["content"].startswith("system")
+    assert batcher.metrics()["size_flushes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_flushes_after_max_wait(llm, fake_llm):
+    """件数の上限に達しない場合は待ち時間の経過後に送信すること"""
+    batcher = ExtractionBatcher(llm, "system", max_batch_size=10, max_wait_ms=20)
+
+    results = await asyncio.gather(batcher.complete("a"), batcher.complete("b"))
+    single = await batcher.complete("c")
+
+    assert results == [{"echo": "a"}, {"echo": "b"}]
+    # 1件だけのバッチはまとめ用の形式を使わずに送信する
+    assert single == {"echo": "c"}
+    assert len(fake_llm.requests) == 2
+    metrics = batcher.metrics()
+    assert metrics["timeout_flushes"] == 2
+    assert metrics["average_batch_size"] == 1.5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_mode_sends_each_prompt(llm, fake_llm):
+    """並行送信では問い合わせごとにリクエストを送信し、接続プールを共有すること"""
+    batcher = ExtractionBatcher(
+        llm, "system", max_batch_size=4, max_wait_ms=1000, mode="concurrent"
+    )
+
+    results = await asyncio.gather(*[batcher.complete(f"m{i}") for i in range(4)])
+
+    assert results == [{"echo": f"m{i}"} for i in range(4)]
+    assert len(fake_llm.requests) == 4
+    assert all(
+        request["messages"][0]["content"] == "system" for request in fake_llm.requests
+    )
+    assert batcher.batches == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_result_fails_only_that_caller(llm, fake_llm):
+    """回答が欠けた問い合わせのみ LLMError となること"""
+    fake_llm.responder = lambda messages: {"results": [{"id": 1, "echo": "b"}]}
+    batcher = ExtractionBatcher(llm, "system", max_batch_size=2, max_wait_ms=1000)
+
+    first, second = await asyncio.gather(
+        batcher.complete("a"), batcher.complete("b"), return_exceptions=True
+    )
+
+    assert isinstance(first, LLMError)
+    assert second == {"echo": "b"}
+
+
+@pytest.mark.asyncio
+async def test_request_failure_propagates_to_all_callers(llm, fake_llm):
+    """リクエストに失敗した場合はバッチ内のすべての呼び出し元に LLMError を返すこと"""
+    fake_llm.status = 500
+    batcher = ExtractionBatcher(llm, "system", max_batch_size=2, max_wait_ms=1000)
+
+    results = await asyncio.gather(
+        batcher.complete("a"), batcher.complete("b"), return_exceptions=True
+    )
+
+    assert all(isinstance(result, LLMError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_block_batch(llm, fake_llm):
+    """待機中の呼び出し元がキャンセルされても他の呼び出し元に回答を返すこと"""
+    fake_llm.delay = 0.05
+    batcher = ExtractionBatcher(llm, "system", max_batch_size=2, max_wait_ms=1000)
+
+    cancelled = asyncio.ensure_future(batcher.complete("a"))
+    remaining = asyncio.ensure_future(batcher.complete("b"))
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+
+    assert await remaining == {"echo": "b"}
+    assert cancelled.cancelled()
+    assert fake_llm.requests[0]["messages"][1]["content"].startswith("### id: 0\na")
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending(llm, fake_llm):
+    """停止時に待機中の問い合わせを送信すること"""
+    batcher = ExtractionBatcher(llm, "system", max_batch_size=10, max_wait_ms=60000)
+
+    pending = asyncio.ensure_future(batcher.complete("a"))
+    await asyncio.sleep(0)
+    await batcher.close()
+
+    assert await pending == {"echo": "a"}
+
+
+def test_invalid_mode():
+    """不正な送信方法は ValueError となること"""
+    with pytest.raises(ValueError):
+        ExtractionBatcher(None, "system", max_batch_size=1, max_wait_ms=0, mode="x")
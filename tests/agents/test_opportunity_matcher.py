@@ -0,0 +1,51 @@
+"""
+案件マッチャーのテスト
+"""
+
+from datetime import date
+
+from agents.opportunity_matcher import (
+    OpportunityCandidate,
+    rank_opportunities,
+    tokenize,
+)
+
+TODAY = date(2024, 5, 16)
+
+CANDIDATES = [
+    OpportunityCandidate.create(1, "c1", "基幹システム刷新", date(2024, 3, 1)),
+    OpportunityCandidate.create(2, "c1", "Web会議ツール導入", date(2024, 5, 15)),
+    OpportunityCandidate.create(3, "c2", "基幹システム保守", None),
+]
+
+
+def test_tokenize_words_and_bigrams():
+    """英数字は単語、日本語は2-gramに分割すること"""
+    assert tokenize("ＣＲＭ導入") == {"crm", "導入"}
+    assert tokenize("基幹システム") == {"基幹", "幹シ", "シス", "ステ", "テム"}
+
+
+def test_rank_by_title_overlap():
+    """案件名との一致度が高い案件を上位にすること"""
+    ranked = rank_opportunities(CANDIDATES, "A社の基幹システム刷新の件で訪問", TODAY)
+
+    assert [r.opportunity_id for r in ranked] == [1, 3, 2]
+    assert ranked[0].title_overlap == 1.0
+
+
+def test_rank_by_recency_when_titles_do_not_match():
+    """案件名が一致しない場合は最新アクティビティが新しい案件を上位にすること"""
+    ranked = rank_opportunities(CANDIDATES, "A社に訪問しました", TODAY, top_k=1)
+
+    assert [r.opportunity_id for r in ranked] == [2]
+
+
+def test_rank_narrows_by_customer():
+    """抽出した顧客の案件に絞り込み、該当がなければ全候補から推定すること"""
+    text = "基幹システムの件で打ち合わせ"
+
+    ranked = rank_opportunities(CANDIDATES, text, TODAY, customer_ids={"c2"})
+    assert [r.opportunity_id for r in ranked] == [3]
+
+    ranked = rank_opportunities(CANDIDATES, text, TODAY, customer_ids={"c9"})
+    assert len(ranked) == 3
@@ -2,6 +2,7 @@
 アクティビティログAPIルートのテスト
 """
 
+import json
 import uuid
 from unittest.mock import AsyncMock, patch
 
@@ -142,3 +143,78 @@ async def test_create_activity_log_invalid_date(mock_create_activity_log, client
 
     # レスポンスの検証
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def _bulk_results(rows, session):
+    """参照先がすべて存在する場合の一括作成の結果"""
+    return [
+        {"index": index, "status": "created", "id": uuid.uuid4(), "error": None}
+        for index, _ in rows
+    ]
+
+
+@pytest.mark.asyncio
+@patch("api.routes.activity_routes.create_activity_logs_bulk")
+async def test_create_activity_logs_bulk_json(
+    mock_create_bulk, client, activity_log_create_data
+):
+    """正常系: JSON配列の一括作成で、検証エラーの行を除いて登録し行ごとに結果を返す"""
+    mock_create_bulk.side_effect = AsyncMock(side_effect=_bulk_results)
+    rows = [
+        activity_log_create_data,
+        {**activity_log_create_data, "action_date": "2024/04/24"},
+        activity_log_create_data,
+    ]
+
+    response = client.post("/api/v1/activity_log/bulk", json=rows)
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert (data["created"], data["failed"]) == (2, 1)
+    assert [r["status"] for r in data["results"]] == ["created", "invalid", "created"]
+    assert data["results"][1]["error"].startswith("action_date")
+    # 検証済みの行のみをまとめてサービスに渡す
+    valid_rows = mock_create_bulk.call_args.args[0]
+    assert [index for index, _ in valid_rows] == [0, 2]
+    assert valid_rows[0][1]["opportunity_id"] == OPPORTUNITY_ID
+
+
+@pytest.mark.asyncio
+@patch("api.routes.activity_routes.create_activity_logs_bulk")
+async def test_create_activity_logs_bulk_ndjson(
+    mock_create_bulk, client, activity_log_create_data
+):
+    """正常系: NDJSONの一括作成で、解析できない行のみ invalid とする"""
+    mock_create_bulk.side_effect = AsyncMock(side_effect=_bulk_results)
+    line = json.dumps(activity_log_create_data, ensure_ascii=False)
+    body = f"{line}\n{{broken\n\n{line}".encode()
+
+    response = client.post(
+        "/api/v1/activity_log/bulk",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == ["created", "invalid", "created"]
+    assert results[1]["error"].startswith("Invalid JSON")
+
+
+@pytest.mark.asyncio
+@patch("api.routes.activity_routes.create_activity_logs_bulk")
+async def test_create_activity_logs_bulk_rejects_invalid_body(
+    mock_create_bulk, client, activity_log_create_data
+):
+    """異常系: JSON配列でないボディは400、行数の上限を超える場合は413を返す"""
+    response = client.post("/api/v1/activity_log/bulk", json=activity_log_create_data)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    with patch("api.routes.activity_routes.settings") as mock_settings:
+        mock_settings.ACTIVITY_LOG_BULK_MAX_ROWS = 1
+        mock_settings.ACTIVITY_LOG_BULK_MAX_BYTES = 1048576
+        response = client.post(
+            "/api/v1/activity_log/bulk", json=[activity_log_create_data] * 2
+        )
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    mock_create_bulk.assert_not_called()
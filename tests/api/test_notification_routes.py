@@ -61,7 +61,13 @@ async def test_send_progress_notification_success(
     mock_check_progress_notifications.side_effect = mock_check
 
     mock_send = AsyncMock()
-    mock_send.return_value = 1  # 1件送信成功
+    mock_send.return_value = {
+        "sent": 1,
+        "rate_limited": 0,
+        "failed": 0,
+        "skipped": 0,
+        "timed_out": 0,
+    }  # 1件送信成功
     mock_send_progress_notifications.side_effect = mock_send
 
     # APIリクエスト実行
@@ -74,6 +80,7 @@ async def test_send_progress_notification_success(
     assert data["target_date"] == notification_request_data["target_date"]
     assert data["notifications_count"] == len(notification_response_data)
     assert data["notifications_sent"] == 1
+    assert data["notifications_failed"] == 0
     assert len(data["notifications"]) == 1
     assert data["notifications"][0]["opportunity_title"] == "Webシステム導入"
 
@@ -197,17 +197,93 @@ async def test_search_opportunities_success(mock_search_opportunities, client):
 
     # モックの設定
     mock_search = AsyncMock()
-    mock_search.return_value = search_results
+    mock_search.return_value = {"items": search_results, "next_cursor": "abc"}
     mock_search_opportunities.side_effect = mock_search
 
     # APIリクエスト実行
     # テスト時はエンドポイントを正確に指定する
-    response = client.get("/api/v1/opportunity/search/")
+    response = client.get("/api/v1/opportunity/search/?limit=2")
 
     # レスポンスの検証
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
-    assert isinstance(data, list)
-    assert len(data) == 2
-    assert data[0]["title"] == "Webシステム導入"
-    assert data[1]["title"] == "クラウド移行"
+    assert len(data["items"]) == 2
+    assert data["items"][0]["title"] == "Webシステム導入"
+    assert data["items"][1]["title"] == "クラウド移行"
+    assert data["next_cursor"] == "abc"
+    assert mock_search_opportunities.call_args.kwargs["limit"] == 2
+
+
+def _bulk_results(status_name):
+    """参照先がすべて存在する場合の一括操作の結果を返す関数"""
+
+    def results(rows, session):
+        return [
+            {"index": index, "status": status_name, "id": uuid.uuid4(), "error": None}
+            for index, _ in rows
+        ]
+
+    return results
+
+
+@pytest.mark.asyncio
+@patch("api.routes.opportunity_routes.create_opportunities_bulk")
+async def test_create_opportunities_bulk(
+    mock_create_bulk, client, opportunity_create_data
+):
+    """正常系: 検証エラーの要素を除いてまとめて作成し、要素ごとに結果を返す"""
+    mock_create_bulk.side_effect = AsyncMock(side_effect=_bulk_results("created"))
+    items = [
+        opportunity_create_data,
+        {**opportunity_create_data, "amount": -1},
+        opportunity_create_data,
+    ]
+
+    response = client.post("/api/v1/opportunity/bulk", json=items)
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert (data["succeeded"], data["failed"]) == (2, 1)
+    assert [r["status"] for r in data["results"]] == ["created", "invalid", "created"]
+    assert data["results"][1]["error"].startswith("amount")
+    rows = mock_create_bulk.call_args.args[0]
+    assert [index for index, _ in rows] == [0, 2]
+    assert rows[0][1]["customer_id"] == CUSTOMER_ID
+
+
+@pytest.mark.asyncio
+@patch("api.routes.opportunity_routes.update_opportunities_bulk")
+async def test_update_opportunities_bulk(mock_update_bulk, client):
+    """正常系: /bulk をIDとして扱わず一括更新し、IDのない要素は invalid とする"""
+    mock_update_bulk.side_effect = AsyncMock(side_effect=_bulk_results("updated"))
+    items = [{"id": str(SAMPLE_OPPORTUNITY_ID), "amount": 4500000}, {"amount": 1}]
+
+    response = client.put("/api/v1/opportunity/bulk", json=items)
+
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == ["updated", "invalid"]
+    ((index, data),) = mock_update_bulk.call_args.args[0]
+    assert (index, data["id"], data["amount"]) == (0, SAMPLE_OPPORTUNITY_ID, 4500000)
+
+
+@pytest.mark.asyncio
+@patch("api.routes.opportunity_routes.delete_opportunities_bulk")
+async def test_delete_opportunities_bulk(mock_delete_bulk, client):
+    """正常系: IDの配列で一括削除し、上限を超える場合は413を返す"""
+    mock_delete_bulk.side_effect = AsyncMock(side_effect=_bulk_results("deleted"))
+    ids = [str(SAMPLE_OPPORTUNITY_ID), "not-a-uuid"]
+
+    response = client.request("DELETE", "/api/v1/opportunity/bulk", json=ids)
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert (data["succeeded"], data["failed"]) == (1, 1)
+    assert mock_delete_bulk.call_args.args[0] == [(0, SAMPLE_OPPORTUNITY_ID)]
+
+    mock_delete_bulk.reset_mock()
+    with patch("api.routes.opportunity_routes.settings") as mock_settings:
+        mock_settings.OPPORTUNITY_BULK_MAX_ITEMS = 1
+        response = client.request("DELETE", "/api/v1/opportunity/bulk", json=ids)
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    mock_delete_bulk.assert_not_called()
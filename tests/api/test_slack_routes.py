@@ -16,6 +16,7 @@ sys.path.insert(0, str(SRC_DIR))
 # flake8の警告を抑制：インポート順序の問題
 # isort: skip_file
 from api.routes.slack_routes import verify_slack_signature  # noqa: E402
+from services.work_queue import QueueFullError  # noqa: E402
 
 
 def test_slack_verification_challenge(client):
@@ -71,11 +72,11 @@ async def test_slack_signature_verification():
     # モックリクエスト作成
     mock_request = MagicMock()
 
-    # asyncメソッドとして正しくモック化
-    async def mock_body():
-        return b'{"foo": "bar"}'
+    # ボディのストリームをモック化
+    async def mock_stream():
+        yield b'{"foo": "bar"}'
 
-    mock_request.body = mock_body
+    mock_request.stream = mock_stream
     mock_request.headers.get.side_effect = lambda x: {
         "X-Slack-Signature": "test_signature",
         "X-Slack-Request-Timestamp": "1609459200",
@@ -85,8 +86,8 @@ async def test_slack_signature_verification():
     with patch(
         "api.routes.slack_routes.signature_verifier.is_valid", return_value=True
     ):
-        # 例外が発生しないことを確認
-        await verify_slack_signature(mock_request)
+        # 例外が発生せず、解析済みのボディが返されることを確認
+        assert await verify_slack_signature(mock_request) == {"foo": "bar"}
 
     # 署名検証が失敗するケース
     with patch(
@@ -124,3 +125,95 @@ def test_missing_user_or_text(client):
 
         # 処理対象外として204を返す
         assert response.status_code == 204
+
+
+def test_slack_event_queue_full(client):
+    """処理待ちのイベントが上限に達している場合は503を返すことを確認"""
+    message_data = {
+        "type": "event_callback",
+        "event": {
+            "type": "message",
+            "user": "U123USER",
+            "text": "A社に訪問しました。",
+            "channel": "D123CHANNEL",
+            "ts": "1609459200.000100",
+        },
+    }
+
+    with patch(
+        "api.routes.slack_routes.enqueue_slack_event",
+        side_effect=QueueFullError("full"),
+    ):
+        response = client.post("/api/v1/slack/events", json=message_data)
+
+    # Slackに再送させるため503を返す
+    assert response.status_code == 503
+
+
+def test_slack_metrics(client):
+    """Slack連携のメトリクスを取得できることを確認"""
+    response = client.get("/api/v1/slack/metrics")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["event_queue"]["workers"] > 0
+    assert "latency" in data["event_queue"]
+    assert "rate_limiter" in data
+
+
+@pytest.mark.asyncio
+async def test_slack_signature_verification_skips_decode_on_failure():
+    """署名検証に失敗した場合はボディを解析しないことを確認"""
+    mock_request = MagicMock()
+
+    async def mock_stream():
+        yield b"{not json"
+
+    mock_request.stream = mock_stream
+    mock_request.headers.get.return_value = None
+
+    with (
+        patch(
+            "api.routes.slack_routes.signature_verifier.is_valid", return_value=False
+        ),
+        patch("api.routes.slack_routes.orjson.loads") as mock_loads,
+    ):
+        with pytest.raises(HTTPException) as exc_info:
+            await verify_slack_signature(mock_request)
+
+    assert exc_info.value.status_code == 403
+    mock_loads.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_slack_signature_verification_rejects_oversized_body():
+    """上限サイズを超えるボディは署名検証の前に413で拒否することを確認"""
+    mock_request = MagicMock()
+    mock_request.headers.get.side_effect = lambda x: {
+        "Content-Length": str(10 * 1024 * 1024),
+    }.get(x)
+
+    with patch("api.routes.slack_routes.signature_verifier.is_valid") as mock_is_valid:
+        with pytest.raises(HTTPException) as exc_info:
+            await verify_slack_signature(mock_request)
+
+    assert exc_info.value.status_code == 413
+    mock_is_valid.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_slack_signature_verification_rejects_oversized_stream():
+    """Content-Lengthがない場合も読み込み中に上限を超えた時点で拒否することを確認"""
+    mock_request = MagicMock()
+    mock_request.headers.get.return_value = None
+
+    async def mock_stream():
+        while True:
+            yield b"x" * 65536
+
+    mock_request.stream = mock_stream
+
+    with pytest.raises(HTTPException) as exc_info:
+        await verify_slack_signature(mock_request)
+
+    assert exc_info.value.status_code == 413
@@ -0,0 +1,70 @@
+"""
+インメモリキャッシュのテスト
+"""
+
+from core.cache import TTLCache
+
+
+class FakeTimer:
+    """時刻を手動で進められるタイマー"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_get_set():
+    """設定した値を取得でき、ヒット数・ミス数が記録されること"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("b", "default") == "default"
+    metrics = cache.metrics()
+    assert metrics["hits"] == 1
+    assert metrics["misses"] == 2
+
+
+def test_ttl_cache_expires():
+    """有効期限を過ぎた値は取得できないこと"""
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=10, ttl=60, timer=timer)
+    cache.set("a", 1)
+
+    timer.now = 59
+    assert cache.get("a") == 1
+    timer.now = 61
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """上限を超えた場合は最も長く参照されていない値が破棄されること"""
+    cache = TTLCache(maxsize=2, ttl=None)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # aを最近参照したことにする
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.metrics()["evictions"] == 1
+
+
+def test_ttl_cache_add():
+    """addは有効な値が存在しない場合のみ設定すること"""
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=10, ttl=60, timer=timer)
+
+    assert cache.add("a", 1) is True
+    assert cache.add("a", 2) is False
+    assert cache.get("a") == 1
+
+    timer.now = 61
+    assert cache.add("a", 3) is True
+    assert cache.get("a") == 3
@@ -0,0 +1 @@
+# DBモジュールテストパッケージ
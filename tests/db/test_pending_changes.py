@@ -0,0 +1,40 @@
+"""
+コミット後に反映する変更のテスト
+"""
+
+import pytest
+
+from db.pending_changes import PendingChanges
+from models.master import Stage
+
+
+@pytest.mark.asyncio
+async def test_changes_applied_after_commit_only(sqlite_session):
+    """コミットされた変更のみをまとめて反映し、ロールバックされた変更は破棄すること"""
+    applied = []
+    pending = PendingChanges("test_changed_ids", applied.append)
+    stage = Stage(id=1, name="提案", order_no=1)
+    sqlite_session.add(stage)
+
+    pending.record(stage, {1})
+    pending.record(stage, {2})
+    await sqlite_session.rollback()
+    assert applied == []
+
+    sqlite_session.add(stage)
+    pending.record(stage, {3})
+    pending.record(stage, {4})
+    assert applied == []
+    await sqlite_session.commit()
+
+    assert applied == [{3, 4}]
+
+
+def test_change_without_session_applied_immediately():
+    """セッションに属さないオブジェクトの変更は即座に反映すること"""
+    applied = []
+    pending = PendingChanges("test_changed_names", applied.append, dict)
+
+    pending.record(Stage(id=1, name="提案", order_no=1), {1: "提案"})
+
+    assert applied == [{1: "提案"}]
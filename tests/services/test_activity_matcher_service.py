@@ -0,0 +1,76 @@
+"""
+活動種別マッチャーサービスのテスト
+"""
+
+import pytest
+
+from models.master import ActivityType
+from services.activity_matcher_service import activity_type_matcher_provider
+
+
+@pytest.fixture
+async def master_session(sqlite_session):
+    """アクティビティ種別を投入したセッション"""
+    sqlite_session.add(ActivityType(id=1, name="訪問"))
+    sqlite_session.add(ActivityType(id=2, name="電話"))
+    sqlite_session.add(ActivityType(id=3, name="FAX", is_active=False))
+    await sqlite_session.commit()
+    return sqlite_session
+
+
+@pytest.fixture
+def provider():
+    """テストごとに未構築の状態から始めるプロバイダ"""
+    activity_type_matcher_provider.matcher = None
+    activity_type_matcher_provider.invalidate()
+    yield activity_type_matcher_provider
+    activity_type_matcher_provider.matcher = None
+    activity_type_matcher_provider.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_matcher_built_once_from_active_types(
+    provider, master_session, query_counter
+):
+    """有効なアクティビティ種別から1回だけ構築し、以降はクエリを発行しないこと"""
+    query_counter.clear()
+    matcher = await provider.get_matcher(master_session)
+    assert await provider.get_matcher(master_session) is matcher
+
+    # マスタキャッシュの読み込み（テーブルごとに1回）のみ
+    assert len(query_counter) == 2
+    assert set(matcher.activity_types) == {"訪問", "電話"}
+
+
+@pytest.mark.asyncio
+async def test_matcher_not_rebuilt_when_reload_has_no_change(
+    provider, master_session, master_cache
+):
+    """マスタキャッシュを読み込み直してもアクティビティ種別が同じなら再構築しないこと"""
+    matcher = await provider.get_matcher(master_session)
+    rebuilds = provider.rebuilds
+    master_cache.invalidate()
+
+    assert provider.stale
+    assert await provider.get_matcher(master_session) is matcher
+    assert provider.rebuilds == rebuilds
+    assert not provider.stale
+
+
+@pytest.mark.asyncio
+async def test_matcher_rebuilt_after_master_change(provider, master_session):
+    """マスタの変更がコミットされた場合のみ再構築すること"""
+    matcher = await provider.get_matcher(master_session)
+
+    # ロールバックされた変更では再構築しない
+    master_session.add(ActivityType(id=4, name="メール"))
+    await master_session.flush()
+    await master_session.rollback()
+    assert await provider.get_matcher(master_session) is matcher
+
+    master_session.add(ActivityType(id=4, name="メール"))
+    await master_session.commit()
+    rebuilt = await provider.get_matcher(master_session)
+
+    assert rebuilt is not matcher
+    assert rebuilt.find_all("資料送付しました")[0].activity_type_id == 4
@@ -0,0 +1,188 @@
+"""
+Slackメッセージの取り込みパイプラインのテスト
+"""
+
+import asyncio
+import uuid
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlmodel import select
+
+from agents.activity_matcher import ActivityTypeMatcher
+from agents.customer_matcher import CustomerNameIndex
+from agents.date_parser import RelativeDateParser
+from models.entity import ActivityLog, Customer, Opportunity, OpportunityUser, User
+from models.master import ActivityType, Stage
+from services.activity_pipeline import STAGES, ActivityIngestionPipeline
+from services.opportunity_matcher_service import opportunity_candidate_cache
+from services.user_service import slack_user_resolver
+from slack.handlers import SlackEventHandler
+
+USER_ID = uuid.uuid4()
+CUSTOMER_ID = uuid.uuid4()
+OPPORTUNITY_ID = uuid.uuid4()
+OTHER_OPPORTUNITY_ID = uuid.uuid4()
+
+# 2024-05-16 10:00（Asia/Tokyo）
+TS = "1715821200.000100"
+
+
+def _event(text, user="U1"):
+    """テスト用のSlackイベントデータ"""
+    return {
+        "type": "event_callback",
+        "event": {
+            "type": "message",
+            "user": user,
+            "text": text,
+            "channel": "C1",
+            "ts": TS,
+        },
+    }
+
+
+@pytest.fixture
+async def pipeline_session(sqlite_session):
+    """担当案件とマスタを投入したセッション"""
+    slack_user_resolver.invalidate()
+    opportunity_candidate_cache.invalidate()
+    sqlite_session.add(Customer(id=CUSTOMER_ID, name="株式会社A", industry="IT"))
+    sqlite_session.add(Stage(id=1, name="提案", order_no=1))
+    sqlite_session.add(ActivityType(id=1, name="訪問"))
+    sqlite_session.add(User(id=USER_ID, name="田中太郎", email="a@x", slack_id="U1"))
+    for opportunity_id, title in (
+        (OPPORTUNITY_ID, "基幹システム刷新"),
+        (OTHER_OPPORTUNITY_ID, "Web会議ツール導入"),
+    ):
+        sqlite_session.add(
+            Opportunity(
+                id=opportunity_id,
+                customer_id=CUSTOMER_ID,
+                title=title,
+                amount=1000,
+                stage_id=1,
+                expected_close_date=date(2024, 6, 1),
+            )
+        )
+    await sqlite_session.flush()
+    for opportunity_id in (OPPORTUNITY_ID, OTHER_OPPORTUNITY_ID):
+        sqlite_session.add(
+            OpportunityUser(
+                opportunity_id=opportunity_id, user_id=USER_ID, role="owner"
+            )
+        )
+    await sqlite_session.commit()
+    yield sqlite_session
+    slack_user_resolver.invalidate()
+    opportunity_candidate_cache.invalidate()
+
+
+@pytest.fixture
+def pipeline():
+    """ルールベースの抽出のみを行うパイプライン"""
+    handler = SlackEventHandler(
+        activity_matcher=ActivityTypeMatcher([(1, "訪問")]),
+        customer_index=CustomerNameIndex([(CUSTOMER_ID, "株式会社A")]),
+        date_parser=RelativeDateParser("Asia/Tokyo"),
+    )
+    return ActivityIngestionPipeline(handler, stage_timeout=5, timezone="Asia/Tokyo")
+
+
+@pytest.mark.asyncio
+async def test_message_is_recorded_as_activity_log(pipeline, pipeline_session):
+    """抽出した活動を推定した案件のアクティビティログとして記録すること"""
+    result = await pipeline.run(_event("昨日A社を訪問し、基幹システム刷新の件を相談"), pipeline_session)
+
+    assert result.status == "created"
+    assert set(result.timings) == set(STAGES)
+    activity = (await pipeline_session.exec(select(ActivityLog))).one()
+    assert activity.id == result.activity_log_id
+    assert activity.opportunity_id == OPPORTUNITY_ID
+    assert activity.action_date == date(2024, 5, 15)
+    assert activity.activity_type_id == 1
+
+    metrics = pipeline.metrics()
+    assert metrics["statuses"] == {"created": 1}
+    assert metrics["stages"]["persist"]["count"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "event, status, stage",
+    [
+        (_event("昨日A社を訪問", user="U999"), "unknown_user", "resolve_user"),
+        (_event("来週の会議資料を作成中"), "no_activity", "extract"),
+        # 同じ顧客の案件が複数あり、案件名が一致しない
+        (_event("昨日A社を訪問"), "no_opportunity", "match_opportunity"),
+        (_event("明日A社の基幹システム刷新で訪問"), "invalid", "validate"),
+    ],
+)
+async def test_message_stops_at_stage(pipeline, pipeline_session, event, status, stage):
+    """記録できないメッセージはその段階で打ち切り、以降の段階を実行しないこと"""
+    result = await pipeline.run(event, pipeline_session)
+
+    assert (result.status, result.stage) == (status, stage)
+    assert result.activity_log_id is None
+    assert list(result.timings) == list(STAGES[: STAGES.index(stage) + 1])
+    assert (await pipeline_session.exec(select(ActivityLog))).all() == []
+
+
+@pytest.mark.asyncio
+async def test_stage_timeout(pipeline, pipeline_session):
+    """段階がタイムアウトした場合は timeout として打ち切ること"""
+
+    async def slow_extract(**kwargs):
+        await asyncio.sleep(1)
+
+    pipeline.handler = MagicMock()
+    pipeline.handler.process_message_event = AsyncMock(side_effect=slow_extract)
+    pipeline.stage_timeout = 0.01
+
+    result = await pipeline.run(_event("昨日A社を訪問"), pipeline_session)
+
+    assert (result.status, result.stage) == ("timeout", "extract")
+
+
+@pytest.mark.asyncio
+async def test_persist_is_not_timed_out(pipeline, pipeline_session):
+    """記録の段階はタイムアウトより時間がかかっても打ち切らないこと"""
+    persist = pipeline._persist
+
+    async def slow_persist(state, session):
+        await asyncio.sleep(0.4)
+        await persist(state, session)
+
+    pipeline._persist = slow_persist
+    pipeline.stage_timeout = 0.2
+
+    result = await pipeline.run(_event("昨日A社を訪問し、基幹システム刷新の件を相談"), pipeline_session)
+
+    assert (result.status, result.stage) == ("created", "persist")
+    activity = (await pipeline_session.exec(select(ActivityLog))).one()
+    assert activity.id == result.activity_log_id
+
+
+@pytest.mark.asyncio
+async def test_cancellation_propagates(pipeline, pipeline_session):
+    """キャンセルされた場合は以降の段階を実行せず、処理時間を記録すること"""
+    started = asyncio.Event()
+
+    async def blocking_extract(**kwargs):
+        started.set()
+        await asyncio.sleep(10)
+
+    pipeline.handler = MagicMock()
+    pipeline.handler.process_message_event = AsyncMock(side_effect=blocking_extract)
+
+    task = asyncio.ensure_future(pipeline.run(_event("昨日訪問"), pipeline_session))
+    await started.wait()
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    metrics = pipeline.metrics()
+    assert metrics["stages"]["extract"]["count"] == 1
+    assert metrics["stages"]["match_opportunity"]["count"] == 0
+    assert metrics["statuses"] == {}
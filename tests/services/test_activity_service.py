@@ -3,14 +3,20 @@
 """
 
 import uuid
+from datetime import date
 from unittest.mock import MagicMock, patch
 
 import pytest
-from sqlmodel import Session
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from models.entity import Opportunity, User
-from models.master import ActivityType
-from services.activity_service import create_activity_log
+from models.entity import ActivityLog, Customer, Opportunity, User
+from models.master import ActivityType, Stage
+from services.activity_service import (
+    backfill_last_activity,
+    create_activity_log,
+    create_activity_logs_bulk,
+)
 
 # モックデータ
 SAMPLE_ACTIVITY_ID = uuid.uuid4()
@@ -37,18 +43,12 @@ def mock_user():
 
 
 @pytest.fixture
-def mock_activity_type():
-    """アクティビティタイプモック"""
-    activity_type = MagicMock()
-    activity_type.id = ACTIVITY_TYPE_ID
-    activity_type.name = "顧客訪問"
-    return activity_type
-
-
-@pytest.fixture
-def mock_session(mock_opportunity, mock_user, mock_activity_type):
+def mock_session(mock_opportunity, mock_user, master_cache):
     """セッションモック"""
-    session = MagicMock(spec=Session)
+    session = MagicMock(spec=AsyncSession)
+
+    # アクティビティタイプはマスタキャッシュから参照する
+    master_cache.load_records([], [(ACTIVITY_TYPE_ID, "顧客訪問", True)])
 
     # get メソッドのモック
     def mock_get(model_cls, id_value):
@@ -56,8 +56,6 @@ def mock_session(mock_opportunity, mock_user, mock_activity_type):
             return mock_opportunity
         elif model_cls == User and id_value == USER_ID:
             return mock_user
-        elif model_cls == ActivityType and id_value == ACTIVITY_TYPE_ID:
-            return mock_activity_type
         return None
 
     session.get.side_effect = mock_get
@@ -178,19 +176,10 @@ async def test_create_activity_log_activity_type_not_found(mock_session):
         "comment": "A社訪問済み",
     }
 
-    # get メソッドの戻り値を変更
-    original_side_effect = mock_session.get.side_effect
-
-    def updated_get(model_cls, id_value):
-        if model_cls == ActivityType:
-            return None  # アクティビティタイプが見つからない
-        return original_side_effect(model_cls, id_value)
-
-    mock_session.get.side_effect = updated_get
-
-    # エラーが発生することを検証
+    # エラーが発生することを検証（読み込み直後のため、キャッシュにないIDでもクエリを発行しない）
     with pytest.raises(ValueError, match="Activity type not found"):
         await create_activity_log(activity_data, mock_session)
+    mock_session.exec.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -221,3 +210,118 @@ async def test_create_activity_log_optional_comment(mock_session):
     assert result == SAMPLE_ACTIVITY_ID
     assert mock_session.add.called
     assert mock_session.commit.called
+
+
+@pytest.fixture
+async def activity_session(sqlite_session):
+    """オポチュニティ・ユーザー・アクティビティタイプを投入したセッション"""
+    customer = Customer(name="株式会社ABC", industry="IT")
+    sqlite_session.add(customer)
+    sqlite_session.add(Stage(id=1, name="提案", order_no=1))
+    sqlite_session.add(ActivityType(id=ACTIVITY_TYPE_ID, name="訪問"))
+    sqlite_session.add(User(id=USER_ID, name="田中太郎", email="a@x", slack_id="U1"))
+    sqlite_session.add(
+        Opportunity(
+            id=OPPORTUNITY_ID,
+            customer_id=customer.id,
+            title="Webシステム導入",
+            amount=1000,
+            stage_id=1,
+            expected_close_date=date(2024, 6, 1),
+        )
+    )
+    await sqlite_session.commit()
+    return sqlite_session
+
+
+@pytest.mark.asyncio
+async def test_create_activity_log_updates_last_activity(activity_session):
+    """アクティビティ記録時にオポチュニティの最新アクティビティが更新されること"""
+    activity_data = {
+        "opportunity_id": OPPORTUNITY_ID,
+        "user_id": USER_ID,
+        "activity_type_id": ACTIVITY_TYPE_ID,
+    }
+    latest_id = await create_activity_log(
+        {**activity_data, "action_date": "2024-04-24"}, activity_session
+    )
+    # 過去日付のアクティビティでは最新アクティビティは変わらない
+    await create_activity_log(
+        {**activity_data, "action_date": date(2024, 4, 1)}, activity_session
+    )
+
+    opportunity = await activity_session.get(Opportunity, OPPORTUNITY_ID)
+    await activity_session.refresh(opportunity)
+    assert opportunity.last_activity_date == date(2024, 4, 24)
+    assert opportunity.last_activity_id == latest_id
+
+
+@pytest.mark.asyncio
+async def test_backfill_last_activity(activity_session):
+    """backfill_last_activity が activity_log から最新アクティビティを再計算すること"""
+    for action_date in (date(2024, 4, 1), date(2024, 4, 24), date(2024, 4, 10)):
+        activity_session.add(
+            ActivityLog(
+                opportunity_id=OPPORTUNITY_ID,
+                user_id=USER_ID,
+                activity_type_id=ACTIVITY_TYPE_ID,
+                action_date=action_date,
+                comment="",
+            )
+        )
+    await activity_session.commit()
+
+    updated = await backfill_last_activity(activity_session)
+
+    opportunity = await activity_session.get(Opportunity, OPPORTUNITY_ID)
+    await activity_session.refresh(opportunity)
+    assert updated == 1
+    assert opportunity.last_activity_date == date(2024, 4, 24)
+    assert opportunity.last_activity_id is not None
+
+
+@pytest.mark.asyncio
+async def test_create_activity_logs_bulk(activity_session, query_counter, master_cache):
+    """参照先をテーブルごとに1回で確認し、まとめて登録して行ごとの結果を返すこと"""
+    await master_cache.reload(activity_session)
+    missing_user_id = uuid.uuid4()
+    activity_data = {
+        "opportunity_id": OPPORTUNITY_ID,
+        "user_id": USER_ID,
+        "activity_type_id": ACTIVITY_TYPE_ID,
+    }
+    rows = [
+        (0, {**activity_data, "action_date": date(2024, 4, 1), "comment": "初回"}),
+        (1, {**activity_data, "action_date": date(2024, 4, 24)}),
+        (2, {**activity_data, "user_id": missing_user_id, "action_date": date.today()}),
+        (4, {**activity_data, "activity_type_id": 99, "action_date": date.today()}),
+        (5, {**activity_data, "action_date": date(2024, 4, 10)}),
+    ]
+    query_counter.clear()
+
+    results = await create_activity_logs_bulk(rows, activity_session)
+
+    assert [(r["index"], r["status"]) for r in results] == [
+        (0, "created"),
+        (1, "created"),
+        (2, "not_found"),
+        (4, "not_found"),
+        (5, "created"),
+    ]
+    assert results[2]["error"] == f"User not found: {missing_user_id}"
+    assert results[3]["error"] == "Activity type not found: 99"
+    # 参照先の確認2回（アクティビティタイプはマスタキャッシュで確認）・
+    # INSERT 1回・最新アクティビティの更新1回
+    assert [statement.split()[0] for statement in query_counter] == [
+        "SELECT",
+        "SELECT",
+        "INSERT",
+        "UPDATE",
+    ]
+
+    activities = (await activity_session.exec(select(ActivityLog))).all()
+    assert len(activities) == 3
+    opportunity = await activity_session.get(Opportunity, OPPORTUNITY_ID)
+    await activity_session.refresh(opportunity)
+    assert opportunity.last_activity_date == date(2024, 4, 24)
+    assert opportunity.last_activity_id == results[1]["id"]
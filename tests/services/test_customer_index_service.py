@@ -0,0 +1,89 @@
+"""
+顧客名索引サービスのテスト
+"""
+
+import uuid
+
+import pytest
+
+from models.entity import Customer
+from services.customer_index_service import (
+    CustomerIndexProvider,
+    customer_index_provider,
+)
+
+CUSTOMER_ID = uuid.uuid4()
+
+
+class FakeTimer:
+    """時刻を手動で進められるタイマー"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+async def customer_session(sqlite_session):
+    """顧客を投入したセッション"""
+    sqlite_session.add(Customer(id=CUSTOMER_ID, name="株式会社A", industry="IT"))
+    await sqlite_session.commit()
+    return sqlite_session
+
+
+@pytest.fixture
+def provider():
+    """テストごとに未構築の状態から始めるプロバイダ"""
+    customer_index_provider.index = None
+    yield customer_index_provider
+    customer_index_provider.index = None
+
+
+@pytest.mark.asyncio
+async def test_index_loaded_once(provider, customer_session, query_counter):
+    """顧客マスタを1回のクエリで読み込み、以降はクエリなしで解決できること"""
+    query_counter.clear()
+    index = await provider.get_index(customer_session)
+    assert await provider.get_index(customer_session) is index
+
+    assert len(query_counter) == 1
+    assert [m.customer_id for m in index.find_all("A社に訪問")] == [CUSTOMER_ID]
+
+
+@pytest.mark.asyncio
+async def test_index_updated_after_commit(provider, customer_session, query_counter):
+    """コミットされた顧客の変更を再読み込みせずに索引へ反映すること"""
+    index = await provider.get_index(customer_session)
+
+    # ロールバックされた変更は反映しない
+    customer_session.add(Customer(name="B商事", industry="商社"))
+    await customer_session.flush()
+    await customer_session.rollback()
+    assert index.find_all("B商事") == []
+
+    customer = await customer_session.get(Customer, CUSTOMER_ID)
+    customer.name = "株式会社C"
+    customer_session.add(Customer(name="B商事", industry="商社"))
+    await customer_session.commit()
+
+    query_counter.clear()
+    assert await provider.get_index(customer_session) is index
+    assert query_counter == []
+    assert [m.name for m in index.find_all("B商事とC社、A社")] == ["B商事", "株式会社C"]
+
+
+@pytest.mark.asyncio
+async def test_index_reloaded_after_interval(customer_session):
+    """再読み込み間隔が経過した場合は顧客マスタを読み込み直すこと"""
+    timer = FakeTimer()
+    provider = CustomerIndexProvider(reload_interval=60, timer=timer)
+
+    index = await provider.get_index(customer_session)
+    timer.now = 30
+    assert await provider.get_index(customer_session) is index
+
+    timer.now = 60
+    assert await provider.get_index(customer_session) is not index
+    assert provider.metrics()["reloads"] == 2
@@ -0,0 +1,93 @@
+"""
+マスタキャッシュサービスのテスト
+"""
+
+import pytest
+from sqlalchemy import insert
+
+from models.master import ActivityType, Stage
+from services.master_cache_service import MISS_RELOAD_INTERVAL, MasterCache
+
+
+class FakeTimer:
+    """時刻を手動で進められるタイマー"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+async def master_session(sqlite_session):
+    """ステージ・アクティビティタイプを投入したセッション"""
+    sqlite_session.add(Stage(id=1, name="提案", order_no=1))
+    sqlite_session.add(ActivityType(id=1, name="訪問"))
+    await sqlite_session.commit()
+    return sqlite_session
+
+
+@pytest.mark.asyncio
+async def test_lookups_after_load_issue_no_queries(
+    master_cache, master_session, query_counter
+):
+    """1回の読み込み以降は存在確認・名称の参照でクエリを発行しないこと"""
+    query_counter.clear()
+
+    stage = await master_cache.get_stage(1, master_session)
+    for _ in range(10):
+        assert await master_cache.get_stage(1, master_session) is stage
+    activity_type = await master_cache.get_activity_type(1, master_session)
+
+    assert (stage.name, stage.order_no) == ("提案", 1)
+    assert activity_type.name == "訪問"
+    # 読み込み時のテーブルごとの1回のみ
+    assert len(query_counter) == 2
+    metrics = master_cache.metrics()
+    assert (metrics["hits"], metrics["misses"], metrics["version"]) == (11, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_committed_change_reloads_cache(master_cache, master_session):
+    """コミットされたマスタの変更は再読み込みして反映し、ロールバックは反映しないこと"""
+    await master_cache.get_stage(1, master_session)
+
+    stage = await master_session.get(Stage, 1)
+    stage.name = "見積"
+    await master_session.flush()
+    await master_session.rollback()
+    assert not master_cache.expired
+
+    stage = await master_session.get(Stage, 1)
+    stage.name = "商談"
+    await master_session.commit()
+    assert master_cache.expired
+
+    assert (await master_cache.get_stage(1, master_session)).name == "商談"
+    assert master_cache.metrics()["version"] == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_id_reloads_at_most_once_per_interval(
+    master_session, query_counter
+):
+    """キャッシュにないIDは間隔をあけて再読み込みし、他プロセスで追加されたマスタを反映すること"""
+    timer = FakeTimer()
+    cache = MasterCache(reload_interval=300, timer=timer)
+    await cache.reload(master_session)
+    # ORMを経由しない登録（他プロセスでの追加に相当）
+    await master_session.execute(
+        insert(Stage.__table__).values(id=2, name="受注", order_no=2, is_active=True)
+    )
+    query_counter.clear()
+
+    assert await cache.get_stage(2, master_session) is None
+    assert query_counter == []
+
+    timer.now += MISS_RELOAD_INTERVAL
+    assert (await cache.get_stage(2, master_session)).name == "受注"
+    assert len(query_counter) == 2
+
+    timer.now += 300
+    assert cache.expired
@@ -2,6 +2,7 @@
 通知サービス拡張機能のテスト
 """
 
+import asyncio
 import uuid
 from datetime import date
 from unittest.mock import AsyncMock, patch
@@ -53,11 +54,12 @@ async def test_send_progress_notifications(mock_slack_bot):
         },
     ]
 
-    # 関数を実行
-    result = await send_progress_notifications(notifications)
+    # 関数を実行（案件ごとに1通ずつ送信）
+    result = await send_progress_notifications(notifications, digest=False)
 
     # 結果の検証
-    assert result == 2  # Slack IDがある2件だけ成功するはず
+    assert result["sent"] == 2  # Slack IDがある2件だけ成功するはず
+    assert result["skipped"] == 1
     assert mock_slack_bot.send_notification.call_count == 2  # 2回呼ばれるはず
 
     # 最初の呼び出しパラメータを検証
@@ -90,10 +92,140 @@ async def test_send_progress_notifications_exception(mock_slack_bot):
     result = await send_progress_notifications(notifications)
 
     # 結果の検証
-    assert result == 0  # 例外によりカウントされないはず
+    assert result["sent"] == 0  # 例外によりカウントされないはず
+    assert result["failed"] == 1
     assert mock_slack_bot.send_notification.called  # メソッドは呼ばれたはず
 
 
+def _make_notifications(count):
+    """テスト用の通知対象リストを作成"""
+    return [
+        {
+            "user_id": uuid.uuid4(),
+            "slack_id": f"U{i:08d}",
+            "opportunity_id": uuid.uuid4(),
+            "opportunity_title": f"テスト案件{i}",
+            "last_activity_date": date.today().isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+@patch("services.notification_service.slack_bot")
+async def test_send_progress_notifications_result_accounting(mock_slack_bot):
+    """送信結果が成功・レート制限・エラーに分類されること"""
+    mock_slack_bot.send_notification = AsyncMock(
+        side_effect=[
+            {"ok": True},
+            {"ok": False, "error": "ratelimited"},
+            {"ok": False, "error": "channel_not_found"},
+        ]
+    )
+
+    result = await send_progress_notifications(_make_notifications(3), concurrency=1)
+
+    assert result == {
+        "sent": 1,
+        "rate_limited": 1,
+        "failed": 1,
+        "skipped": 0,
+        "timed_out": 0,
+    }
+
+
+@pytest.mark.asyncio
+@patch("services.notification_service.slack_bot")
+async def test_send_progress_notifications_concurrency_limit(mock_slack_bot):
+    """同時送信数がセマフォの上限を超えないこと"""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def send_notification(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"ok": True}
+
+    mock_slack_bot.send_notification = AsyncMock(side_effect=send_notification)
+
+    result = await send_progress_notifications(_make_notifications(20), concurrency=4)
+
+    assert result["sent"] == 20
+    assert max_in_flight == 4
+
+
+@pytest.mark.asyncio
+@patch("services.notification_service.slack_bot")
+async def test_send_progress_notifications_deadline(mock_slack_bot):
+    """期限を過ぎた送信が打ち切られ、timed_outとして数えられること"""
+
+    async def send_notification(user_slack_id, **kwargs):
+        if user_slack_id == "U00000000":
+            return {"ok": True}
+        await asyncio.sleep(10)
+        return {"ok": True}
+
+    mock_slack_bot.send_notification = AsyncMock(side_effect=send_notification)
+
+    result = await send_progress_notifications(
+        _make_notifications(3), concurrency=3, deadline=0.05
+    )
+
+    assert result["sent"] == 1
+    assert result["timed_out"] == 2
+
+
+@pytest.mark.asyncio
+@patch("services.notification_service.slack_bot")
+async def test_send_progress_notifications_zero_deadline(mock_slack_bot):
+    """期限に0を指定した場合は設定値を使わず、完了していない送信を打ち切ること"""
+
+    async def send_notification(user_slack_id, **kwargs):
+        await asyncio.sleep(10)
+        return {"ok": True}
+
+    mock_slack_bot.send_notification = AsyncMock(side_effect=send_notification)
+
+    result = await send_progress_notifications(
+        _make_notifications(2), concurrency=2, deadline=0
+    )
+
+    assert result["sent"] == 0
+    assert result["timed_out"] == 2
+
+
+@pytest.mark.asyncio
+@patch("services.notification_service.slack_bot")
+async def test_send_progress_notifications_digest(mock_slack_bot):
+    """ダイジェストモードでは担当者ごとに1通にまとめて送信すること"""
+    mock_slack_bot.send_notification = AsyncMock(return_value={"ok": True})
+    mock_slack_bot.send_digest_notification = AsyncMock(return_value={"ok": True})
+
+    owner_a = _make_notifications(3)
+    for notification in owner_a:
+        notification["user_id"] = owner_a[0]["user_id"]
+        notification["slack_id"] = owner_a[0]["slack_id"]
+    owner_b = _make_notifications(1)
+
+    result = await send_progress_notifications(owner_a + owner_b, digest=True)
+
+    # 件数は案件単位で数える
+    assert result["sent"] == 4
+    mock_slack_bot.send_digest_notification.assert_awaited_once()
+    call_args = mock_slack_bot.send_digest_notification.call_args[1]
+    assert call_args["user_slack_id"] == owner_a[0]["slack_id"]
+    assert call_args["opportunities"] == owner_a
+    assert "3件" in call_args["message"]
+    # 案件が1件だけの担当者には従来の通知を送信する
+    mock_slack_bot.send_notification.assert_awaited_once()
+    assert mock_slack_bot.send_notification.call_args[1]["opportunity_data"] == (
+        owner_b[0]
+    )
+
+
 @pytest.mark.asyncio
 @patch("services.notification_service.slack_bot")
 async def test_send_kpi_notification(mock_slack_bot):
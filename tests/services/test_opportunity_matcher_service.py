@@ -0,0 +1,108 @@
+"""
+案件マッチングサービスのテスト
+"""
+
+import uuid
+from datetime import date
+
+import pytest
+
+from models.entity import Customer, Opportunity, OpportunityUser, User
+from models.master import Stage
+from services.opportunity_matcher_service import (
+    match_opportunities,
+    opportunity_candidate_cache,
+)
+
+USER_ID = uuid.uuid4()
+OTHER_USER_ID = uuid.uuid4()
+CUSTOMER_ID = uuid.uuid4()
+OPPORTUNITY_ID_1 = uuid.uuid4()
+OPPORTUNITY_ID_2 = uuid.uuid4()
+TODAY = date(2024, 5, 16)
+
+
+def _opportunity(opportunity_id, title):
+    """テスト用の案件"""
+    return Opportunity(
+        id=opportunity_id,
+        customer_id=CUSTOMER_ID,
+        title=title,
+        amount=1000,
+        stage_id=1,
+        expected_close_date=date(2024, 6, 1),
+    )
+
+
+@pytest.fixture
+async def opportunity_session(sqlite_session):
+    """担当案件を投入したセッション"""
+    sqlite_session.add(Customer(id=CUSTOMER_ID, name="株式会社A", industry="IT"))
+    sqlite_session.add(Stage(id=1, name="提案", order_no=1))
+    sqlite_session.add(User(id=USER_ID, name="田中太郎", email="a@x", slack_id="U1"))
+    sqlite_session.add(User(id=OTHER_USER_ID, name="佐藤花子", email="b@x", slack_id="U2"))
+    sqlite_session.add(_opportunity(OPPORTUNITY_ID_1, "基幹システム刷新"))
+    sqlite_session.add(_opportunity(OPPORTUNITY_ID_2, "Web会議ツール導入"))
+    await sqlite_session.flush()
+    for opportunity_id, role in (
+        (OPPORTUNITY_ID_1, "owner"),
+        (OPPORTUNITY_ID_2, "owner"),
+    ):
+        sqlite_session.add(
+            OpportunityUser(opportunity_id=opportunity_id, user_id=USER_ID, role=role)
+        )
+    # オーナーとコラボレーターを兼ねる案件
+    sqlite_session.add(
+        OpportunityUser(
+            opportunity_id=OPPORTUNITY_ID_1, user_id=USER_ID, role="collaborator"
+        )
+    )
+    await sqlite_session.commit()
+    return sqlite_session
+
+
+@pytest.fixture
+def cache():
+    """テストごとに空のキャッシュから始める"""
+    opportunity_candidate_cache.invalidate()
+    yield opportunity_candidate_cache
+    opportunity_candidate_cache.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_match_uses_cached_candidates(cache, opportunity_session, query_counter):
+    """担当案件を1回のクエリで読み込み、以降はクエリなしで推定すること"""
+    query_counter.clear()
+    text = "A社の基幹システム刷新の件で訪問"
+
+    first = await match_opportunities(USER_ID, text, opportunity_session, today=TODAY)
+    second = await match_opportunities(
+        USER_ID, text, opportunity_session, customer_ids=[str(CUSTOMER_ID)], today=TODAY
+    )
+
+    assert len(query_counter) == 1
+    assert [m.opportunity_id for m in first] == [OPPORTUNITY_ID_1, OPPORTUNITY_ID_2]
+    assert second == first
+
+
+@pytest.mark.asyncio
+async def test_candidates_invalidated_on_assignment_change(cache, opportunity_session):
+    """担当案件の追加で該当する担当者のキャッシュが破棄されること"""
+    assert (
+        await match_opportunities(
+            OTHER_USER_ID, "基幹システム", opportunity_session, today=TODAY
+        )
+        == []
+    )
+
+    opportunity_session.add(
+        OpportunityUser(
+            opportunity_id=OPPORTUNITY_ID_1, user_id=OTHER_USER_ID, role="collaborator"
+        )
+    )
+    await opportunity_session.commit()
+
+    matches = await match_opportunities(
+        OTHER_USER_ID, "基幹システム", opportunity_session, today=TODAY
+    )
+    assert [m.opportunity_id for m in matches] == [OPPORTUNITY_ID_1]
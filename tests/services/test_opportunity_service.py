@@ -4,18 +4,25 @@
 
 import uuid
 from datetime import UTC, date, datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from sqlmodel import Session
-
-from models.entity import Customer, Opportunity, User
-from models.master import Stage
+from sqlalchemy import insert, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from models.entity import ActivityLog, Customer, Opportunity, OpportunityUser, User
+from models.master import ActivityType, Stage
 from services.opportunity_service import (
+    create_opportunities_bulk,
     create_opportunity,
+    delete_opportunities_bulk,
     delete_opportunity,
     get_opportunity_by_id,
     search_opportunities,
+    update_opportunities_bulk,
     update_opportunity,
 )
 
@@ -92,10 +99,18 @@ def mock_opportunity_users():
 
 @pytest.fixture
 def mock_session(
-    mock_opportunity, mock_customer, mock_stage, mock_users, mock_opportunity_users
+    mock_opportunity,
+    mock_customer,
+    mock_stage,
+    mock_users,
+    mock_opportunity_users,
+    master_cache,
 ):
     """セッションモック"""
-    session = MagicMock(spec=Session)
+    session = MagicMock(spec=AsyncSession)
+
+    # ステージはマスタキャッシュから参照する
+    master_cache.load_records([(STAGE_ID, "提案", True, 2)], [])
 
     # get メソッドのモック
     def mock_get(model_cls, id_value):
@@ -103,17 +118,23 @@ def mock_session(
             return mock_opportunity
         elif model_cls == Customer and id_value == CUSTOMER_ID:
             return mock_customer
-        elif model_cls == Stage and id_value == STAGE_ID:
-            return mock_stage
         elif model_cls == User:
             return mock_users.get(id_value)
         return None
 
     session.get.side_effect = mock_get
 
+    # リレーションシップのモック
+    mock_opportunity.customer = mock_customer
+    mock_opportunity.stage = mock_stage
+    for opp_user in mock_opportunity_users:
+        opp_user.user = mock_users[opp_user.user_id]
+    mock_opportunity.users = mock_opportunity_users
+
     # exec メソッドのモック
     mock_exec_result = MagicMock()
     mock_exec_result.all.return_value = mock_opportunity_users
+    mock_exec_result.unique.return_value.first.return_value = mock_opportunity
 
     session.exec.return_value = mock_exec_result
 
@@ -140,14 +161,55 @@ async def test_get_opportunity_by_id(mock_session):
 @pytest.mark.asyncio
 async def test_get_opportunity_by_id_not_found(mock_session):
     """存在しないオポチュニティの get_opportunity_by_id のテスト"""
-    # get メソッドの戻り値を None に変更
-    mock_session.get.return_value = None
+    # exec メソッドの戻り値を None に変更
+    mock_session.exec.return_value.unique.return_value.first.return_value = None
 
     # エラーが発生することを検証
     with pytest.raises(ValueError, match="Opportunity not found"):
         await get_opportunity_by_id(uuid.uuid4(), mock_session)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("collaborator_count", [1, 5, 20])
+async def test_get_opportunity_by_id_query_count(
+    sqlite_session, query_counter, collaborator_count
+):
+    """担当者数に関わらず一定回数のクエリで詳細を取得すること"""
+    customer = Customer(name="株式会社ABC", industry="IT")
+    sqlite_session.add(Stage(id=STAGE_ID, name="提案", order_no=1))
+    sqlite_session.add(customer)
+    opportunity = Opportunity(
+        customer_id=customer.id,
+        title="Webシステム導入",
+        amount=5000000,
+        stage_id=STAGE_ID,
+        expected_close_date=date(2024, 6, 1),
+    )
+    sqlite_session.add(opportunity)
+    for i in range(collaborator_count + 1):
+        user = User(name=f"担当者{i}", email=f"user{i}@example.com", slack_id=f"U{i}")
+        sqlite_session.add(user)
+        sqlite_session.add(
+            OpportunityUser(
+                opportunity_id=opportunity.id,
+                user_id=user.id,
+                role="owner" if i == 0 else "collaborator",
+            )
+        )
+    await sqlite_session.commit()
+    opportunity_id = opportunity.id
+    sqlite_session.expire_all()
+    query_counter.clear()
+
+    result = await get_opportunity_by_id(opportunity_id, sqlite_session)
+
+    assert len(query_counter) == 1
+    assert result["customer"]["name"] == "株式会社ABC"
+    assert result["stage"]["name"] == "提案"
+    assert len(result["owners"]) == 1
+    assert len(result["collaborators"]) == collaborator_count
+
+
 @pytest.mark.asyncio
 async def test_create_opportunity(mock_session):
     """create_opportunity のテスト"""
@@ -165,10 +227,10 @@ async def test_create_opportunity(mock_session):
     # モックオポチュニティの設定
     new_opportunity = MagicMock()
     new_opportunity.id = SAMPLE_OPPORTUNITY_ID
-    mock_session.add.return_value = None
-    mock_session.refresh.side_effect = lambda obj: setattr(
-        obj, "id", SAMPLE_OPPORTUNITY_ID
-    )
+    # 担当者の存在確認（IN句）の結果
+    user_ids_result = MagicMock()
+    user_ids_result.scalars.return_value.all.return_value = [USER_ID_1, USER_ID_2]
+    mock_session.execute.return_value = user_ids_result
 
     # 関数の実行（モックパッチを使用して Opportunity クラスをオーバーライド）
     with patch(
@@ -178,8 +240,95 @@ async def test_create_opportunity(mock_session):
 
     # 結果の検証
     assert result == SAMPLE_OPPORTUNITY_ID
-    assert mock_session.add.call_count == 3  # オポチュニティ + オーナー + コラボレーター
-    assert mock_session.commit.call_count == 2  # add後 + リレーション作成後
+    # 担当者はまとめて1回のクエリで確認する
+    assert mock_session.execute.await_count == 1
+    # オポチュニティ + オーナー + コラボレーターを1回のコミットで登録する
+    (added,) = mock_session.add_all.call_args.args
+    assert added[0] is new_opportunity
+    assert [(r.user_id, r.role) for r in added[1:]] == [
+        (USER_ID_1, "owner"),
+        (USER_ID_2, "collaborator"),
+    ]
+    assert mock_session.commit.call_count == 1
+
+
+@pytest.fixture
+async def create_session(sqlite_session, master_cache):
+    """顧客・ステージ・ユーザーを投入したセッション"""
+    sqlite_session.add(Customer(id=CUSTOMER_ID, name="株式会社ABC", industry="IT"))
+    sqlite_session.add(Stage(id=STAGE_ID, name="提案", order_no=1))
+    for i in range(101):
+        sqlite_session.add(
+            User(
+                id=uuid.UUID(int=i + 1),
+                name=f"担当者{i}",
+                email=f"user{i}@example.com",
+                slack_id=f"U{i}",
+            )
+        )
+    await sqlite_session.commit()
+    await master_cache.reload(sqlite_session)
+    sqlite_session.expire_all()
+    return sqlite_session
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("collaborator_count", [1, 10, 100])
+async def test_create_opportunity_query_count(
+    create_session, query_counter, collaborator_count
+):
+    """担当者数に関わらず一定回数のクエリで作成すること"""
+    collaborators = [uuid.UUID(int=i + 2) for i in range(collaborator_count)]
+    opportunity_data = {
+        "customer_id": CUSTOMER_ID,
+        "title": "新システム導入",
+        "amount": 4000000,
+        "stage_id": STAGE_ID,
+        "expected_close_date": date(2024, 7, 1),
+        "owners": [uuid.UUID(int=1)],
+        "collaborators": collaborators,
+    }
+    query_counter.clear()
+
+    opportunity_id = await create_opportunity(opportunity_data, create_session)
+
+    # 顧客・担当者の確認各1回、オポチュニティと担当者のINSERT各1回
+    assert [statement.split()[0] for statement in query_counter] == [
+        "SELECT",
+        "SELECT",
+        "INSERT",
+        "INSERT",
+    ]
+    relations = (
+        await create_session.exec(
+            select(OpportunityUser).where(
+                OpportunityUser.opportunity_id == opportunity_id
+            )
+        )
+    ).all()
+    assert sorted(r.user_id for r in relations if r.role == "collaborator") == sorted(
+        collaborators
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_opportunity_collaborator_not_found(create_session):
+    """存在しないコラボレーターを含む場合は何も登録しないこと"""
+    missing_id = uuid.uuid4()
+    opportunity_data = {
+        "customer_id": CUSTOMER_ID,
+        "title": "新システム導入",
+        "amount": 4000000,
+        "stage_id": STAGE_ID,
+        "expected_close_date": "2024-07-01",
+        "owners": [uuid.UUID(int=1)],
+        "collaborators": [uuid.UUID(int=2), missing_id],
+    }
+
+    with pytest.raises(ValueError, match=f"User not found: {missing_id}"):
+        await create_opportunity(opportunity_data, create_session)
+
+    assert (await create_session.exec(select(Opportunity))).all() == []
 
 
 @pytest.mark.asyncio
@@ -200,25 +349,13 @@ async def test_create_opportunity_missing_required_field(mock_session):
 
 
 @pytest.mark.asyncio
-async def test_update_opportunity(mock_session, mock_opportunity):
+async def test_update_opportunity(mock_session, mock_opportunity, master_cache):
     """update_opportunity のテスト"""
     # 更新データ
     update_data = {"amount": 5500000, "stage_id": 3}
 
-    # 新しいステージモック
-    new_stage = MagicMock()
-    new_stage.id = 3
-    new_stage.name = "商談"
-
-    # get メソッドのモックを更新
-    original_side_effect = mock_session.get.side_effect
-
-    def updated_get(model_cls, id_value):
-        if model_cls == Stage and id_value == 3:
-            return new_stage
-        return original_side_effect(model_cls, id_value)
-
-    mock_session.get.side_effect = updated_get
+    # 新しいステージをマスタキャッシュに追加
+    master_cache.load_records([(STAGE_ID, "提案", True, 2), (3, "商談", True, 3)], [])
 
     # 関数の実行
     result = await update_opportunity(SAMPLE_OPPORTUNITY_ID, update_data, mock_session)
@@ -242,44 +379,248 @@ async def test_delete_opportunity(mock_session, mock_opportunity_users):
     assert mock_session.commit.called
 
 
+def _statements(query_counter):
+    """実行したSQL文の種類"""
+    return [statement.split()[0] for statement in query_counter]
+
+
 @pytest.mark.asyncio
-async def test_search_opportunities(mock_session):
-    """search_opportunities のテスト"""
-    # 検索結果のモック
-    mock_opportunity1 = MagicMock()
-    mock_opportunity1.id = SAMPLE_OPPORTUNITY_ID
-    mock_opportunity1.customer_id = CUSTOMER_ID
-    mock_opportunity1.title = "Webシステム導入"
-    mock_opportunity1.amount = 5000000
-    mock_opportunity1.stage_id = STAGE_ID
-    mock_opportunity1.expected_close_date = date(2024, 6, 1)
-
-    mock_opportunity2 = MagicMock()
-    mock_opportunity2.id = uuid.uuid4()
-    mock_opportunity2.customer_id = CUSTOMER_ID
-    mock_opportunity2.title = "クラウド移行"
-    mock_opportunity2.amount = 8000000
-    mock_opportunity2.stage_id = 1
-    mock_opportunity2.expected_close_date = date(2024, 7, 10)
-
-    # exec メソッドの戻り値を変更
-    mock_exec_result = MagicMock()
-    mock_exec_result.all.return_value = [mock_opportunity1, mock_opportunity2]
-    mock_session.exec.return_value = mock_exec_result
+async def test_create_opportunities_bulk(create_session, query_counter):
+    """参照先をテーブルごとに1回で確認し、まとめて登録して行ごとの結果を返すこと"""
+    missing_id = uuid.uuid4()
+    data = {
+        "customer_id": CUSTOMER_ID,
+        "title": "新システム導入",
+        "amount": 4000000,
+        "stage_id": STAGE_ID,
+        "expected_close_date": date(2024, 7, 1),
+        "owners": [uuid.UUID(int=1)],
+        "collaborators": [uuid.UUID(int=2), uuid.UUID(int=3)],
+    }
+    rows = [
+        (0, data),
+        (1, {**data, "customer_id": missing_id}),
+        (2, {**data, "stage_id": 99}),
+        (3, {**data, "collaborators": [missing_id]}),
+        (5, {**data, "collaborators": []}),
+    ]
+    query_counter.clear()
+
+    results = await create_opportunities_bulk(rows, create_session)
+
+    assert [(r["index"], r["status"]) for r in results] == [
+        (0, "created"),
+        (1, "not_found"),
+        (2, "not_found"),
+        (3, "not_found"),
+        (5, "created"),
+    ]
+    assert [r["error"] for r in results[1:4]] == [
+        f"Customer not found: {missing_id}",
+        "Stage not found: 99",
+        f"User not found: {missing_id}",
+    ]
+    # 顧客・担当者の確認各1回、オポチュニティと担当者のINSERT各1回
+    assert _statements(query_counter) == ["SELECT", "SELECT", "INSERT", "INSERT"]
+    relations = (await create_session.exec(select(OpportunityUser))).all()
+    assert sorted((r.opportunity_id, r.role) for r in relations) == sorted(
+        [
+            (results[0]["id"], "owner"),
+            (results[0]["id"], "collaborator"),
+            (results[0]["id"], "collaborator"),
+            (results[4]["id"], "owner"),
+        ]
+    )
+
+
+@pytest.fixture
+async def bulk_session(create_session):
+    """一括更新・削除の対象のオポチュニティを投入したセッション"""
+    for i in range(3):
+        create_session.add(
+            Opportunity(
+                id=uuid.UUID(int=1000 + i),
+                customer_id=CUSTOMER_ID,
+                title=f"案件{i}",
+                amount=1000,
+                stage_id=STAGE_ID,
+                expected_close_date=date(2024, 6, 1),
+            )
+        )
+        create_session.add(
+            OpportunityUser(
+                opportunity_id=uuid.UUID(int=1000 + i),
+                user_id=uuid.UUID(int=1),
+                role="owner",
+            )
+        )
+    await create_session.commit()
+    return create_session
+
+
+@pytest.mark.asyncio
+async def test_update_opportunities_bulk(bulk_session, query_counter, master_cache):
+    """更新する項目の組み合わせごとに1つのUPDATE文で更新し、行ごとの結果を返すこと"""
+    master_cache.load_records([(STAGE_ID, "提案", True, 2), (3, "商談", True, 3)], [])
+    missing_id = uuid.uuid4()
+    rows = [
+        (0, {"id": uuid.UUID(int=1000), "amount": 2000}),
+        (1, {"id": uuid.UUID(int=1001), "amount": 3000, "title": None}),
+        (2, {"id": uuid.UUID(int=1002), "stage_id": 3, "title": "更新後"}),
+        (3, {"id": missing_id, "amount": 1}),
+        (4, {"id": uuid.UUID(int=1000), "stage_id": 99}),
+        (5, {"id": uuid.UUID(int=1001)}),
+    ]
+    query_counter.clear()
+
+    results = await update_opportunities_bulk(rows, bulk_session)
+
+    assert [r["status"] for r in results] == [
+        "updated",
+        "updated",
+        "updated",
+        "not_found",
+        "not_found",
+        "unchanged",
+    ]
+    assert results[4]["error"] == "Stage not found: 99"
+    # 存在確認1回、項目の組み合わせ（amount / stage_id・title）ごとのUPDATE各1回
+    assert _statements(query_counter) == ["SELECT", "UPDATE", "UPDATE"]
+    bulk_session.expire_all()
+    updated = {o.id: o for o in (await bulk_session.exec(select(Opportunity))).all()}
+    assert updated[uuid.UUID(int=1000)].amount == 2000
+    assert updated[uuid.UUID(int=1001)].title == "案件1"
+    opportunity = updated[uuid.UUID(int=1002)]
+    assert (opportunity.stage_id, opportunity.title) == (3, "更新後")
+
+
+@pytest.mark.asyncio
+async def test_update_opportunities_bulk_postgresql(master_cache):
+    """PostgreSQLでは UPDATE ... FROM (VALUES ...) の1つのSQL文で更新すること"""
+    opportunity_ids = [uuid.uuid4(), uuid.uuid4()]
+    session = MagicMock(spec=AsyncSession)
+    session.bind = MagicMock()
+    session.bind.dialect.name = "postgresql"
+    existing = MagicMock()
+    existing.scalars.return_value.all.return_value = opportunity_ids
+    session.execute = AsyncMock(side_effect=[existing, None])
+
+    results = await update_opportunities_bulk(
+        [
+            (0, {"id": opportunity_ids[0], "expected_close_date": date(2024, 8, 1)}),
+            (1, {"id": opportunity_ids[1], "expected_close_date": date(2024, 9, 1)}),
+        ],
+        session,
+    )
+
+    assert [r["status"] for r in results] == ["updated", "updated"]
+    statement = session.execute.await_args_list[1].args[0]
+    compiled = statement.compile(dialect=postgresql.dialect())
+    sql = " ".join(str(compiled).split())
+    assert "FROM (VALUES (%(param_1)s, %(param_2)s), (%(param_3)s, %(param_4)s))" in sql
+    assert "expected_close_date=CAST(v.expected_close_date AS DATE)" in sql
+    assert "opportunity.id = CAST(v.id AS UUID)" in sql
+    assert compiled.params["param_2"] == "2024-08-01"
+    # 更新日時はモデルの既定値と同じくタイムゾーンなしのUTCで記録すること
+    assert compiled.params["updated_at"].tzinfo is None
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_opportunities_bulk(bulk_session, query_counter):
+    """担当者とオポチュニティをそれぞれ1つのDELETE文で削除すること"""
+    missing_id = uuid.uuid4()
+    rows = [(0, uuid.UUID(int=1000)), (1, missing_id), (2, uuid.UUID(int=1002))]
+    query_counter.clear()
+
+    results = await delete_opportunities_bulk(rows, bulk_session)
+
+    assert [r["status"] for r in results] == ["deleted", "not_found", "deleted"]
+    # 存在確認・アクティビティログの確認と、担当者・オポチュニティの削除
+    assert _statements(query_counter) == ["SELECT", "SELECT", "DELETE", "DELETE"]
+    remaining = (await bulk_session.exec(select(Opportunity.id))).all()
+    assert remaining == [uuid.UUID(int=1001)]
+    assignees = (await bulk_session.exec(select(OpportunityUser.opportunity_id))).all()
+    assert assignees == [uuid.UUID(int=1001)]
+
+
+@pytest.mark.asyncio
+async def test_delete_opportunities_bulk_with_activity_logs(bulk_session):
+    """アクティビティログがあるオポチュニティは削除せず conflict とすること"""
+    await bulk_session.execute(text("PRAGMA foreign_keys=ON"))
+    bulk_session.add(ActivityType(id=1, name="訪問"))
+    bulk_session.add(
+        ActivityLog(
+            opportunity_id=uuid.UUID(int=1001),
+            user_id=uuid.UUID(int=1),
+            activity_type_id=1,
+            action_date=date(2024, 5, 1),
+            comment="訪問",
+        )
+    )
+    await bulk_session.commit()
+    rows = [(i, uuid.UUID(int=1000 + i)) for i in range(3)]
+
+    results = await delete_opportunities_bulk(rows, bulk_session)
+
+    assert [r["status"] for r in results] == ["deleted", "conflict", "deleted"]
+    assert results[1]["error"] == f"Opportunity has activity logs: {rows[1][1]}"
+    remaining = (await bulk_session.exec(select(Opportunity.id))).all()
+    assert remaining == [uuid.UUID(int=1001)]
+    assignees = (await bulk_session.exec(select(OpportunityUser.opportunity_id))).all()
+    assert assignees == [uuid.UUID(int=1001)]
 
-    # get メソッドのモックを更新
-    original_side_effect = mock_session.get.side_effect
 
-    mock_stage1 = MagicMock()
-    mock_stage1.id = 1
-    mock_stage1.name = "見込み"
+@pytest.mark.asyncio
+async def test_bulk_failed_transaction_marks_only_its_rows(bulk_session):
+    """トランザクションが失敗した範囲の行のみ error とし、他の範囲は反映すること"""
+    rows = [(i, uuid.UUID(int=1000 + i)) for i in range(3)]
+    error = OperationalError("SELECT", {}, Exception("database is locked"))
+
+    with (
+        patch("services.opportunity_service.BULK_TRANSACTION_SIZE", 2),
+        patch(
+            "services.opportunity_service.fetch_existing_ids",
+            AsyncMock(side_effect=[set(), error]),
+        ),
+    ):
+        results = await delete_opportunities_bulk(rows, bulk_session)
+
+    assert [r["status"] for r in results] == ["not_found", "not_found", "error"]
+    assert results[2]["error"] == "Failed to delete opportunity: OperationalError"
+    assert results[2]["id"] == uuid.UUID(int=1002)
+
+
+@pytest.fixture
+async def search_session(sqlite_session):
+    """検索用のオポチュニティを投入したセッション"""
+    customer = Customer(id=CUSTOMER_ID, name="株式会社ABC", industry="IT")
+    sqlite_session.add(customer)
+    sqlite_session.add(Stage(id=1, name="見込み", order_no=1))
+    sqlite_session.add(Stage(id=STAGE_ID, name="提案", order_no=2))
+    for title, amount, stage_id, close_date in (
+        ("Webシステム導入", 5000000, STAGE_ID, date(2024, 6, 1)),
+        ("クラウド移行", 8000000, 1, date(2024, 7, 10)),
+        ("保守契約", 1000000, 1, date(2024, 7, 10)),
+    ):
+        sqlite_session.add(
+            Opportunity(
+                customer_id=CUSTOMER_ID,
+                title=title,
+                amount=amount,
+                stage_id=stage_id,
+                expected_close_date=close_date,
+            )
+        )
+    await sqlite_session.commit()
+    return sqlite_session
 
-    def updated_get(model_cls, id_value):
-        if model_cls == Stage and id_value == 1:
-            return mock_stage1
-        return original_side_effect(model_cls, id_value)
 
-    mock_session.get.side_effect = updated_get
+@pytest.mark.asyncio
+async def test_search_opportunities(search_session, query_counter, master_cache):
+    """search_opportunities のテスト"""
+    await master_cache.reload(search_session)
+    query_counter.clear()
 
     # 関数の実行
     result = await search_opportunities(
@@ -288,12 +629,69 @@ async def test_search_opportunities(mock_session):
         stage_id=None,
         from_date=None,
         to_date=None,
-        session=mock_session,
+        session=search_session,
     )
 
     # 結果の検証
-    assert len(result) == 2
-    assert result[0]["title"] == "Webシステム導入"
-    assert result[1]["title"] == "クラウド移行"
-    assert result[0]["stage"]["name"] == "提案"
-    assert result[1]["stage"]["name"] == "見込み"
+    items = result["items"]
+    assert len(items) == 3
+    assert items[0]["title"] == "Webシステム導入"
+    assert items[0]["stage"]["name"] == "提案"
+    assert items[1]["stage"]["name"] == "見込み"
+    assert items[0]["customer"]["name"] == "株式会社ABC"
+    assert result["next_cursor"] is None
+    # 顧客は同一クエリで取得し、ステージはマスタキャッシュから取得
+    assert len(query_counter) == 1
+    assert master_cache.metrics()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_search_opportunities_stage_not_cached(search_session, master_cache):
+    """キャッシュにないステージはDBから取得し、案件を結果から除かないこと"""
+    await master_cache.reload(search_session)
+    # ORMを経由しない登録（他プロセスでの追加に相当）のため、キャッシュには反映されない
+    await search_session.execute(
+        insert(Stage.__table__).values(id=3, name="受注", order_no=3, is_active=True)
+    )
+    search_session.add(
+        Opportunity(
+            customer_id=CUSTOMER_ID,
+            title="追加案件",
+            amount=100,
+            stage_id=3,
+            expected_close_date=date(2024, 8, 1),
+        )
+    )
+    await search_session.commit()
+
+    result = await search_opportunities(session=search_session)
+
+    items = result["items"]
+    assert len(items) == 4
+    assert items[-1]["title"] == "追加案件"
+    assert items[-1]["stage"] == {"id": 3, "name": "受注"}
+
+
+@pytest.mark.asyncio
+async def test_search_opportunities_pagination(search_session):
+    """limit と cursor によるキーセットページングのテスト"""
+    first_page = await search_opportunities(limit=2, session=search_session)
+    assert len(first_page["items"]) == 2
+    assert first_page["next_cursor"] is not None
+
+    second_page = await search_opportunities(
+        limit=2, cursor=first_page["next_cursor"], session=search_session
+    )
+    assert len(second_page["items"]) == 1
+    assert second_page["next_cursor"] is None
+
+    # ページ間で重複・欠落がないこと
+    ids = [item["id"] for item in first_page["items"] + second_page["items"]]
+    assert len(set(ids)) == 3
+
+
+@pytest.mark.asyncio
+async def test_search_opportunities_invalid_cursor(search_session):
+    """不正なカーソルの search_opportunities のテスト"""
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        await search_opportunities(cursor="not-a-cursor", session=search_session)
@@ -3,11 +3,13 @@ SlackBotのテスト
 """
 
 import uuid
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from slack_sdk.errors import SlackApiError
 
-from slack.bot import SlackBot
+from slack.bot import SLACK_MAX_BLOCKS, SlackBot
+from slack.rate_limiter import SlackRateLimiter
 
 
 @pytest.fixture
@@ -127,3 +129,118 @@ async def test_build_notification_blocks(slack_bot):
     assert blocks[3]["elements"][0]["text"]["text"] == "案件を表示"
     # アクションボタンのvalueにオポチュニティIDが含まれていることを確認
     assert str(opportunity_data["opportunity_id"]) in blocks[3]["elements"][0]["value"]
+
+
+@pytest.mark.asyncio
+async def test_call_slack_api_ratelimited_gives_up(slack_bot):
+    """レート制限が続く場合はリトライ上限で ratelimited エラーを返すこと"""
+    response = MagicMock()
+    response.__getitem__.side_effect = {"error": "ratelimited"}.__getitem__
+    response.headers = {"Retry-After": "0"}
+    slack_bot.rate_limiter = SlackRateLimiter({"post_message": (6000, 5)})
+    slack_bot.client = MagicMock()
+    slack_bot.client.chat_postMessage = AsyncMock(
+        side_effect=SlackApiError("ratelimited", response)
+    )
+
+    result = await slack_bot._call_slack_api(
+        method="chat_postMessage", channel="U12345678", text="テスト"
+    )
+
+    assert result["ok"] is False
+    assert result["error"] == "ratelimited"
+    assert slack_bot.client.chat_postMessage.await_count == slack_bot.max_retries + 1
+
+
+@pytest.mark.asyncio
+async def test_send_digest_notification_paginates(slack_bot):
+    """ブロック数上限を超えるダイジェストはスレッド内のページに分割されること"""
+    opportunities = [
+        {
+            "opportunity_id": uuid.uuid4(),
+            "opportunity_title": f"テスト案件{i}",
+            "last_activity_date": "2025-01-01",
+        }
+        for i in range(40)
+    ]
+
+    with patch.object(
+        slack_bot, "send_message", wraps=slack_bot.send_message
+    ) as send_message:
+        result = await slack_bot.send_digest_notification(
+            user_slack_id="U12345678", message="ダイジェスト", opportunities=opportunities
+        )
+
+    calls = [c.kwargs for c in send_message.call_args_list]
+    assert len(calls) == 3  # 16件ずつ3ページ
+    assert all(len(c["blocks"]) <= SLACK_MAX_BLOCKS for c in calls)
+    assert calls[0]["thread_ts"] is None
+    # 2ページ目以降は1ページ目へのスレッド返信
+    assert calls[1]["thread_ts"] == result["ts"]
+    assert calls[2]["thread_ts"] == result["ts"]
+    assert calls[2]["blocks"][1]["elements"][0]["text"] == "3 / 3 ページ"
+
+    # すべての案件がいずれかのページに含まれる
+    values = [
+        element["value"]
+        for c in calls
+        for block in c["blocks"]
+        if block["type"] == "actions"
+        for element in block["elements"]
+    ]
+    assert values == [f"view_opportunity_{o['opportunity_id']}" for o in opportunities]
+
+
+@pytest.mark.asyncio
+async def test_send_digest_notification_later_page_failure(slack_bot):
+    """2ページ目以降の失敗は1ページ目の送信結果を返し、残りのページも送信すること"""
+    opportunities = [
+        {
+            "opportunity_id": uuid.uuid4(),
+            "opportunity_title": f"テスト案件{i}",
+            "last_activity_date": "2025-01-01",
+        }
+        for i in range(40)
+    ]
+    first = {"ok": True, "ts": "1609459200.000100"}
+    failed = {"ok": False, "error": "ratelimited"}
+
+    with patch.object(
+        slack_bot, "send_message", AsyncMock(side_effect=[first, failed, first])
+    ) as send_message:
+        result = await slack_bot.send_digest_notification(
+            user_slack_id="U12345678", message="ダイジェスト", opportunities=opportunities
+        )
+
+    assert result == first
+    assert send_message.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_user_info_cached():
+    """users.info の結果がキャッシュされ、破棄後は再取得されること"""
+    bot = SlackBot()
+    response = {"ok": True, "user": {"id": "U12345678", "real_name": "田中太郎"}}
+    bot._call_slack_api = AsyncMock(return_value=response)
+
+    assert await bot.get_user_info("U12345678") == response
+    assert await bot.get_user_info("U12345678") == response
+    bot._call_slack_api.assert_awaited_once()
+
+    bot.invalidate_user_info("U12345678")
+    await bot.get_user_info("U12345678")
+    assert bot._call_slack_api.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_user_info_does_not_cache_errors():
+    """取得に失敗した結果はキャッシュしないこと"""
+    bot = SlackBot()
+    bot._call_slack_api = AsyncMock(
+        return_value={"ok": False, "error": "user_not_found"}
+    )
+
+    await bot.get_user_info("U404")
+    await bot.get_user_info("U404")
+
+    assert bot._call_slack_api.await_count == 2
@@ -0,0 +1,126 @@
+"""
+Slackイベント重複排除サービスのテスト
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from services.slack_dedup_service import SlackEventDeduplicator, get_event_keys
+from services.slack_service import enqueue_slack_event
+from services.work_queue import QueueFullError
+
+
+def make_event(event_id="Ev001", channel="D123CHANNEL", ts="1609459200.000100"):
+    """テスト用のメッセージイベントを作成"""
+    return {
+        "type": "event_callback",
+        "event_id": event_id,
+        "event": {
+            "type": "message",
+            "user": "U123USER",
+            "text": "A社に訪問しました。",
+            "channel": channel,
+            "ts": ts,
+        },
+    }
+
+
+@pytest.fixture
+def db_session_scope(sqlite_engine):
+    """重複排除サービスのDBセッションをSQLiteに差し替える"""
+
+    @asynccontextmanager
+    async def session_scope():
+        async with AsyncSession(sqlite_engine, expire_on_commit=False) as session:
+            yield session
+
+    with patch("services.slack_dedup_service.session_scope", session_scope):
+        yield
+
+
+def test_get_event_keys():
+    """event_id と (channel, ts) からキーを作成すること"""
+    assert get_event_keys(make_event()) == [
+        "event:Ev001",
+        "message:D123CHANNEL:1609459200.000100",
+    ]
+    assert get_event_keys({"type": "event_callback", "event": {}}) == []
+
+
+@pytest.mark.asyncio
+async def test_is_duplicate_in_memory():
+    """同じevent_id、または同じ(channel, ts)のイベントを重複と判定すること"""
+    dedup = SlackEventDeduplicator(maxsize=100, ttl=60, use_db=False)
+
+    assert await dedup.is_duplicate(make_event()) is False
+    assert await dedup.is_duplicate(make_event()) is True
+    # event_idが異なっても同じメッセージなら重複
+    assert await dedup.is_duplicate(make_event(event_id="Ev002")) is True
+    # 別のメッセージは重複ではない
+    assert await dedup.is_duplicate(make_event("Ev003", ts="1609459201.0")) is False
+    assert dedup.metrics()["duplicates"] == 2
+
+
+@pytest.mark.asyncio
+async def test_is_duplicate_across_workers(db_session_scope):
+    """DBを使用する場合は別ワーカー（別インスタンス）が受信済みのイベントも重複と判定すること"""
+    worker_a = SlackEventDeduplicator(maxsize=100, ttl=60, use_db=True)
+    worker_b = SlackEventDeduplicator(maxsize=100, ttl=60, use_db=True)
+
+    assert await worker_a.is_duplicate(make_event()) is False
+    assert await worker_b.is_duplicate(make_event()) is True
+
+    # 受信記録を取り消すと再送を受け付ける
+    await worker_a.release(make_event())
+    assert await worker_a.is_duplicate(make_event()) is False
+
+
+@pytest.mark.asyncio
+async def test_is_duplicate_forgets_keys_when_claim_fails():
+    """DBへの登録が失敗した場合は受信記録を取り消し、再送を受け付けること"""
+    dedup = SlackEventDeduplicator(maxsize=100, ttl=60, use_db=True)
+    error = OperationalError("INSERT", {}, Exception("database is locked"))
+
+    with patch.object(dedup, "_claim_in_db", AsyncMock(side_effect=error)):
+        with pytest.raises(OperationalError):
+            await dedup.is_duplicate(make_event())
+
+    with patch.object(dedup, "_claim_in_db", AsyncMock(return_value=True)):
+        assert await dedup.is_duplicate(make_event()) is False
+    assert dedup.metrics()["duplicates"] == 0
+
+
+@pytest.mark.asyncio
+async def test_enqueue_slack_event_drops_duplicates():
+    """再送された重複イベントはキューに投入しないこと"""
+    dedup = SlackEventDeduplicator(maxsize=100, ttl=60, use_db=False)
+    with (
+        patch("services.slack_service.slack_event_deduplicator", dedup),
+        patch("services.slack_service.slack_event_queue") as mock_queue,
+    ):
+        mock_queue.put = AsyncMock()
+
+        assert await enqueue_slack_event(make_event()) is True
+        assert await enqueue_slack_event(make_event()) is False
+
+    mock_queue.put.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_slack_event_releases_when_queue_full():
+    """キューに投入できなかったイベントは再送を受け付けられるよう受信記録を取り消すこと"""
+    dedup = SlackEventDeduplicator(maxsize=100, ttl=60, use_db=False)
+    with (
+        patch("services.slack_service.slack_event_deduplicator", dedup),
+        patch("services.slack_service.slack_event_queue") as mock_queue,
+    ):
+        mock_queue.put = AsyncMock(side_effect=QueueFullError("full"))
+        with pytest.raises(QueueFullError):
+            await enqueue_slack_event(make_event())
+
+        mock_queue.put = AsyncMock()
+        assert await enqueue_slack_event(make_event()) is True
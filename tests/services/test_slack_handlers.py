@@ -3,8 +3,9 @@ Slackイベントハンドラーのテスト
 """
 
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -14,6 +15,9 @@ sys.path.insert(0, str(SRC_DIR))
 
 # flake8の警告を抑制：インポート順序の問題
 # isort: skip_file
+from agents.activity_matcher import ActivityTypeMatcher  # noqa: E402
+from agents.customer_matcher import CustomerNameIndex  # noqa: E402
+from agents.date_parser import RelativeDateParser  # noqa: E402
 from slack.handlers import SlackEventHandler, slack_event_handler  # noqa: E402
 
 
@@ -47,8 +51,10 @@ async def test_process_message_event():
 
 def test_extract_activity_info():
     """テキストから営業活動情報を適切に抽出できることを確認"""
-    # ハンドラーインスタンスを作成
-    handler = SlackEventHandler()
+    # アクティビティ種別マスタから構築したマッチャーを持つハンドラーインスタンスを作成
+    handler = SlackEventHandler(
+        activity_matcher=ActivityTypeMatcher([(1, "訪問"), (2, "電話")])
+    )
 
     # 訪問を含むテキスト
     visit_text = "今日はA社に訪問しました。"
@@ -57,6 +63,8 @@ def test_extract_activity_info():
     # 適切な活動タイプが抽出されることを確認
     assert visit_info is not None
     assert visit_info["type"] == "訪問"
+    assert visit_info["activity_type_id"] == 1
+    assert visit_info["matches"][0]["start"] == visit_text.index("訪問")
 
     # 電話を含むテキスト
     call_text = "B社に電話して見積もりの件を確認しました。"
@@ -72,3 +80,71 @@ def test_extract_activity_info():
 
     # 活動情報が抽出されないことを確認
     assert other_info is None
+
+
+def test_extract_activity_info_without_matcher():
+    """アクティビティ種別マスタが読み込まれていない場合は抽出しないことを確認"""
+    handler = SlackEventHandler()
+
+    assert handler._extract_activity_info("今日はA社に訪問しました。") is None
+
+
+def test_extract_activity_info_with_customer():
+    """顧客名の索引から顧客を抽出できることを確認"""
+    handler = SlackEventHandler(
+        activity_matcher=ActivityTypeMatcher([(1, "訪問")]),
+        customer_index=CustomerNameIndex([(10, "株式会社A"), (20, "B商事")]),
+    )
+
+    info = handler._extract_activity_info("今日はＡ社に訪問しました。")
+    assert info["customer"] == "株式会社A"
+    assert info["customer_id"] == "10"
+
+    # 複数の顧客が含まれる場合は特定せず、候補として返す
+    info = handler._extract_activity_info("A社とB商事に訪問しました。")
+    assert info["customer"] is None
+    assert [c["name"] for c in info["customer_candidates"]] == ["株式会社A", "B商事"]
+
+
+def test_extract_activity_info_with_date():
+    """投稿日時を基準に活動日を抽出できることを確認"""
+    handler = SlackEventHandler(
+        activity_matcher=ActivityTypeMatcher([(1, "訪問")]),
+        date_parser=RelativeDateParser("Asia/Tokyo"),
+    )
+    # 2024-05-16 01:00 JST
+    posted_at = datetime(2024, 5, 15, 16, 0, tzinfo=timezone.utc)
+
+    info = handler._extract_activity_info("昨日A社に訪問しました。", posted_at)
+    assert info["date"] == "2024-05-15"
+    assert info["date_phrase"] == "昨日"
+    assert info["date_needs_model"] is False
+
+
+@pytest.mark.asyncio
+async def test_process_message_event_uses_extractor():
+    """ルールベースの抽出結果と送信者・基準日・活動種別を抽出器に渡すことを確認"""
+    extractor = AsyncMock()
+    extractor.extract.return_value = None
+    handler = SlackEventHandler(
+        activity_matcher=ActivityTypeMatcher([(1, "訪問")]),
+        date_parser=RelativeDateParser("Asia/Tokyo"),
+        extractor=extractor,
+    )
+
+    # 2024-05-16 01:00 JST
+    await handler.process_message_event(
+        user_id="U1",
+        text="訪問しました",
+        channel="C1",
+        ts="1715788800.000100",
+        event_data={},
+    )
+
+    text, rule_info, context = extractor.extract.call_args.args
+    assert rule_info["type"] == "訪問"
+    assert context == {
+        "user_id": "U1",
+        "reference_date": "2024-05-16",
+        "activity_types": {"訪問": 1},
+    }
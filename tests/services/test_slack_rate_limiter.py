@@ -0,0 +1,93 @@
+"""
+Slack APIレート制限のテスト
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from slack.bot import SlackBot
+from slack.rate_limiter import SlackRateLimiter, TokenBucket
+
+# テスト用の高速なTier設定（1秒あたり100件）
+FAST_TIERS = {
+    "tier2": (6000, 2),
+    "tier3": (6000, 2),
+    "tier4": (6000, 2),
+    "post_message": (6000, 1),
+}
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_burst_then_wait():
+    """バースト許容数までは待機せず、それ以降は補充を待つこと"""
+    bucket = TokenBucket(rate_per_minute=6000, capacity=2)
+
+    assert await bucket.acquire() == pytest.approx(0, abs=0.005)
+    assert await bucket.acquire() == pytest.approx(0, abs=0.005)
+    waited = await bucket.acquire()
+
+    assert waited >= 0.005  # 1トークンの補充に0.01秒
+    metrics = bucket.metrics()
+    assert metrics["acquired"] == 3
+    assert metrics["max_wait_seconds"] == pytest.approx(waited, abs=0.001)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_queue_depth():
+    """トークン待ちの呼び出し数がメトリクスに反映されること"""
+    bucket = TokenBucket(rate_per_minute=600, capacity=1)
+    await bucket.acquire()
+
+    waiters = [asyncio.ensure_future(bucket.acquire()) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert bucket.metrics()["queue_depth"] == 3
+
+    await asyncio.gather(*waiters)
+    assert bucket.metrics()["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_pause():
+    """pause中はトークンが払い出されないこと"""
+    bucket = TokenBucket(rate_per_minute=6000, capacity=5)
+    bucket.pause(0.05)
+
+    waited = await bucket.acquire()
+
+    assert waited >= 0.04
+
+
+def test_rate_limiter_bucket_keys():
+    """chat.postMessageはチャンネルごと、その他はメソッドごとにバケットを共有すること"""
+    limiter = SlackRateLimiter(FAST_TIERS)
+
+    assert limiter._get_bucket("chat_postMessage", "U1") is not limiter._get_bucket(
+        "chat_postMessage", "U2"
+    )
+    assert limiter._get_bucket("users_info") is limiter._get_bucket("users_info")
+    assert limiter._get_bucket("users_info") is not limiter._get_bucket("users_list")
+    assert set(limiter.metrics()) == {
+        "post_message:U1",
+        "post_message:U2",
+        "tier4:users_info",
+        "tier2:users_list",
+    }
+
+
+@pytest.mark.asyncio
+async def test_call_slack_api_acquires_token():
+    """Slack API呼び出し前に送信先チャンネルのトークンを取得すること"""
+    bot = SlackBot()
+    bot.rate_limiter = MagicMock()
+    bot.rate_limiter.acquire = AsyncMock(return_value=0.0)
+    bot.client = MagicMock()
+    bot.client.chat_postMessage = AsyncMock(return_value={"ok": True})
+
+    result = await bot._call_slack_api(
+        method="chat_postMessage", channel="U12345678", text="テスト"
+    )
+
+    assert result == {"ok": True}
+    bot.rate_limiter.acquire.assert_awaited_once_with("chat_postMessage", "U12345678")
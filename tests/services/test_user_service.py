@@ -0,0 +1,85 @@
+"""
+ユーザー関連サービスのテスト
+"""
+
+import uuid
+
+import pytest
+
+from models.entity import User
+from services.user_service import SlackUserResolver, slack_user_resolver
+
+USER_ID_1 = uuid.uuid4()
+USER_ID_2 = uuid.uuid4()
+
+
+@pytest.fixture
+async def user_session(sqlite_session):
+    """ユーザーを投入したセッション"""
+    sqlite_session.add(User(id=USER_ID_1, name="田中太郎", email="a@x", slack_id="U1"))
+    sqlite_session.add(User(id=USER_ID_2, name="佐藤花子", email="b@x", slack_id="U2"))
+    await sqlite_session.commit()
+    return sqlite_session
+
+
+@pytest.fixture
+def resolver():
+    """テストごとに空のキャッシュから始めるリゾルバ"""
+    slack_user_resolver.invalidate()
+    yield slack_user_resolver
+    slack_user_resolver.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_warm_then_resolve_without_query(resolver, user_session, query_counter):
+    """起動時に1回のクエリで全ユーザーを読み込み、以降はクエリなしで解決できること"""
+    query_counter.clear()
+    assert await resolver.warm(user_session) == 2
+    assert len(query_counter) == 1
+
+    query_counter.clear()
+    user = await resolver.resolve_user("U1", user_session)
+
+    assert user == {"id": USER_ID_1, "name": "田中太郎", "slack_id": "U1"}
+    assert query_counter == []
+
+
+@pytest.mark.asyncio
+async def test_resolve_user_caches_misses(resolver, user_session, query_counter):
+    """DBに存在しないSlack IDも結果をキャッシュすること"""
+    query_counter.clear()
+
+    assert await resolver.resolve_user("U404", user_session) is None
+    assert await resolver.resolve_user("U404", user_session) is None
+
+    assert len(query_counter) == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_user_invalidated_on_user_changes(resolver, user_session):
+    """ユーザーの登録・Slack IDの変更でキャッシュが破棄されること"""
+    assert await resolver.resolve_user("U3", user_session) is None
+    assert (await resolver.resolve_user("U1", user_session))["name"] == "田中太郎"
+
+    # 未登録としてキャッシュされていたSlack IDのユーザーを登録
+    user_session.add(User(name="鈴木一郎", email="c@x", slack_id="U3"))
+    # Slack IDを変更
+    user = await user_session.get(User, USER_ID_1)
+    user.slack_id = "U1-new"
+    await user_session.commit()
+
+    assert (await resolver.resolve_user("U3", user_session))["name"] == "鈴木一郎"
+    assert await resolver.resolve_user("U1", user_session) is None
+    assert (await resolver.resolve_user("U1-new", user_session))["id"] == USER_ID_1
+
+
+@pytest.mark.asyncio
+async def test_resolver_evicts_by_size(user_session):
+    """キャッシュ件数の上限を超えた場合は古い結果から破棄すること"""
+    resolver = SlackUserResolver(maxsize=1, ttl=60)
+
+    await resolver.resolve_user("U1", user_session)
+    await resolver.resolve_user("U2", user_session)
+
+    assert "U1" not in resolver.users
+    assert "U2" in resolver.users
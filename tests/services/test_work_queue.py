@@ -0,0 +1,102 @@
+"""
+非同期ワークキューのテスト
+"""
+
+import asyncio
+
+import pytest
+
+from services.work_queue import QueueFullError, WorkQueue
+
+
+def make_queue(handler, workers=2, max_depth=10, put_timeout=0.05):
+    """テスト用のワークキューを作成"""
+    return WorkQueue(
+        name="test",
+        handler=handler,
+        workers=workers,
+        max_depth=max_depth,
+        put_timeout=put_timeout,
+    )
+
+
+@pytest.mark.asyncio
+async def test_work_queue_processes_items():
+    """投入した項目がワーカーで処理され、メトリクスに反映されること"""
+    processed = []
+
+    async def handler(item):
+        processed.append(item)
+
+    queue = make_queue(handler)
+    queue.start()
+    for i in range(5):
+        await queue.put(i)
+    await queue.stop(drain_timeout=1.0)
+
+    assert sorted(processed) == [0, 1, 2, 3, 4]
+    metrics = queue.metrics()
+    assert metrics["enqueued"] == 5
+    assert metrics["depth"] == 0
+    assert metrics["workers"] == 0
+    assert metrics["latency"]["total"]["count"] == 5
+    assert set(metrics["latency"]) == {"enqueue", "queue_wait", "process", "total"}
+
+
+@pytest.mark.asyncio
+async def test_work_queue_rejects_when_full():
+    """キューが満杯のまま待機時間を過ぎると QueueFullError になること"""
+    release = asyncio.Event()
+
+    async def handler(item):
+        await release.wait()
+
+    queue = make_queue(handler, workers=1, max_depth=1)
+    queue.start()
+    await queue.put("処理中")
+    await asyncio.sleep(0)  # ワーカーが1件目を取り出すのを待つ
+    await queue.put("待機中")
+
+    with pytest.raises(QueueFullError):
+        await queue.put("溢れ")
+
+    assert queue.metrics()["rejected"] == 1
+    release.set()
+    await queue.stop(drain_timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_work_queue_drains_on_stop():
+    """停止時にキューに残った項目を処理し終えること"""
+    processed = []
+
+    async def handler(item):
+        await asyncio.sleep(0.01)
+        processed.append(item)
+
+    queue = make_queue(handler, workers=1)
+    for i in range(3):
+        await queue.put(i)  # 未起動の場合は投入時に起動する
+
+    await queue.stop(drain_timeout=1.0)
+
+    assert processed == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_work_queue_handler_error_does_not_stop_worker():
+    """ハンドラの例外でワーカーが停止しないこと"""
+    processed = []
+
+    async def handler(item):
+        if item == "error":
+            raise RuntimeError("テスト例外")
+        processed.append(item)
+
+    queue = make_queue(handler, workers=1)
+    await queue.put("error")
+    await queue.put("ok")
+    await queue.stop(drain_timeout=1.0)
+
+    assert processed == ["ok"]
+    assert queue.metrics()["failed"] == 1
@@ -0,0 +1,93 @@
+"""
+テスト用のフェイクLLMサーバー
+
+OpenAI Chat Completions API（POST /v1/chat/completions）と同じ形式で応答する
+ローカルのHTTPサーバー。応答内容は responder で差し替えられる
+"""
+
+import asyncio
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+from aiohttp import web
+
+# 受信したメッセージから応答（JSONに変換できる値）を作成する関数
+Responder = Callable[[List[Dict[str, str]]], Any]
+
+
+class FakeLLMServer:
+    """OpenAI互換のフェイクLLMサーバー"""
+
+    def __init__(self, responder: Optional[Responder] = None, delay: float = 0.0):
+        """
+        サーバーの初期化
+
+        Args:
+            responder: 応答を作成する関数（省略時は営業活動でないと応答する）
+            delay: 応答までの待ち時間（秒）
+        """
+        self.responder = responder or (lambda messages: {"is_activity": False})
+        self.delay = delay
+        self.requests: List[Dict[str, Any]] = []
+        self.status = 200
+        self._runner: Optional[web.AppRunner] = None
+        self.url = ""
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        """チャット補完のリクエストに応答する"""
+        body = await request.json()
+        self.requests.append(body)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.status != 200:
+            return web.json_response(
+                {"error": {"message": "fake error", "type": "server_error"}},
+                status=self.status,
+            )
+
+        content = self.responder(body["messages"])
+        return web.json_response(
+            {
+                "id": f"chatcmpl-{len(self.requests)}",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {
+                            "role": "assistant",
+                            "content": json.dumps(content, ensure_ascii=False),
+                        },
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 10,
+                    "completion_tokens": 5,
+                    "total_tokens": 15,
+                },
+            }
+        )
+
+    async def start(self) -> str:
+        """
+        空いているポートでサーバーを起動する
+
+        Returns:
+            APIのベースURL
+        """
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}/v1"
+        return self.url
+
+    async def stop(self) -> None:
+        """サーバーを停止する"""
+        if self._runner is not None:
+            await self._runner.cleanup()